@@ -0,0 +1,125 @@
+# ABOUTME: On-disk cache for idempotent Store API GET responses
+# ABOUTME: Stores JSON bodies keyed by request URL with a TTL and HTTP validators
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Cached responses are served without contacting the API for this many seconds
+DEFAULT_TTL = 600.0
+
+
+class ResponseCache:
+    """File-backed cache of JSON response bodies"""
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_TTL):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory to store cache entries in (created on first write)
+            ttl: Seconds an entry is served without revalidation (default: 600)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key for a request
+
+        Args:
+            url: Absolute request URL
+            params: Optional query parameters
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        raw = url + "?" + json.dumps(params or {}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cache entry
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Entry with 'stored_at', 'etag', 'last_modified' and 'data' fields,
+            or None if missing or unreadable
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within its TTL"""
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build revalidation headers for a stale entry
+
+        Args:
+            entry: Cached entry, or None
+
+        Returns:
+            If-None-Match / If-Modified-Since headers for the entry's validators
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        Store a response body
+
+        Caching is best-effort: write failures are ignored.
+
+        Args:
+            key: Cache key from make_key()
+            data: JSON-serializable response body
+            etag: Optional ETag header from the response
+            last_modified: Optional Last-Modified header from the response
+        """
+        entry = {
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            tmp_path.replace(path)
+        except OSError:
+            pass
+
+    def invalidate(self, key: str):
+        """Remove an entry if present"""
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
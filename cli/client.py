@@ -1,22 +1,103 @@
 # ABOUTME: HTTP client for Store API communication
 # ABOUTME: Wraps httpx with error handling and response parsing
 
-import httpx
-from typing import List, Dict, Any, Optional
+import atexit
+from functools import lru_cache
+from urllib.parse import quote
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional
+from cli.cache import ResponseCache
+from cli.config import get_cache_dir
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpx (and the JSON parsers) are imported inside the functions that use them,
+# so importing this module - e.g. for type hints - stays cheap
+
+# Imports can take minutes server-side, but an unreachable API should fail fast
+TIMEOUT_SECONDS = 300.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+def _client_options() -> Dict[str, Any]:
+    """Build the timeout and connection pool options shared by all clients"""
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+        # Keep connections alive long enough for consecutive requests (concurrent
+        # imports, follow-up calls in scripted usage) to share sockets
+        "limits": httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=30.0
+        ),
+    }
+
+
+CODES_PATH = "/legal-texts/gesetze-im-internet/codes"
+CATALOG_PATH = "/legal-texts/gesetze-im-internet/catalog"
+
+
+@lru_cache(maxsize=128)
+def _code_path(code: str) -> str:
+    """Get the (already URL-quoted) path for a legal code"""
+    return f"/legal-texts/gesetze-im-internet/{quote(code, safe='')}"
+
+
+@lru_cache(maxsize=128)
+def _search_path(code: str) -> str:
+    """Get the (already URL-quoted) semantic search path for a legal code"""
+    return _code_path(code) + "/search"
+
+
+def _json(response: "httpx.Response") -> Any:
+    """Decode a JSON response body straight from bytes with orjson"""
+    import orjson
+
+    return orjson.loads(response.content)
+
+
+def _iter_json_items(response: "httpx.Response", prefix: str) -> Iterator[Any]:
+    """
+    Incrementally parse items out of a streamed JSON response
+
+    Args:
+        response: Streamed httpx response (body not yet read)
+        prefix: ijson prefix of the items to yield (e.g. 'results.item')
+
+    Yields:
+        Decoded items as soon as their bytes have arrived
+    """
+    import ijson
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    for chunk in response.iter_bytes():
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
 
 
 class LegalMCPClient:
     """HTTP client for communicating with the Legal MCP Store API"""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", use_cache: bool = True):
         """
         Initialize the HTTP client
 
         Args:
             base_url: Base URL for the Store API (default: http://localhost:8000)
+            use_cache: Cache code and catalog listings on disk (default: True)
         """
         self.base_url = base_url
-        self.client = httpx.Client(base_url=base_url, timeout=300.0)
+        cache_dir = get_cache_dir() if use_cache else None
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        import httpx
+
+        self.client = httpx.Client(base_url=base_url, http2=True, **_client_options())
 
     def close(self):
         """Close the HTTP client"""
@@ -30,6 +111,49 @@ class LegalMCPClient:
         """Context manager exit - closes the client"""
         self.close()
 
+    def _cached_get_json(self, path: str) -> Any:
+        """
+        GET a JSON resource, serving it from the response cache when possible
+
+        Fresh entries are returned without a request. Stale entries are
+        revalidated with If-None-Match / If-Modified-Since and reused on 304.
+
+        Args:
+            path: Request path relative to base_url
+
+        Returns:
+            Decoded JSON response body
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        if self.cache is None:
+            response = self.client.get(path)
+            response.raise_for_status()
+            return _json(response)
+
+        key = ResponseCache.make_key(self.base_url + path)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry["data"]
+
+        headers = ResponseCache.conditional_headers(entry)
+        response = self.client.get(path, headers=headers) if headers else self.client.get(path)
+
+        if entry is not None and response.status_code == 304:
+            data = entry["data"]
+        else:
+            response.raise_for_status()
+            data = _json(response)
+
+        self.cache.set(
+            key,
+            data,
+            etag=response.headers.get("ETag") or (entry or {}).get("etag"),
+            last_modified=response.headers.get("Last-Modified") or (entry or {}).get("last_modified")
+        )
+        return data
+
     def health_check(self) -> bool:
         """
         Check if the Store API is reachable
@@ -53,9 +177,7 @@ class LegalMCPClient:
         Raises:
             httpx.HTTPStatusError: If the API returns an error status
         """
-        response = self.client.get("/legal-texts/gesetze-im-internet/codes")
-        response.raise_for_status()
-        return response.json()["codes"]
+        return self._cached_get_json(CODES_PATH)["codes"]
 
     def list_catalog(self) -> Dict[str, Any]:
         """
@@ -67,9 +189,7 @@ class LegalMCPClient:
         Raises:
             httpx.HTTPStatusError: If the API returns an error status
         """
-        response = self.client.get("/legal-texts/gesetze-im-internet/catalog")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get_json(CATALOG_PATH)
 
     def import_code(self, code: str) -> Dict[str, Any]:
         """
@@ -84,9 +204,14 @@ class LegalMCPClient:
         Raises:
             httpx.HTTPStatusError: If the API returns an error status
         """
-        response = self.client.post(f"/legal-texts/gesetze-im-internet/{code}")
+        response = self.client.post(_code_path(code))
         response.raise_for_status()
-        return response.json()
+
+        # The set of imported codes just changed
+        if self.cache is not None:
+            self.cache.invalidate(ResponseCache.make_key(self.base_url + CODES_PATH))
+
+        return _json(response)
 
     def query_texts(
         self,
@@ -115,11 +240,82 @@ class LegalMCPClient:
             params["sub_section"] = sub_section
 
         response = self.client.get(
-            f"/legal-texts/gesetze-im-internet/{code}",
+            _code_path(code),
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json(response)
+
+    def batch_query(self, code: str, sections: List[str]) -> List[Dict[str, Any]]:
+        """
+        Query several sections of one legal code
+
+        The base request (URL, headers, timeout) is built once and only the
+        section parameter is merged in per call, all over the pooled connection.
+
+        Args:
+            code: Legal code identifier (e.g., 'bgb', 'stgb')
+            sections: Section filters (e.g., ['§ 1', '§ 2'])
+
+        Returns:
+            List of query results, in the same order as sections
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        import httpx
+
+        base_request = self.client.build_request("GET", _code_path(code))
+
+        results = []
+        for section in sections:
+            request = httpx.Request(
+                base_request.method,
+                base_request.url.copy_merge_params({"section": section}),
+                headers=base_request.headers,
+                extensions=base_request.extensions
+            )
+            response = self.client.send(request)
+            response.raise_for_status()
+            results.append(_json(response))
+        return results
+
+    def iter_query_results(
+        self,
+        code: str,
+        section: Optional[str] = None,
+        sub_section: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream query results one item at a time
+
+        Unlike query_texts, the response body is parsed incrementally, so a
+        full-code query never holds the whole payload in memory.
+
+        Args:
+            code: Legal code identifier (e.g., 'bgb', 'stgb')
+            section: Optional section filter (e.g., '§ 1')
+            sub_section: Optional sub-section filter (e.g., '1')
+
+        Yields:
+            Result items with 'section', 'sub_section' and 'text' fields
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        params = {}
+        if section:
+            params["section"] = section
+        if sub_section:
+            params["sub_section"] = sub_section
+
+        with self.client.stream(
+            "GET",
+            _code_path(code),
+            params=params
+        ) as response:
+            response.raise_for_status()
+            yield from _iter_json_items(response, "results.item")
 
     def search_texts(
         self,
@@ -150,8 +346,122 @@ class LegalMCPClient:
         }
 
         response = self.client.get(
-            f"/legal-texts/gesetze-im-internet/{code}/search",
+            _search_path(code),
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json(response)
+
+
+class AsyncLegalMCPClient:
+    """Async HTTP client for issuing many Store API searches concurrently"""
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        """
+        Initialize the async HTTP client
+
+        Concurrent requests are multiplexed over a single HTTP/2 connection
+        when the server supports it.
+
+        Args:
+            base_url: Base URL for the Store API (default: http://localhost:8000)
+        """
+        self.base_url = base_url
+        import httpx
+
+        self.client = httpx.AsyncClient(base_url=base_url, http2=True, **_client_options())
+
+    async def close(self):
+        """Close the HTTP client"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - closes the client"""
+        await self.close()
+
+    async def search_texts(
+        self,
+        code: str,
+        query: str,
+        limit: int = 10,
+        cutoff: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Perform semantic search on legal texts
+
+        Args:
+            code: Legal code identifier (e.g., 'bgb', 'stgb')
+            query: Search query text
+            limit: Maximum number of results (default: 10)
+            cutoff: Similarity cutoff threshold (default: 0.7)
+
+        Returns:
+            Dictionary with search results
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        params = {
+            "q": query,
+            "limit": limit,
+            "cutoff": cutoff
+        }
+
+        response = await self.client.get(_search_path(code), params=params)
+        response.raise_for_status()
+        return _json(response)
+
+    async def search_batch(
+        self,
+        searches: List[Dict[str, str]],
+        limit: int = 10,
+        cutoff: float = 0.7
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several semantic searches concurrently
+
+        Args:
+            searches: Search specs, each with 'code' and 'query' fields
+            limit: Maximum number of results per search (default: 10)
+            cutoff: Similarity cutoff threshold (default: 0.7)
+
+        Returns:
+            List of search results, in the same order as searches
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status for any search
+        """
+        import asyncio
+
+        return await asyncio.gather(*(
+            self.search_texts(search["code"], search["query"], limit, cutoff)
+            for search in searches
+        ))
+
+
+_clients: Dict[str, LegalMCPClient] = {}
+
+
+def get_client(base_url: str = "http://localhost:8000") -> LegalMCPClient:
+    """
+    Get a shared client for the given base URL
+
+    Clients are created lazily and reused for the lifetime of the process so
+    long-running scripts keep their pooled connections. They are closed at exit.
+
+    Args:
+        base_url: Base URL for the Store API (default: http://localhost:8000)
+
+    Returns:
+        The shared LegalMCPClient for base_url
+    """
+    client = _clients.get(base_url)
+    if client is None:
+        client = LegalMCPClient(base_url)
+        _clients[base_url] = client
+        atexit.register(client.close)
+    return client
@@ -2,14 +2,47 @@
 # ABOUTME: Handles importing legal codes from gesetze-im-internet.de
 
 import typer
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 import httpx
+from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 from cli.client import LegalMCPClient
 from cli.config import get_api_url
-from cli.output import print_json, console
+from cli.output import print_json, print_api_unreachable, console
 
 app = typer.Typer()
 
+# Upper bound on concurrent imports (each one is a long-running server-side job)
+MAX_PARALLEL_IMPORTS = 8
+
+
+def _report_failure(code: str, error: Exception, json_output: bool):
+    """
+    Print a failed import in the requested output format
+
+    Args:
+        code: Legal code that failed to import
+        error: Exception raised by the import request
+        json_output: Whether to output as JSON
+    """
+    if json_output:
+        print_json({"code": code, "success": False, "error": str(error)})
+        return
+
+    if isinstance(error, httpx.HTTPStatusError):
+        # Validation errors (400, 404) vs. network/server errors (500, etc.)
+        if error.response.status_code in [400, 404]:
+            console.print(f"[red]✗[/red] Invalid code: {code}")
+        else:
+            console.print(f"[red]✗[/red] Server error importing {code}")
+        error_detail = error.response.json().get('detail', str(error))
+        console.print(f"[yellow]Error: {error_detail}[/yellow]")
+        if error.response.status_code not in [400, 404]:
+            console.print("[yellow]Make sure Ollama is running and the database is accessible[/yellow]")
+    else:
+        # Other errors (network timeouts, connection errors)
+        console.print(f"[red]✗[/red] Failed to import {code}: {error}")
+
 
 @app.command()
 def import_codes(
@@ -21,55 +54,52 @@ def import_codes(
     url = api_url or get_api_url()
 
     with LegalMCPClient(url) as client:
-        # Health check - fail gracefully if Store API is not running
-        if not client.health_check():
-            console.print(f"[red]Error: Store API not reachable at {url}[/red]")
-            console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
-            raise typer.Exit(1)
-
-        results = []
+        results = {}
 
-        for code in codes:
-            try:
-                with console.status(f"[cyan]Importing {code}...", spinner="dots"):
-                    result = client.import_code(code)
-                    results.append({"code": code, "success": True, "result": result})
+        # Imports run concurrently over the client's pooled connections;
+        # results are collected here on the main thread as they complete
+        executor = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_IMPORTS, len(codes)))
+        try:
+            # One live display for the whole run, advanced as imports complete
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[cyan]{task.description}"),
+                MofNCompleteColumn(),
+                console=console,
+                transient=True,
+                # Imports take seconds to minutes each; no need for 10 redraws/s
+                refresh_per_second=4
+            ) as progress:
+                task = progress.add_task("Importing...", total=len(codes))
+                futures = {executor.submit(client.import_code, code): code for code in codes}
 
-                if not json_output:
-                    console.print(f"[green]✓[/green] Imported {code}")
+                for future in as_completed(futures):
+                    code = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Fail fast - don't start imports that are still queued
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                            # No pre-flight health check - a refused connection means the API is down
+                            print_api_unreachable(url)
+                        else:
+                            _report_failure(code, e, json_output)
+                        raise typer.Exit(1)
 
-            except httpx.HTTPStatusError as e:
-                # Validation errors (400, 404) - fail fast
-                if e.response.status_code in [400, 404]:
-                    if not json_output:
-                        console.print(f"[red]✗[/red] Invalid code: {code}")
-                        error_detail = e.response.json().get('detail', str(e))
-                        console.print(f"[yellow]Error: {error_detail}[/yellow]")
-                    if json_output:
-                        print_json({"code": code, "success": False, "error": str(e)})
-                    raise typer.Exit(1)
+                    results[code] = {"code": code, "success": True, "result": result}
+                    progress.advance(task)
 
-                # Network/server errors (500, etc.)
-                else:
                     if not json_output:
-                        console.print(f"[red]✗[/red] Server error importing {code}")
-                        error_detail = e.response.json().get('detail', str(e))
-                        console.print(f"[yellow]Error: {error_detail}[/yellow]")
-                        console.print("[yellow]Make sure Ollama is running and the database is accessible[/yellow]")
-                    if json_output:
-                        print_json({"code": code, "success": False, "error": str(e)})
-                    raise typer.Exit(1)
-
-            except Exception as e:
-                # Other errors (network timeouts, connection errors)
-                if not json_output:
-                    console.print(f"[red]✗[/red] Failed to import {code}: {e}")
-                if json_output:
-                    print_json({"code": code, "success": False, "error": str(e)})
-                raise typer.Exit(1)
+                        console.print(f"[green]✓[/green] Imported {code}")
+        finally:
+            # Imports already running use the client's connections; let them
+            # finish before the client is closed on leaving the with block
+            executor.shutdown(wait=True, cancel_futures=True)
 
         if json_output:
-            print_json(results)
+            # Report in the order the codes were requested, not completion order
+            print_json([results[code] for code in codes])
         else:
             # Print summary
             console.print(f"\n[bold green]Success:[/bold green] Imported {len(codes)} code(s)")
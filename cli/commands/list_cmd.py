@@ -2,9 +2,10 @@
 # ABOUTME: Lists imported codes or available catalog
 
 import typer
+import httpx
 from cli.client import LegalMCPClient
 from cli.config import get_api_url
-from cli.output import print_codes_list, print_catalog, print_json, console
+from cli.output import print_codes_list, print_catalog, print_json, print_api_unreachable, console
 
 app = typer.Typer()
 
@@ -18,12 +19,6 @@ def list_codes(
     url = api_url or get_api_url()
 
     with LegalMCPClient(url) as client:
-        # Health check - fail gracefully if Store API is not running
-        if not client.health_check():
-            console.print(f"[red]Error: Store API not reachable at {url}[/red]")
-            console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
-            raise typer.Exit(1)
-
         try:
             codes = client.list_codes()
 
@@ -32,6 +27,10 @@ def list_codes(
             else:
                 print_codes_list(codes)
 
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # No pre-flight health check - a refused connection means the API is down
+            print_api_unreachable(url)
+            raise typer.Exit(1)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
@@ -46,12 +45,6 @@ def list_catalog(
     url = api_url or get_api_url()
 
     with LegalMCPClient(url) as client:
-        # Health check - fail gracefully if Store API is not running
-        if not client.health_check():
-            console.print(f"[red]Error: Store API not reachable at {url}[/red]")
-            console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
-            raise typer.Exit(1)
-
         try:
             catalog = client.list_catalog()
 
@@ -60,6 +53,10 @@ def list_catalog(
             else:
                 print_catalog(catalog)
 
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # No pre-flight health check - a refused connection means the API is down
+            print_api_unreachable(url)
+            raise typer.Exit(1)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
@@ -2,10 +2,11 @@
 # ABOUTME: Retrieves legal texts by code, section, and sub-section
 
 import typer
+import httpx
 from typing import Optional
 from cli.client import LegalMCPClient
 from cli.config import get_api_url
-from cli.output import print_query_results, print_json, console
+from cli.output import print_query_results, print_json, print_api_unreachable, console
 
 app = typer.Typer()
 
@@ -22,20 +23,17 @@ def query_texts(
     url = api_url or get_api_url()
 
     with LegalMCPClient(url) as client:
-        # Health check - fail gracefully if Store API is not running
-        if not client.health_check():
-            console.print(f"[red]Error: Store API not reachable at {url}[/red]")
-            console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
-            raise typer.Exit(1)
-
         try:
-            results = client.query_texts(code, section, sub_section)
-
             if json_output:
-                print_json(results)
+                print_json(client.query_texts(code, section, sub_section))
             else:
-                print_query_results(results)
+                # Stream rows into the table so full texts are never all held in memory
+                print_query_results({"results": client.iter_query_results(code, section, sub_section)})
 
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # No pre-flight health check - a refused connection means the API is down
+            print_api_unreachable(url)
+            raise typer.Exit(1)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
@@ -1,33 +1,67 @@
 # ABOUTME: Search command implementation
 # ABOUTME: Performs semantic search on legal texts
 
+import asyncio
+import json
 import typer
-from cli.client import LegalMCPClient
+import httpx
+from pathlib import Path
+from typing import Optional
+from cli.client import AsyncLegalMCPClient, LegalMCPClient
 from cli.config import get_api_url
-from cli.output import print_search_results, print_json, console
+from cli.output import print_search_results, print_json, print_api_unreachable, console
 
 app = typer.Typer()
 
 
+async def _run_batch(url: str, searches: list, limit: int, cutoff: float) -> list:
+    """Run all searches from a batch file concurrently"""
+    async with AsyncLegalMCPClient(url) as client:
+        return await client.search_batch(searches, limit, cutoff)
+
+
 @app.command()
 def search_texts(
-    code: str = typer.Argument(..., help="Legal code (e.g., bgb)"),
-    query: str = typer.Argument(..., help="Search query"),
+    code: Optional[str] = typer.Argument(None, help="Legal code (e.g., bgb)"),
+    query: Optional[str] = typer.Argument(None, help="Search query"),
     limit: int = typer.Option(10, "--limit", "-l", help="Maximum results (1-100)"),
     cutoff: float = typer.Option(0.7, "--cutoff", "-c", help="Similarity cutoff (0-2)"),
+    batch_file: Optional[Path] = typer.Option(
+        None,
+        "--batch-file",
+        help='JSON file with a list of {"code": ..., "query": ...} searches to run concurrently'
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     api_url: str = typer.Option(None, "--api-url", envvar="LEGAL_API_BASE_URL")
 ):
     """Perform semantic search on legal texts"""
     url = api_url or get_api_url()
 
-    with LegalMCPClient(url) as client:
-        # Health check - fail gracefully if Store API is not running
-        if not client.health_check():
-            console.print(f"[red]Error: Store API not reachable at {url}[/red]")
-            console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
+    if batch_file is None and (code is None or query is None):
+        console.print("[red]Error:[/red] CODE and QUERY are required unless --batch-file is given")
+        raise typer.Exit(1)
+
+    if batch_file is not None:
+        try:
+            searches = json.loads(batch_file.read_text(encoding="utf-8"))
+            all_results = asyncio.run(_run_batch(url, searches, limit, cutoff))
+
+            if json_output:
+                print_json(all_results)
+            else:
+                for results in all_results:
+                    print_search_results(results)
+
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # No pre-flight health check - a refused connection means the API is down
+            print_api_unreachable(url)
             raise typer.Exit(1)
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        return
 
+    with LegalMCPClient(url) as client:
         try:
             results = client.search_texts(code, query, limit, cutoff)
 
@@ -36,6 +70,10 @@ def search_texts(
             else:
                 print_search_results(results)
 
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # No pre-flight health check - a refused connection means the API is down
+            print_api_unreachable(url)
+            raise typer.Exit(1)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
@@ -1,11 +1,33 @@
 # ABOUTME: Configuration management for CLI
-# ABOUTME: Handles API URL from environment or default
+# ABOUTME: Handles API URL and cache directory from environment or default
 
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
+DEFAULT_API_URL = "http://localhost:8000"
 
+
+@lru_cache(maxsize=1)
 def get_api_url() -> str:
-    """Get Store API URL from environment or use default"""
-    url = os.getenv("LEGAL_API_BASE_URL", "http://localhost:8000")
-    # Handle empty string case - fall back to default
-    return url if url else "http://localhost:8000"
+    """
+    Get Store API URL from environment or use default
+
+    The result is cached for the life of the process; call
+    get_api_url.cache_clear() after changing LEGAL_API_BASE_URL.
+    """
+    # Empty string falls back to the default as well
+    return os.environ.get("LEGAL_API_BASE_URL") or DEFAULT_API_URL
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Get response cache directory from environment or use default
+
+    Setting LEGAL_MCP_CACHE_DIR to an empty string disables caching.
+    """
+    cache_dir = os.getenv("LEGAL_MCP_CACHE_DIR")
+    if cache_dir is None:
+        return Path.home() / ".cache" / "legal-mcp"
+    return Path(cache_dir) if cache_dir else None
@@ -1,25 +1,52 @@
 # ABOUTME: CLI entry point and main application setup
 # ABOUTME: Defines Typer app and registers command groups
 
+import importlib
+from typing import List, Optional
+
+import click
 import typer
-from cli.commands import list_cmd
-from cli.commands.import_cmd import import_codes
-from cli.commands.query_cmd import query_texts
-from cli.commands.search_cmd import search_texts
+from typer.core import TyperGroup
+
+# Command name -> (module, help). Modules are only imported when their command
+# runs (or help is rendered), so e.g. `legal-mcp query` never loads the others.
+LAZY_COMMANDS = {
+    "list": ("cli.commands.list_cmd", "List codes"),
+    "import": ("cli.commands.import_cmd", "Import one or more legal codes"),
+    "query": ("cli.commands.query_cmd", "Query legal texts by code, section, and sub-section"),
+    "search": ("cli.commands.search_cmd", "Perform semantic search on legal texts"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that resolves sub-commands from LAZY_COMMANDS on demand"""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(LAZY_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in LAZY_COMMANDS:
+            return None
+
+        module_name, help_text = LAZY_COMMANDS[cmd_name]
+        module = importlib.import_module(module_name)
+        command = typer.main.get_command(module.app)
+        command.name = cmd_name
+        command.help = help_text
+        return command
+
 
 app = typer.Typer(
     name="legal-mcp",
     help="CLI for managing German legal texts",
-    no_args_is_help=True
+    no_args_is_help=True,
+    cls=LazyCommandGroup
 )
 
-# Register command groups
-app.add_typer(list_cmd.app, name="list", help="List codes")
 
-# Register direct commands
-app.command(name="import", help="Import one or more legal codes")(import_codes)
-app.command(name="query", help="Query legal texts by code, section, and sub-section")(query_texts)
-app.command(name="search", help="Perform semantic search on legal texts")(search_texts)
+@app.callback()
+def main():
+    """CLI for managing German legal texts"""
 
 
 if __name__ == "__main__":
@@ -1,13 +1,47 @@
 # ABOUTME: Output formatting utilities
 # ABOUTME: Handles table rendering and JSON output
 
-import json
-from typing import Any, List
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Iterable, List, Tuple
+import orjson
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
 console = Console()
 
+# Parsed once; cells are built as Text so Rich skips per-cell markup/style parsing
+_CYAN = Style(color="cyan")
+_YELLOW = Style(color="yellow")
+_GREEN = Style(color="green")
+_WHITE = Style(color="white")
+
+# Fetch all row fields in one C-level call per result item
+_query_row = itemgetter("section", "sub_section", "text")
+_search_row = itemgetter("section", "sub_section", "similarity_score", "text")
+
+
+def _truncate(text: str, width: int) -> str:
+    """Truncate text to width characters for table display"""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _write_tsv(rows: Iterable[Tuple[str, ...]]):
+    """
+    Write rows as tab-separated lines, bypassing Rich
+
+    Used when stdout is not a terminal (piped to another tool), where a
+    colored table is neither visible nor parseable.
+
+    Args:
+        rows: Row tuples of strings
+    """
+    write = console.file.write
+    for row in rows:
+        write("\t".join(" ".join(field.split()) for field in row) + "\n")
+
 
 def print_json(data: Any):
     """
@@ -16,7 +50,32 @@ def print_json(data: Any):
     Args:
         data: Data to output as JSON (will be serialized)
     """
-    console.print_json(json.dumps(data))
+    if console.is_terminal:
+        # Let Rich serialize once instead of dumping to a string it re-parses
+        console.print_json(data=data)
+        return
+
+    # Piped output isn't colorized, so skip Rich's pretty-printer entirely
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    out = console.file
+    out.flush()
+    buffer = getattr(out, "buffer", None)
+    if buffer is not None:
+        buffer.write(payload)
+        buffer.flush()
+    else:
+        out.write(payload.decode("utf-8"))
+
+
+def print_api_unreachable(url: str):
+    """
+    Print the error shown when the Store API cannot be reached
+
+    Args:
+        url: Store API URL that was tried
+    """
+    console.print(f"[red]Error: Store API not reachable at {url}[/red]")
+    console.print("[yellow]Make sure the Store API is running: docker-compose up -d[/yellow]")
 
 
 def print_codes_list(codes: List[str]):
@@ -26,6 +85,10 @@ def print_codes_list(codes: List[str]):
     Args:
         codes: List of legal code identifiers
     """
+    if not codes:
+        console.print("[yellow]No imported codes (Count: 0)[/yellow]")
+        return
+
     table = Table(title=f"Imported Codes (Count: {len(codes)})")
     table.add_column("Code", style="cyan")
 
@@ -43,6 +106,10 @@ def print_catalog(catalog: dict):
         catalog: Catalog response with 'count' and 'entries' fields
     """
     entries = catalog.get("entries", [])
+    if not entries:
+        console.print(f"[yellow]No legal codes available (Count: {catalog['count']})[/yellow]")
+        return
+
     table = Table(title=f"Available Legal Codes (Count: {catalog['count']})")
     table.add_column("Code", style="cyan")
     table.add_column("Title", style="white")
@@ -57,21 +124,45 @@ def print_query_results(results: dict):
     """
     Print query results as table with truncated text
 
+    When stdout is not a terminal, rows are written as tab-separated lines.
+
     Args:
-        results: Query response with 'count' and 'results' fields
+        results: Query response with 'count' and 'results' fields. 'results'
+            may be a lazy iterable, in which case 'count' can be omitted.
     """
     items = results.get("results", [])
-    table = Table(title=f"Query Results (Count: {results['count']})")
-    table.add_column("Section", style="cyan")
-    table.add_column("Sub-Section", style="yellow")
-    table.add_column("Text", style="white", no_wrap=False)
 
-    for item in items:
+    if not console.is_terminal:
+        _write_tsv(
+            (section, sub_section, _truncate(text, 100))
+            for section, sub_section, text in map(_query_row, items)
+        )
+        return
+
+    # Peek at the first row so empty (possibly lazy) results skip the table
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        console.print("[yellow]No query results (Count: 0)[/yellow]")
+        return
+    items = chain((first,), items)
+
+    table = Table()
+    table.add_column("Section")
+    table.add_column("Sub-Section")
+    table.add_column("Text", no_wrap=False)
+
+    add_row = table.add_row
+    for section, sub_section, text in map(_query_row, items):
         # Truncate text to 100 characters for table display
-        text = item["text"]
-        display_text = text[:100] + "..." if len(text) > 100 else text
-        table.add_row(item["section"], item["sub_section"], display_text)
+        add_row(
+            Text(section, style=_CYAN),
+            Text(sub_section, style=_YELLOW),
+            Text(_truncate(text, 100), style=_WHITE)
+        )
 
+    # Count is only known up front for fully loaded results
+    table.title = f"Query Results (Count: {results.get('count', table.row_count)})"
     console.print(table)
 
 
@@ -79,27 +170,40 @@ def print_search_results(results: dict):
     """
     Print search results as table with similarity scores and truncated text
 
+    When stdout is not a terminal, rows are written as tab-separated lines.
+
     Args:
         results: Search response with 'query', 'code', 'count', and 'results' fields
     """
     items = results.get("results", [])
+
+    if not console.is_terminal:
+        _write_tsv(
+            (section, sub_section, f"{score:.3f}", _truncate(text, 80))
+            for section, sub_section, score, text in map(_search_row, items)
+        )
+        return
+
+    if not items:
+        console.print(f"[yellow]No search results for '{results['query']}' in {results['code']} (Count: 0)[/yellow]")
+        return
+
     table = Table(
         title=f"Search Results for '{results['query']}' in {results['code']} (Count: {results['count']})"
     )
-    table.add_column("Section", style="cyan")
-    table.add_column("Sub-Section", style="yellow")
-    table.add_column("Similarity", style="green")
-    table.add_column("Text", style="white", no_wrap=False)
+    table.add_column("Section")
+    table.add_column("Sub-Section")
+    table.add_column("Similarity")
+    table.add_column("Text", no_wrap=False)
 
-    for item in items:
+    add_row = table.add_row
+    for section, sub_section, score, text in map(_search_row, items):
         # Truncate text to 80 characters for table display
-        text = item["text"]
-        display_text = text[:80] + "..." if len(text) > 80 else text
-        table.add_row(
-            item["section"],
-            item["sub_section"],
-            f"{item['similarity_score']:.3f}",
-            display_text
+        add_row(
+            Text(section, style=_CYAN),
+            Text(sub_section, style=_YELLOW),
+            Text(f"{score:.3f}", style=_GREEN),
+            Text(_truncate(text, 80), style=_WHITE)
         )
 
     console.print(table)
@@ -7,12 +7,19 @@ This server integrates with the legal-mcp store API to provide
 semantic search and retrieval capabilities for legal documents.
 """
 
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+import asyncio
+import functools
 import httpx
 import logging
+import orjson
 import os
+import random
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +28,14 @@ logger = logging.getLogger(__name__)
 # Configuration for the legal texts API
 API_BASE_URL = os.getenv("LEGAL_API_BASE_URL", "http://legal-mcp-store-api:8000")
 
+# Store API paths, relative to API_BASE_URL
+CODES_PATH = "/legal-texts/gesetze-im-internet/codes"
+CATALOG_PATH = "/legal-texts/gesetze-im-internet/catalog"
+BATCH_SEARCH_PATH = "/legal-texts/gesetze-im-internet/search"
+CODE_PATH = "/legal-texts/gesetze-im-internet/{code}"
+SEARCH_PATH = "/legal-texts/gesetze-im-internet/{code}/search"
+COUNT_PATH = "/legal-texts/gesetze-im-internet/{code}/count"
+
 # GitHub OAuth Configuration
 # Required environment variables for OAuth:
 # - MCP_GITHUB_CLIENT_ID: GitHub OAuth App Client ID
@@ -35,7 +50,7 @@ def create_auth_provider():
     
     if all([client_id, client_secret, base_url]):
         from fastmcp.server.auth.providers.github import GitHubProvider
-        logger.info(f"GitHub OAuth ENABLED - Base URL: {base_url}")
+        logger.info("GitHub OAuth ENABLED - Base URL: %s", base_url)
         return GitHubProvider(
             client_id=client_id,
             client_secret=client_secret,
@@ -46,6 +61,154 @@ def create_auth_provider():
         logger.warning("Set MCP_GITHUB_CLIENT_ID, MCP_GITHUB_CLIENT_SECRET, and MCP_BASE_URL to enable OAuth")
         return None
 
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body straight from bytes with orjson."""
+    return orjson.loads(response.content)
+
+
+# Errors worth retrying: the connection dropped or misbehaved mid-request.
+# Failed connection attempts are retried by the pooled transport itself
+# (see retries= in get_client), so they are not retried again here.
+RETRYABLE_ERRORS = (httpx.ReadError, httpx.RemoteProtocolError)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.1
+RETRY_MAX_DELAY_SECONDS = 1.0
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport that retries idempotent requests on transient connection errors."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            try:
+                return await self._transport.handle_async_request(request)
+            except RETRYABLE_ERRORS as e:
+                # Error statuses are responses, not exceptions, so 4xx/5xx are
+                # never retried; non-idempotent requests are never replayed
+                if request.method not in ("GET", "HEAD") or attempt >= RETRY_ATTEMPTS:
+                    raise
+                # Exponential backoff with full jitter
+                delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+                logger.warning("Retrying %s %s after %r", request.method, request.url, e)
+                await asyncio.sleep(random.uniform(0, delay))
+                attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Shared HTTP client for the store API, created on first use so every tool
+# call reuses pooled keep-alive connections instead of opening new ones
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get the shared store API client, creating it if needed."""
+    global _client
+    if _client is None or _client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            # Multiplexes concurrent searches over one connection when the
+            # store is reached over TLS (e.g. behind a proxy); plain http://
+            # URLs keep using HTTP/1.1 since httpx doesn't do h2c upgrades
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            # Retries failed connection attempts for any method
+            retries=2,
+        )
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=30.0,
+            transport=RetryTransport(transport),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared store API client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+# Parsed responses for rarely-changing listings: path -> (expiry, data).
+# One lock per path coalesces concurrent misses into a single request.
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+_cache_locks: Dict[str, asyncio.Lock] = {}
+
+CATALOG_TTL_SECONDS = 300.0
+CODES_TTL_SECONDS = 60.0
+
+
+async def _cached_get(
+    path: str, ttl: float, parse: Callable[[Any], Any] = lambda data: data
+) -> Any:
+    """GET a store API path and return parse(JSON), cached for ttl seconds."""
+    entry = _response_cache.get(path)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _cache_locks.setdefault(path, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed the entry while we waited
+        entry = _response_cache.get(path)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        client = await get_client()
+        response = await client.get(path)
+        response.raise_for_status()
+        data = parse(_json(response))
+        _response_cache[path] = (time.monotonic() + ttl, data)
+        return data
+
+
+class ImportedCodes(NamedTuple):
+    """Imported code identifiers plus a lowercase set for membership checks"""
+    codes: List[str]
+    lowered: FrozenSet[str]
+
+
+def _index_codes(data: dict) -> ImportedCodes:
+    codes = data.get("codes", [])
+    return ImportedCodes(codes, frozenset(c.lower() for c in codes))
+
+
+def _index_catalog(data: dict) -> Dict[str, str]:
+    titles = {}
+    for entry in data.get("entries", []):
+        # Keep the first entry per code, matching a front-to-back scan
+        titles.setdefault(entry["code"].lower(), entry.get("title", ""))
+    return titles
+
+
+async def get_imported_codes() -> ImportedCodes:
+    """Get the (cached) imported codes."""
+    return await _cached_get(
+        CODES_PATH, CODES_TTL_SECONDS, _index_codes
+    )
+
+
+async def get_catalog_titles() -> Dict[str, str]:
+    """Get the (cached) catalog titles keyed by lowercase code."""
+    return await _cached_get(
+        CATALOG_PATH, CATALOG_TTL_SECONDS, _index_catalog
+    )
+
+
 # Create auth provider
 auth_provider = create_auth_provider()
 
@@ -54,9 +217,33 @@ mcp = FastMCP(
     name="Legal MCP Server",
     include_fastmcp_meta=True,
     auth=auth_provider,
+    lifespan=lifespan,
 )
 
 
+def tool_errors(action: str, failure: str):
+    """
+    Wrap a tool so that errors are logged and surfaced as RuntimeError.
+
+    Args:
+        action: Phrase describing the tool's work (e.g. 'searching legal texts')
+        failure: Phrase used for HTTP failures (e.g. 'search legal texts')
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except httpx.HTTPError as e:
+                logger.error("HTTP error %s: %s", action, e)
+                raise RuntimeError(f"Failed to {failure}: {str(e)}")
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                raise RuntimeError(f"Error {action}: {str(e)}")
+        return wrapper
+    return decorator
+
+
 class LegalTextResult(BaseModel):
     """Result from legal text query"""
     text: str
@@ -66,7 +253,74 @@ class LegalTextResult(BaseModel):
     similarity_score: Optional[float] = None
 
 
+# Exact-match cache of per-code search results: key -> (expiry, results),
+# kept in LRU order so the least recently used entry is evicted first
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 600.0
+_search_cache: "OrderedDict[Tuple[str, str, int, float], Tuple[float, List[LegalTextResult]]]" = OrderedDict()
+
+
+def _search_key(code: str, query: str, limit: int, cutoff: float) -> Tuple[str, str, int, float]:
+    return (code.lower(), query.strip().lower(), limit, round(cutoff, 3))
+
+
+def _get_cached_search(key: Tuple[str, str, int, float]) -> Optional[List[LegalTextResult]]:
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _search_cache[key]
+        return None
+    _search_cache.move_to_end(key)
+    return list(entry[1])
+
+
+def _cache_search(key: Tuple[str, str, int, float], results: List[LegalTextResult]) -> None:
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, results)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+
+def _to_results(data: dict) -> List[LegalTextResult]:
+    # The store is trusted, so skip per-row validation
+    return [
+        LegalTextResult.model_construct(
+            text=result["text"],
+            code=result["code"],
+            section=result["section"],
+            sub_section=result["sub_section"],
+            similarity_score=result.get("similarity_score"),
+        )
+        for result in data.get("results", [])
+    ]
+
+
+async def _search_code(
+    client: httpx.AsyncClient, code: str, query: str, limit: int, cutoff: float
+) -> List[LegalTextResult]:
+    """Run a semantic search on one code, serving repeated queries from the search cache."""
+    key = _search_key(code, query, limit, cutoff)
+    results = _get_cached_search(key)
+    if results is not None:
+        return results
+
+    response = await client.get(
+        SEARCH_PATH.format(code=code),
+        params={
+            "q": query,
+            "limit": limit,
+            "cutoff": cutoff,
+        },
+    )
+    response.raise_for_status()
+    results = _to_results(_json(response))
+
+    _cache_search(key, results)
+    return list(results)
+
+
 @mcp.tool()
+@tool_errors("searching legal texts", "search legal texts")
 async def search_legal_texts(
     query: str = Field(description="The search query text"),
     code: str = Field(description="Legal code identifier (e.g., 'bgb', 'stgb')"),
@@ -93,39 +347,12 @@ async def search_legal_texts(
     Returns:
         List of matching legal text sections with similarity scores
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/{code}/search",
-                params={
-                    "q": query,
-                    "limit": limit,
-                    "cutoff": cutoff,
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                LegalTextResult(
-                    text=result["text"],
-                    code=result["code"],
-                    section=result["section"],
-                    sub_section=result["sub_section"],
-                    similarity_score=result.get("similarity_score"),
-                )
-                for result in data.get("results", [])
-            ]
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error searching legal texts: {e}")
-        raise RuntimeError(f"Failed to search legal texts: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error searching legal texts: {e}")
-        raise RuntimeError(f"Error searching legal texts: {str(e)}")
+    client = await get_client()
+    return await _search_code(client, code, query, limit, cutoff)
 
 
 @mcp.tool()
+@tool_errors("getting legal section", "get legal section")
 async def get_legal_section(
     code: str = Field(description="Legal code identifier (e.g., 'bgb', 'stgb')"),
     section: str = Field(description="Section identifier (e.g., '§ 1', 'Art 1')"),
@@ -148,38 +375,31 @@ async def get_legal_section(
     Returns:
         List of legal text sections matching the criteria
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            params = {"section": section}
-            if sub_section:
-                params["sub_section"] = sub_section
-            
-            response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/{code}",
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                LegalTextResult(
-                    text=result["text"],
-                    code=result["code"],
-                    section=result["section"],
-                    sub_section=result["sub_section"],
-                )
-                for result in data.get("results", [])
-            ]
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error getting legal section: {e}")
-        raise RuntimeError(f"Failed to get legal section: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error getting legal section: {e}")
-        raise RuntimeError(f"Error getting legal section: {str(e)}")
+    client = await get_client()
+    params = {"section": section}
+    if sub_section:
+        params["sub_section"] = sub_section
+
+    response = await client.get(
+        CODE_PATH.format(code=code),
+        params=params,
+    )
+    response.raise_for_status()
+    data = _json(response)
+
+    return [
+        LegalTextResult.model_construct(
+            text=result["text"],
+            code=result["code"],
+            section=result["section"],
+            sub_section=result["sub_section"],
+        )
+        for result in data.get("results", [])
+    ]
 
 
 @mcp.tool()
+@tool_errors("getting available codes", "get available codes")
 async def get_available_codes() -> List[str]:
     """
     Get all available legal codes in the database.
@@ -190,25 +410,16 @@ async def get_available_codes() -> List[str]:
     Returns:
         List of available legal code identifiers (e.g., ['bgb', 'stgb', 'gg'])
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/codes",
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+    client = await get_client()
+    response = await client.get(CODES_PATH)
+    response.raise_for_status()
+    data = _json(response)
 
-            return data.get("codes", [])
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error getting available codes: {e}")
-        raise RuntimeError(f"Failed to get available codes: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error getting available codes: {e}")
-        raise RuntimeError(f"Error getting available codes: {str(e)}")
+    return data.get("codes", [])
 
 
 @mcp.tool()
+@tool_errors("searching all legal texts", "search all legal texts")
 async def search_all_legal_texts(
     query: str = Field(description="The search query text (e.g., 'E-Auto', 'Elektrofahrzeug', 'Mietrecht')"),
     limit: int = Field(default=10, description="Maximum number of results per legal code", ge=1, le=20),
@@ -234,58 +445,28 @@ async def search_all_legal_texts(
     Returns:
         List of matching legal text sections from all codes, sorted by relevance
     """
-    try:
-        all_results = []
-        
-        async with httpx.AsyncClient() as client:
-            # First get all available codes
-            codes_response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/codes",
-                timeout=30.0,
-            )
-            codes_response.raise_for_status()
-            codes = codes_response.json().get("codes", [])
-            
-            # Search each code
-            for code in codes:
-                try:
-                    response = await client.get(
-                        f"{API_BASE_URL}/legal-texts/gesetze-im-internet/{code}/search",
-                        params={
-                            "q": query,
-                            "limit": limit,
-                            "cutoff": cutoff,
-                        },
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    for result in data.get("results", []):
-                        all_results.append(
-                            LegalTextResult(
-                                text=result["text"],
-                                code=result["code"],
-                                section=result["section"],
-                                sub_section=result["sub_section"],
-                                similarity_score=result.get("similarity_score"),
-                            )
-                        )
-                except httpx.HTTPError as e:
-                    logger.warning(f"Error searching code {code}: {e}")
-                    continue
-            
-            # Sort by similarity score (lower is better)
-            all_results.sort(key=lambda x: x.similarity_score or 999)
-            
-            return all_results
-            
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error searching all legal texts: {e}")
-        raise RuntimeError(f"Failed to search all legal texts: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error searching all legal texts: {e}")
-        raise RuntimeError(f"Error searching all legal texts: {str(e)}")
+    # "*" can't clash with a code, so all-code searches get their own entries
+    key = _search_key("*", query, limit, cutoff)
+    results = _get_cached_search(key)
+    if results is not None:
+        return results
+
+    # One request: the store embeds the query once and searches every
+    # imported code in a single query, already sorted by similarity
+    client = await get_client()
+    response = await client.post(
+        BATCH_SEARCH_PATH,
+        json={
+            "q": query,
+            "limit": limit,
+            "cutoff": cutoff,
+        },
+    )
+    response.raise_for_status()
+    results = _to_results(_json(response))
+
+    _cache_search(key, results)
+    return list(results)
 
 
 class LegalCodeInfo(BaseModel):
@@ -300,7 +481,22 @@ class LegalCodeInfo(BaseModel):
     message: Optional[str] = None
 
 
+async def _fetch_section_count(client: httpx.AsyncClient, code: str) -> int:
+    """Get the number of stored sections for an imported code, or 0 if unavailable."""
+    try:
+        # Any error status is enough to treat the count as unknown
+        count_response = await client.get(
+            COUNT_PATH.format(code=code),
+        )
+        if count_response.status_code == 200:
+            return _json(count_response).get("count", 0)
+    except Exception:
+        pass
+    return 0
+
+
 @mcp.tool()
+@tool_errors("getting legal code info", "get legal code info")
 async def get_legal_code_info(
     code: str = Field(description="Legal code identifier (e.g., 'bgb', 'adr', 'dba_are')"),
 ) -> LegalCodeInfo:
@@ -322,85 +518,57 @@ async def get_legal_code_info(
     Returns:
         Information about the legal code including URLs to official sources
     """
+    client = await get_client()
+
+    # The catalog lookup doesn't depend on anything, so start it right away
+    catalog_task = asyncio.create_task(get_catalog_titles())
     try:
-        async with httpx.AsyncClient() as client:
-            # Check if code is in our database
-            codes_response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/codes",
-                timeout=30.0,
-            )
-            codes_response.raise_for_status()
-            imported_codes = codes_response.json().get("codes", [])
-            is_imported = code.lower() in [c.lower() for c in imported_codes]
-            
-            # Get section count if imported
-            section_count = 0
-            if is_imported:
-                try:
-                    sections_response = await client.get(
-                        f"{API_BASE_URL}/legal-texts/gesetze-im-internet/{code}",
-                        params={"limit": 1},
-                        timeout=30.0,
-                    )
-                    if sections_response.status_code == 200:
-                        # Try to get total count
-                        count_response = await client.get(
-                            f"{API_BASE_URL}/legal-texts/gesetze-im-internet/{code}/count",
-                            timeout=30.0,
-                        )
-                        if count_response.status_code == 200:
-                            section_count = count_response.json().get("count", 0)
-                except:
-                    pass
-            
-            # Get catalog info for title
-            catalog_response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/catalog",
-                timeout=30.0,
-            )
-            catalog_response.raise_for_status()
-            catalog = catalog_response.json()
-            
-            title = code.upper()
-            for entry in catalog.get("entries", []):
-                if entry["code"].lower() == code.lower():
-                    title = entry.get("title", code.upper())
-                    break
-            
-            # Build URLs to official sources
-            base_url = f"https://www.gesetze-im-internet.de/{code.lower()}"
-            pdf_url = f"{base_url}/{code.lower()}.pdf"
-            html_url = f"{base_url}/index.html"
-            
-            has_full_text = is_imported and section_count > 0
-            
-            if has_full_text:
-                message = f"Vollständig importiert mit {section_count} Abschnitten. Nutze search_legal_texts oder get_legal_section für Abfragen."
-            elif is_imported:
-                message = f"Importiert, aber nur Metadaten vorhanden. Lies das PDF für den vollständigen Text: {pdf_url}"
-            else:
-                message = f"Nicht importiert. Dies ist vermutlich ein internationales Abkommen oder Vertrag. Lies das PDF direkt: {pdf_url}"
-            
-            return LegalCodeInfo(
-                code=code,
-                title=title,
-                is_imported=is_imported,
-                has_full_text=has_full_text,
-                section_count=section_count,
-                pdf_url=pdf_url,
-                html_url=html_url,
-                message=message,
+        # Check if code is in our database
+        imported_codes = await get_imported_codes()
+        is_imported = code.lower() in imported_codes.lowered
+
+        # Get section count if imported, overlapping with the catalog request
+        if is_imported:
+            titles, section_count = await asyncio.gather(
+                catalog_task, _fetch_section_count(client, code)
             )
-            
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error getting legal code info: {e}")
-        raise RuntimeError(f"Failed to get legal code info: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error getting legal code info: {e}")
-        raise RuntimeError(f"Error getting legal code info: {str(e)}")
+        else:
+            titles, section_count = await catalog_task, 0
+    finally:
+        if not catalog_task.done():
+            catalog_task.cancel()
+
+    # Get catalog info for title
+    title = titles.get(code.lower()) or code.upper()
+
+    # Build URLs to official sources
+    base_url = f"https://www.gesetze-im-internet.de/{code.lower()}"
+    pdf_url = f"{base_url}/{code.lower()}.pdf"
+    html_url = f"{base_url}/index.html"
+
+    has_full_text = is_imported and section_count > 0
+
+    if has_full_text:
+        message = f"Vollständig importiert mit {section_count} Abschnitten. Nutze search_legal_texts oder get_legal_section für Abfragen."
+    elif is_imported:
+        message = f"Importiert, aber nur Metadaten vorhanden. Lies das PDF für den vollständigen Text: {pdf_url}"
+    else:
+        message = f"Nicht importiert. Dies ist vermutlich ein internationales Abkommen oder Vertrag. Lies das PDF direkt: {pdf_url}"
+
+    return LegalCodeInfo(
+        code=code,
+        title=title,
+        is_imported=is_imported,
+        has_full_text=has_full_text,
+        section_count=section_count,
+        pdf_url=pdf_url,
+        html_url=html_url,
+        message=message,
+    )
 
 
 @mcp.tool()
+@tool_errors("getting catalog", "get catalog")
 async def get_catalog_entries(
     search: Optional[str] = Field(default=None, description="Optional search term to filter by title or code"),
     limit: int = Field(default=50, description="Maximum number of entries to return", ge=1, le=500),
@@ -423,64 +591,50 @@ async def get_catalog_entries(
     Returns:
         List of catalog entries with code, title, and import status
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            # Get catalog
-            catalog_response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/catalog",
-                timeout=30.0,
-            )
-            catalog_response.raise_for_status()
-            catalog = catalog_response.json()
-            
-            # Get imported codes
-            codes_response = await client.get(
-                f"{API_BASE_URL}/legal-texts/gesetze-im-internet/codes",
-                timeout=30.0,
-            )
-            codes_response.raise_for_status()
-            imported_codes = [c.lower() for c in codes_response.json().get("codes", [])]
-            
-            entries = catalog.get("entries", [])
-            
-            # Filter if search term provided
-            if search:
-                search_lower = search.lower()
-                entries = [
-                    e for e in entries 
-                    if search_lower in e.get("title", "").lower() 
-                    or search_lower in e.get("code", "").lower()
-                ]
-            
-            # Add import status and limit
-            result = []
-            for entry in entries[:limit]:
-                result.append({
-                    "code": entry["code"],
-                    "title": entry.get("title", ""),
-                    "is_imported": entry["code"].lower() in imported_codes,
-                    "pdf_url": f"https://www.gesetze-im-internet.de/{entry['code'].lower()}/{entry['code'].lower()}.pdf",
-                })
-            
-            return result
-            
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error getting catalog: {e}")
-        raise RuntimeError(f"Failed to get catalog: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error getting catalog: {e}")
-        raise RuntimeError(f"Error getting catalog: {str(e)}")
+    # Let the store filter and truncate the catalog instead of downloading
+    # all of it; the imported codes are fetched (or cached) meanwhile
+    params = {"limit": limit}
+    if search:
+        params["search"] = search
+
+    client = await get_client()
+    catalog_response, imported_codes = await asyncio.gather(
+        client.get(CATALOG_PATH, params=params),
+        get_imported_codes(),
+    )
+    catalog_response.raise_for_status()
+    catalog = _json(catalog_response)
+
+    # Add import status
+    result = []
+    for entry in catalog.get("entries", []):
+        code_lower = entry["code"].lower()
+        result.append({
+            "code": entry["code"],
+            "title": entry.get("title", ""),
+            "is_imported": code_lower in imported_codes.lowered,
+            "pdf_url": f"https://www.gesetze-im-internet.de/{code_lower}/{code_lower}.pdf",
+        })
+
+    return result
 
 
 # For running with the FastMCP CLI or directly
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when available (not on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Check for transport mode via environment or argument
     transport_mode = os.getenv("MCP_TRANSPORT", "stdio")
     
     if transport_mode == "http":
         # HTTP transport for remote/network accessibility
         port = int(os.getenv("MCP_PORT", "8889"))
-        logger.info(f"Starting MCP server on http://0.0.0.0:{port}")
+        logger.info("Starting MCP server on http://0.0.0.0:%d", port)
         if auth_provider:
             logger.info("GitHub OAuth authentication is ENABLED")
         mcp.run(transport="http", host="0.0.0.0", port=port)
@@ -488,5 +642,3 @@ if __name__ == "__main__":
         # stdio transport for ChatGPT Desktop and Claude Desktop
         logger.info("Starting MCP server with stdio transport")
         mcp.run(transport="stdio")
-        # stdio transport for ChatGPT Desktop and Claude Desktop
-        mcp.run(transport="stdio")
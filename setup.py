@@ -10,7 +10,9 @@ setup(
     install_requires=[
         "typer==0.15.1",
         "rich==13.9.4",
-        "httpx==0.28.1",
+        "httpx[http2]==0.28.1",
+        "ijson==3.5.1",
+        "orjson==3.10.18",
     ],
     entry_points={
         "console_scripts": [
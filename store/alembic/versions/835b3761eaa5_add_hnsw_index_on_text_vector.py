@@ -0,0 +1,34 @@
+"""add_hnsw_index_on_text_vector
+
+Revision ID: 835b3761eaa5
+Revises: 61bb595911ce
+Create Date: 2026-10-15 10:12:31.482907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '835b3761eaa5'
+down_revision: Union[str, Sequence[str], None] = '61bb595911ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add HNSW index for cosine distance search"""
+    # pgvector indexes vector columns only up to 2000 dimensions, so the
+    # 2560-dim embeddings are indexed as halfvec (up to 4000 dimensions).
+    # Queries must use the same cast to be served by this index.
+    op.execute(
+        "CREATE INDEX ix_legal_texts_text_vector_hnsw ON legal_texts "
+        "USING hnsw ((text_vector::halfvec(2560)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    """Remove HNSW index"""
+    op.drop_index('ix_legal_texts_text_vector_hnsw', table_name='legal_texts')
@@ -3,6 +3,7 @@ Application configuration using Pydantic Settings
 """
 
 from functools import lru_cache
+from typing import Optional
 from pydantic import Field, EmailStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,8 +13,10 @@ class Settings(BaseSettings):
     Application settings loaded from environment variables
     """
 
+    # Frozen: the cached instance from get_settings() is shared process-wide,
+    # so it must not be mutated (this also makes it hashable)
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False
+        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, frozen=True
     )
 
     # Application settings
@@ -21,6 +24,10 @@ class Settings(BaseSettings):
     admin_email: EmailStr = "admin@example.com"
     items_per_user: int = Field(default=50, gt=0, lt=1000)
     debug: bool = False
+    api_token: str = Field(
+        default="fake-super-secret-token",
+        description="Expected X-Token header value for protected routes",
+    )
 
     # Database settings
     postgres_host: str = Field(default="postgres")
@@ -28,6 +35,18 @@ class Settings(BaseSettings):
     postgres_password: str = Field(default="postgres_password")
     postgres_db: str = Field(default="legal_mcp_db")
     # Note: postgres_user is hard-coded to 'postgres' in database.py
+    db_pool_size: int = Field(
+        default=10, gt=0, description="Connections kept open in the async engine pool"
+    )
+    db_max_overflow: int = Field(
+        default=10, ge=0, description="Extra connections allowed beyond db_pool_size under load"
+    )
+    db_pool_timeout: int = Field(
+        default=30, gt=0, description="Seconds to wait for a free pooled connection"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds after which pooled connections are replaced (-1 disables)"
+    )
 
     # Ollama settings
     ollama_base_url: str = Field(
@@ -48,6 +67,27 @@ class Settings(BaseSettings):
         le=500,
         description="Number of texts to embed per request to Ollama (affects memory usage)",
     )
+    ollama_batch_size_max: Optional[int] = Field(
+        default=None,
+        gt=0,
+        le=500,
+        description="Upper bound for growing the batch size after successful batches (default: ollama_batch_size)",
+    )
+    ollama_max_parallel: int = Field(
+        default=1,
+        gt=0,
+        le=32,
+        description="Number of embedding batches sent to Ollama concurrently (match OLLAMA_NUM_PARALLEL)",
+    )
+    embedding_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description="Number of embeddings kept in the in-memory LRU cache (0 disables it)",
+    )
+    dummy_embeddings: bool = Field(
+        default=True,
+        description="Return zero vectors instead of calling Ollama (temporary bypass for connection issues)",
+    )
 
 
 @lru_cache
@@ -4,7 +4,8 @@ Database connection and models
 
 from typing import AsyncGenerator, Generator
 from urllib.parse import quote_plus
-from sqlalchemy import create_engine
+from pgvector.asyncpg import register_vector
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
 from app.config import get_settings
@@ -29,12 +30,31 @@ ASYNC_DATABASE_URL = (
 )
 
 # Create async engine for PostgreSQL
+# Connections are pooled across requests; pre-ping replaces connections the
+# server dropped instead of failing the request that picks them up
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=settings.debug,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
 )
 
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def register_vector_codecs(dbapi_connection, connection_record):
+    """
+    Register pgvector's binary asyncpg codecs on each new connection
+
+    Embeddings are then sent and received as packed float32 instead of
+    text literals (see app.models.BinaryVector).
+    """
+    dbapi_connection.run_async(register_vector)
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
@@ -45,24 +65,24 @@ AsyncSessionLocal = async_sessionmaker(
 # Create sync engine for synchronous operations (used by Alembic)
 sync_engine = create_engine(SYNC_DATABASE_URL, echo=settings.debug)
 
+# Create sync session factory
+SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database session
     """
+    # The context manager closes the session when the request is done
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 def get_sync_session() -> Generator[Session, None, None]:
     """
     Get synchronous database session
     """
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-    db = SessionLocal()
+    db = SyncSessionLocal()
     try:
         yield db
     finally:
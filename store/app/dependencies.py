@@ -2,7 +2,8 @@
 Shared dependencies for the application
 """
 
-from typing import AsyncGenerator
+import hmac
+from typing import Optional
 from fastapi import Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,35 +13,36 @@ from app.repository import LegalTextRepository
 from app.config import get_settings
 
 
-async def get_query_token(x_token: str = Header(None)):
+# Encoded once; compared in constant time so the check leaks no timing
+_EXPECTED_TOKEN = get_settings().api_token.encode()
+
+
+def _verify_token(x_token: Optional[str]) -> str:
     """
-    Validate the X-Token header
-    This is a simple example - in production, use proper authentication
+    Raise unless x_token matches the configured API token
     """
-    if x_token != "fake-super-secret-token":
+    if not hmac.compare_digest((x_token or "").encode(), _EXPECTED_TOKEN):
         raise HTTPException(status_code=400, detail="X-Token header invalid")
-    return x_token
+    return x_token  # type: ignore[return-value]
 
 
-async def get_token_header(x_token: str = Header(...)):
+async def get_query_token(x_token: str = Header(None)):
     """
-    Require and validate the X-Token header
+    Validate the X-Token header
+    This is a simple example - in production, use proper authentication
     """
-    if x_token != "fake-super-secret-token":
-        raise HTTPException(status_code=400, detail="X-Token header invalid")
-    return x_token
+    return _verify_token(x_token)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_token_header(x_token: str = Header(...)):
     """
-    Dependency to get database session
+    Require and validate the X-Token header
     """
-    async for session in get_async_session():
-        yield session
+    return _verify_token(x_token)
 
 
 async def get_legal_text_repository(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_session),
 ) -> LegalTextRepository:
     """
     Dependency to get legal text repository
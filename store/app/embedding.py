@@ -2,8 +2,14 @@
 Embedding service for generating text embeddings using Ollama
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Sequence
+from collections import OrderedDict
+from functools import lru_cache
+import httpx
+from typing import Dict, List, Optional, Sequence
+import numpy as np
 from ollama import AsyncClient, ResponseError
 from app.config import Settings
 
@@ -13,6 +19,16 @@ logger = logging.getLogger(__name__)
 MODEL = "ryanshillington/Qwen3-Embedding-4B:latest"
 EMBEDDING_DIMENSION = 2560
 
+# Ollama statuses meaning the batch was too large or too slow to embed
+# (payload too large, request timeout, gateway timeout)
+BATCH_TOO_LARGE_STATUSES = (413, 408, 504)
+
+# Consecutive successful batches before the batch size is doubled again
+BATCH_GROWTH_STREAK = 3
+
+# Connection pool of the Ollama HTTP client
+OLLAMA_CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
 
 class EmbeddingService:
     """
@@ -29,29 +45,42 @@ class EmbeddingService:
         self.model = MODEL
         self.settings = settings
 
+        # Effective batch size, adapted between batches (see _embed_adaptive)
+        self._current_batch_size = settings.ollama_batch_size
+        self._max_batch_size = settings.ollama_batch_size_max or settings.ollama_batch_size
+        self._success_streak = 0
+
+        # LRU cache of embeddings keyed by the SHA-256 digest of the text
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+        # The service is shared across requests (see get_embedding_service), so
+        # keep-alive connections to Ollama are reused; HTTP/2 is negotiated
+        # when Ollama is reached over https (e.g. behind a reverse proxy)
+        client_options = {
+            "host": settings.ollama_base_url,
+            "timeout": settings.ollama_timeout,
+            "http2": True,
+            "limits": OLLAMA_CONNECTION_LIMITS,
+        }
         if settings.ollama_auth_token and settings.ollama_auth_token != "":
-            self.client = AsyncClient(
-                host=settings.ollama_base_url,
-                timeout=settings.ollama_timeout,
-                headers={"Authorization": f"Bearer {settings.ollama_auth_token}"},
-            )
-        else:
-            self.client = AsyncClient(
-                host=settings.ollama_base_url, timeout=settings.ollama_timeout
-            )
+            client_options["headers"] = {
+                "Authorization": f"Bearer {settings.ollama_auth_token}"
+            }
+        self.client = AsyncClient(**client_options)
 
-    async def generate_embeddings(self, texts: List[str]) -> Sequence[Sequence[float]]:
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embedding vectors for the given texts
 
-        This method processes texts in batches to avoid exceeding nginx's
-        request size limit when dealing with large legal codes.
+        Texts embedded before are served from an in-memory LRU cache; only
+        the remaining texts are sent to Ollama, in batches to avoid exceeding
+        nginx's request size limit when dealing with large legal codes.
 
         Args:
             texts: List of input texts to generate embeddings for
 
         Returns:
-            A list of embedding vectors (one per input text)
+            float32 matrix of embedding vectors, one row per input text
 
         Raises:
             ResponseError: If the request to Ollama fails
@@ -60,46 +89,220 @@ class EmbeddingService:
         if not texts or len(texts) == 0:
             raise ValueError("Texts list cannot be empty")
 
-        # TEMPORARY FIX: Return dummy embeddings to bypass Ollama connection issues
-        logger.warning("Using dummy embeddings - Ollama connection bypassed")
-        dummy_embedding = [0.0] * EMBEDDING_DIMENSION
-        return [dummy_embedding for _ in texts]
-
-        # Original code commented out for debugging
-        # all_embeddings: List[Sequence[float]] = []
-        # batch_size = self.settings.ollama_batch_size
-        #
-        # # Process texts in batches to avoid 413 Request Entity Too Large errors
-        # for i in range(0, len(texts), batch_size):
-        #     batch = texts[i : i + batch_size]
-        #     logger.info(
-        #         f"Generating embeddings for batch {i // batch_size + 1}/{(len(texts) + batch_size - 1) // batch_size} ({len(batch)} texts)"
-        #     )
-        #
-        #     try:
-        #         response = await self.client.embed(
-        #             model=self.model,
-        #             input=batch,
-        #         )
-        #         all_embeddings.extend(response.embeddings)
-        #
-        #     except ResponseError as e:
-                logger.error(f"Ollama ResponseError: {e.error}")
-                if e.status_code == 404:
-                    logger.error(
-                        f"Model '{self.model}' not found. Please pull the model first: ollama pull {self.model}"
-                    )
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error generating embedding: {str(e)}")
-                raise
+        if self.settings.dummy_embeddings:
+            # TEMPORARY FIX: Return dummy embeddings to bypass Ollama connection issues
+            # (one zero matrix instead of a separate list of floats per text)
+            logger.warning("Using dummy embeddings - Ollama connection bypassed")
+            return np.zeros((len(texts), EMBEDDING_DIMENSION), dtype=np.float32)
+
+        keys = [hashlib.sha256(text.encode("utf-8")).digest() for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        misses: Dict[bytes, List[int]] = {}
+        for index, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                embeddings[index] = cached
+            else:
+                # Duplicate texts within the request are embedded once
+                misses.setdefault(key, []).append(index)
+
+        if misses:
+            # Longest texts first, so each batch holds texts of similar length
+            # and short texts don't wait behind a long one in the same batch
+            miss_items = sorted(
+                misses.items(), key=lambda item: len(texts[item[1][0]]), reverse=True
+            )
+            miss_texts = [texts[indices[0]] for _, indices in miss_items]
+            logger.info(
+                f"Embedding cache: {len(texts) - sum(map(len, misses.values()))}/{len(texts)} hits, embedding {len(miss_texts)} texts"
+            )
+            # float32 rows are what pgvector stores, and a quarter of the
+            # memory of Python float lists in the cache
+            new_embeddings = np.asarray(
+                await self._embed_texts(miss_texts), dtype=np.float32
+            )
+            for (key, indices), embedding in zip(miss_items, new_embeddings):
+                for index in indices:
+                    embeddings[index] = embedding
+                self._remember(key, embedding)
+
+        return np.stack(embeddings)
+
+    def _remember(self, key: bytes, embedding: np.ndarray):
+        """
+        Store an embedding in the LRU cache, evicting the oldest entries
+
+        Args:
+            key: SHA-256 digest of the embedded text
+            embedding: Embedding vector of the text
+        """
+        max_size = self.settings.embedding_cache_size
+        if max_size <= 0:
+            return
+        # Copy so the cached row doesn't keep the whole batch matrix alive
+        self._cache[key] = embedding.copy()
+        self._cache.move_to_end(key)
+        while len(self._cache) > max_size:
+            self._cache.popitem(last=False)
+
+    async def _embed_texts(self, texts: List[str]) -> List[Sequence[float]]:
+        """
+        Embed texts with Ollama in adaptively sized, concurrent batches
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text, in input order
+
+        Raises:
+            ResponseError: If the request to Ollama fails
+        """
+        # Embeddings of each batch, keyed by the index of its first text
+        batch_embeddings: Dict[int, List[Sequence[float]]] = {}
+        next_index = 0
+
+        # Process texts in batches to avoid 413 Request Entity Too Large errors.
+        # The batch size shrinks on oversized/slow batches and grows back after
+        # a streak of successes, so each batch is cut at the current size when
+        # a worker picks it up. Up to ollama_max_parallel batches are in flight
+        # at once to overlap HTTP round trips with Ollama's parallel slots.
+        async def worker():
+            nonlocal next_index
+            while next_index < len(texts):
+                start = next_index
+                batch = texts[start : start + self._current_batch_size]
+                next_index += len(batch)
+                logger.info(
+                    f"Generating embeddings for texts {start + 1}-{start + len(batch)}/{len(texts)} (batch size {len(batch)})"
+                )
+
+                try:
+                    batch_embeddings[start] = await self._embed_adaptive(batch)
+
+                except ResponseError as e:
+                    logger.error(f"Ollama ResponseError: {e.error}")
+                    if e.status_code == 404:
+                        logger.error(
+                            f"Model '{self.model}' not found. Please pull the model first: ollama pull {self.model}"
+                        )
+                    raise
+                except Exception as e:
+                    logger.error(f"Unexpected error generating embedding: {str(e)}")
+                    raise
 
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.settings.ollama_max_parallel, len(texts)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Don't leave the other batches running after the first failure
+            for task in workers:
+                task.cancel()
+            raise
+
+        all_embeddings: List[Sequence[float]] = []
+        for start in sorted(batch_embeddings):
+            all_embeddings.extend(batch_embeddings[start])
         return all_embeddings
 
+    async def _embed_adaptive(self, batch: List[str]) -> List[Sequence[float]]:
+        """
+        Embed a batch, splitting it in half if Ollama rejects it as too large
+
+        On a 413/408/504 response or a timeout the batch is split and each half
+        is embedded recursively, and the batch size used for the following
+        batches is reduced accordingly. After BATCH_GROWTH_STREAK successful
+        batches in a row the batch size is doubled again, up to
+        ollama_batch_size_max (by default the configured ollama_batch_size).
+
+        Args:
+            batch: Texts to embed
+
+        Returns:
+            One embedding vector per text in the batch
+
+        Raises:
+            ResponseError: If the request fails for another reason, or a single
+                text still cannot be embedded
+        """
+        try:
+            embeddings = list(await self._embed_batch(batch))
+        except (ResponseError, httpx.TimeoutException) as e:
+            too_large = (
+                isinstance(e, httpx.TimeoutException)
+                or e.status_code in BATCH_TOO_LARGE_STATUSES
+            )
+            if not too_large or len(batch) == 1:
+                raise
+
+            half = len(batch) // 2
+            self._current_batch_size = max(1, half)
+            self._success_streak = 0
+            logger.warning(
+                f"Embedding batch of {len(batch)} texts failed ({e}), reducing batch size to {self._current_batch_size}"
+            )
+            return (
+                await self._embed_adaptive(batch[:half])
+                + await self._embed_adaptive(batch[half:])
+            )
+
+        self._success_streak += 1
+        if (
+            self._success_streak >= BATCH_GROWTH_STREAK
+            and self._current_batch_size < self._max_batch_size
+        ):
+            self._current_batch_size = min(
+                self._current_batch_size * 2, self._max_batch_size
+            )
+            self._success_streak = 0
+            logger.info(f"Increasing embedding batch size to {self._current_batch_size}")
+
+        return embeddings
+
+    async def _embed_batch(self, batch: List[str]) -> Sequence[Sequence[float]]:
+        """
+        Embed one batch with a single /api/embed request
+
+        Falls back to the legacy one-text-per-request /api/embeddings endpoint
+        if the server's response carries no embeddings for the batch.
+
+        Args:
+            batch: Texts to embed
+
+        Returns:
+            One embedding vector per text in the batch
+
+        Raises:
+            ResponseError: If the request to Ollama fails
+            ValueError: If the legacy endpoint returns no embedding either
+        """
+        response = await self.client.embed(model=self.model, input=batch)
+        if response.embeddings and len(response.embeddings) == len(batch):
+            return response.embeddings
+
+        logger.warning(
+            "Ollama /api/embed returned no embeddings, falling back to /api/embeddings per text"
+        )
+        embeddings = []
+        for text in batch:
+            legacy_response = await self.client.embeddings(model=self.model, prompt=text)
+            if not legacy_response.embedding:
+                raise ValueError("Ollama returned an empty embedding")
+            embeddings.append(legacy_response.embedding)
+        return embeddings
 
+
+@lru_cache
 def get_embedding_service(settings: Optional[Settings] = None) -> EmbeddingService:
     """
-    Get an instance of the embedding service
+    Get a shared instance of the embedding service
+
+    The instance is cached per settings so its embedding cache and adapted
+    batch size persist across requests.
 
     Args:
         settings: Optional settings instance. If not provided, will use default settings
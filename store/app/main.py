@@ -2,15 +2,18 @@
 Main FastAPI application module
 """
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import os
 import uuid
 import logging
 
 from app.routers import legal_texts
-
-# from app.database import async_engine, Base
+from app.scrapers.http_client import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -19,66 +22,93 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     """
-#     Lifespan context manager for startup and shutdown events
-#     """
-#     # Startup
-#     logger.info("Starting Legal MCP API...")
-
-#     # Create database tables
-#     try:
-#         async with async_engine.begin() as conn:
-#             await conn.run_sync(Base.metadata.create_all)
-#         logger.info("Database tables created successfully")
-#     except Exception as e:
-#         logger.error(f"Error creating database tables: {e}")
-
-#     yield
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for startup and shutdown events
+    """
+    yield
 
-#     # Shutdown
-#     logger.info("Shutting down Legal MCP API...")
-#     await async_engine.dispose()
+    # Shutdown: close the shared scraper HTTP client
+    await close_http_client()
 
 
 app = FastAPI(
     title="Legal MCP API",
     description="A modern FastAPI application for importing and querying German legal texts using vector search",
     version="0.2.0",
-    # lifespan=lifespan,
+    lifespan=lifespan,
 )
 
 # Include routers
 app.include_router(legal_texts.router)
 
+# Compress JSON responses (e.g. the full catalog) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 # Security: Request size limits to prevent memory exhaustion
 MAX_REQUEST_SIZE = 10 * 1024 * 1024  # 10 MB
+REQUEST_TOO_LARGE_DETAIL = (
+    f"Request body too large. Maximum size is {MAX_REQUEST_SIZE // (1024 * 1024)} MB."
+)
 
 
-@app.middleware("http")
-async def limit_request_size(request: Request, call_next):
+class RequestSizeLimitMiddleware:
     """
-    Middleware to limit request body size and prevent memory exhaustion attacks
+    ASGI middleware to limit request body size and prevent memory exhaustion attacks
 
-    Checks the Content-Length header for POST, PUT, and PATCH requests
-    and rejects requests that exceed MAX_REQUEST_SIZE (10 MB).
+    POST, PUT, and PATCH requests whose Content-Length exceeds
+    MAX_REQUEST_SIZE (10 MB) are rejected before the body is read. Requests
+    without a Content-Length (chunked transfer) are counted while the body
+    is received and rejected as soon as the limit is crossed, so oversized
+    bodies are never buffered in full.
     """
-    if request.method in ["POST", "PUT", "PATCH"]:
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > MAX_REQUEST_SIZE:
-            logger.warning(
-                f"Request rejected: body too large ({content_length} bytes, max {MAX_REQUEST_SIZE})"
-            )
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "detail": f"Request body too large. Maximum size is {MAX_REQUEST_SIZE // (1024 * 1024)} MB."
-                }
-            )
-
-    return await call_next(request)
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_REQUEST_SIZE):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None:
+            if content_length.isdigit() and int(content_length) > self.max_size:
+                logger.warning(
+                    f"Request rejected: body too large ({content_length} bytes, max {self.max_size})"
+                )
+                response = JSONResponse(
+                    status_code=413, content={"detail": REQUEST_TOO_LARGE_DETAIL}
+                )
+                await response(scope, receive, send)
+                return
+            # The server enforces the declared length, nothing left to check
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    logger.warning(
+                        f"Request rejected: streamed body exceeded {self.max_size} bytes"
+                    )
+                    # Raised into the endpoint reading the body and rendered
+                    # by the HTTPException handler
+                    raise HTTPException(status_code=413, detail=REQUEST_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(RequestSizeLimitMiddleware, max_size=MAX_REQUEST_SIZE)
 
 
 @app.exception_handler(Exception)
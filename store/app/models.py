@@ -6,12 +6,41 @@ from abc import abstractmethod, ABC
 from typing import List
 from sqlalchemy import Column, Integer, String, Text, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from pgvector.sqlalchemy import Vector  # type: ignore
+from pgvector.sqlalchemy import HALFVEC, VECTOR  # type: ignore
 from pydantic import BaseModel, Field
 
 Base = declarative_base()
 
 
+class BinaryVector(VECTOR):
+    """
+    pgvector VECTOR type sent in binary form through asyncpg
+
+    pgvector's type formats every vector as a text literal (one str(float)
+    per dimension). With asyncpg the binary codecs registered on connect
+    (see database.py) encode lists or numpy arrays directly, so values are
+    passed through unchanged. Other drivers keep the text format.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if dialect.driver == "asyncpg":
+            return None
+        return super().bind_processor(dialect)
+
+
+class BinaryHalfVector(HALFVEC):
+    """pgvector HALFVEC type sent in binary form through asyncpg (see BinaryVector)"""
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if dialect.driver == "asyncpg":
+            return None
+        return super().bind_processor(dialect)
+
+
 class LegalText(BaseModel):
     """Pydantic model for legal text"""
 
@@ -40,7 +69,7 @@ class LegalTextDB(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     text = Column(Text, nullable=False)
-    text_vector = Column(Vector(2560), nullable=False)  # type: ignore
+    text_vector = Column(BinaryVector(2560), nullable=False)  # type: ignore
     text_hash = Column(String(64), nullable=True, index=True)  # SHA-256 hash for change detection
     code = Column(String(100), nullable=False, index=True)
     section = Column(String(255), nullable=False, index=True)
@@ -51,6 +80,6 @@ class Scraper(ABC):
     """Scraper for legal texts"""
 
     @abstractmethod
-    def scrape(self, code: str) -> List[LegalText]:
+    async def scrape(self, code: str) -> List[LegalText]:
         """Scrape a legal text from a code"""
         pass
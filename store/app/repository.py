@@ -1,11 +1,70 @@
 """The repository for the legal text"""
 
+import time
 from typing import Optional, List, Tuple, Sequence, Any, Dict
-from pydantic import BaseModel, model_validator
-from sqlalchemy import select
+from pydantic import BaseModel, ValidationInfo, field_validator
+from sqlalchemy import String, cast, column, func, select, text, true, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
-from app.models import LegalTextDB
+from sqlalchemy.orm import defer
+from app.models import BinaryHalfVector, LegalTextDB
+
+# Read queries skip the ~10KB embedding per row; callers only need text and
+# metadata. raiseload turns an accidental access into an error instead of a
+# lazy load, which an AsyncSession cannot do implicitly.
+WITHOUT_VECTOR = defer(LegalTextDB.text_vector, raiseload=True)
+
+# Distinct codes via a recursive loose index scan on ix_legal_texts_code
+DISTINCT_CODES_QUERY = text(
+    """
+    WITH RECURSIVE t AS (
+        (SELECT code FROM legal_texts ORDER BY code LIMIT 1)
+        UNION ALL
+        SELECT (SELECT code FROM legal_texts WHERE code > t.code ORDER BY code LIMIT 1)
+        FROM t WHERE t.code IS NOT NULL
+    )
+    SELECT code FROM t WHERE code IS NOT NULL
+    """
+)
+
+# How long get_available_codes() results are reused (per process)
+AVAILABLE_CODES_TTL_SECONDS = 60.0
+
+_available_codes_cache: Optional[Tuple[float, List[str]]] = None
+
+
+def invalidate_available_codes():
+    """Drop the cached result of get_available_codes() after writes"""
+    global _available_codes_cache
+    _available_codes_cache = None
+
+
+# Columns written by the batch upsert
+UPSERT_COLUMNS = ("text", "text_vector", "text_hash", "code", "section", "sub_section")
+
+# Rows per upsert statement (6 bind parameters each)
+INSERT_BATCH_SIZE = 500
+
+# Default HNSW candidate list size per search (raised to the limit if smaller);
+# above pgvector's default of 40 to make up for the halfvec-quantized index
+HNSW_EF_SEARCH = 64
+
+# Nearest candidates fetched through the halfvec index before they are
+# reranked by their exact full-precision distance (raised to the limit)
+RERANK_CANDIDATES = 50
+
+
+def _cosine_distance(query_embedding: Sequence[float]):
+    """
+    Cosine distance between text_vector and the query embedding
+
+    The vectors are compared as halfvec so the query can use the HNSW
+    expression index (pgvector indexes plain vectors only up to 2000
+    dimensions).
+    """
+    return cast(LegalTextDB.text_vector, BinaryHalfVector(2560)).cosine_distance(  # type: ignore[attr-defined]
+        query_embedding
+    )
 
 
 class LegalTextFilter(BaseModel):
@@ -22,14 +81,18 @@ class LegalTextFilter(BaseModel):
     section: Optional[str] = None
     sub_section: Optional[str] = None
 
-    @model_validator(mode="after")
-    def validate_sub_section_requires_section(self) -> "LegalTextFilter":
+    @field_validator("sub_section")
+    @classmethod
+    def validate_sub_section_requires_section(
+        cls, sub_section: Optional[str], info: ValidationInfo
+    ) -> Optional[str]:
         """Validate that sub_section can only be provided if section is also provided"""
-        if self.sub_section and not self.section:
+        # Runs only when sub_section is passed; section is validated first
+        if sub_section and not info.data.get("section"):
             raise ValueError(
                 "sub_section filter can only be used when section filter is also provided"
             )
-        return self
+        return sub_section
 
 
 class LegalTextRepository:
@@ -39,8 +102,11 @@ class LegalTextRepository:
         self.session = session
 
     async def get_legal_text(
-        self, filter: LegalTextFilter
-    ) -> Optional[List[LegalTextDB]]:
+        self,
+        filter: LegalTextFilter,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Sequence[LegalTextDB]:
         """
         Get legal texts matching the filter criteria
 
@@ -49,14 +115,16 @@ class LegalTextRepository:
 
         Args:
             filter: LegalTextFilter with optional code, section, and sub_section
+            limit: Maximum number of texts to return (default: None, meaning all)
+            offset: Number of matching texts to skip, for pagination (default: 0)
 
         Returns:
-            List of LegalTextDB objects matching the filter criteria
+            LegalTextDB objects matching the filter criteria (without text_vector)
 
         Raises:
             ValueError: If sub_section is provided without section (validated by filter model)
         """
-        query = select(LegalTextDB)
+        query = select(LegalTextDB).options(WITHOUT_VECTOR)
 
         # Code is required
         if filter.code:
@@ -73,13 +141,19 @@ class LegalTextRepository:
         # Sort by section and sub_section
         query = query.order_by(LegalTextDB.section, LegalTextDB.sub_section)
 
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def add_legal_text(self, legal_text: LegalTextDB) -> LegalTextDB:
         """Add a single legal text"""
         self.session.add(legal_text)
         await self.session.commit()
+        invalidate_available_codes()
         await self.session.refresh(legal_text)
         return legal_text
 
@@ -108,6 +182,26 @@ class LegalTextRepository:
             if row[2] is not None
         }
 
+    async def add_legal_texts_batch_dicts(self, values: List[Dict[str, Any]]) -> int:
+        """
+        Add or update multiple legal texts in a batch (upsert) from plain dicts
+
+        Bypasses the ORM entirely, so bulk imports don't build LegalTextDB
+        instances. Conflicts are handled as in add_legal_texts_batch.
+
+        Args:
+            values: Dicts with the keys in UPSERT_COLUMNS (text, text_vector,
+                text_hash, code, section, sub_section)
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        if not values:
+            return 0
+
+        await self._upsert(values)
+        return len(values)
+
     async def add_legal_texts_batch(
         self, legal_texts: List[LegalTextDB]
     ) -> List[LegalTextDB]:
@@ -122,55 +216,117 @@ class LegalTextRepository:
             legal_texts: List of LegalTextDB objects to insert or update
 
         Returns:
-            List of LegalTextDB objects (note: returned objects won't have IDs for upserted records)
+            List of LegalTextDB objects, with their IDs set from the upsert
         """
         if not legal_texts:
             return []
 
-        # Convert LegalTextDB objects to dictionaries for bulk insert
+        # Convert LegalTextDB objects to dictionaries for bulk insert, reading
+        # the instance __dict__ directly instead of the instrumented attributes
         values: List[Dict[str, Any]] = []
         for lt in legal_texts:
-            values.append(
-                {
-                    "text": lt.text,
-                    "text_vector": lt.text_vector,  # type: ignore
-                    "text_hash": lt.text_hash,
-                    "code": lt.code,
-                    "section": lt.section,
-                    "sub_section": lt.sub_section,
-                }
+            state = lt.__dict__
+            values.append({column: state.get(column) for column in UPSERT_COLUMNS})
+
+        ids = await self._upsert(values)
+        for lt, row in zip(legal_texts, values):
+            lt.id = ids.get((row["code"], row["section"], row["sub_section"]))
+
+        return legal_texts
+
+    async def _upsert(
+        self, values: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str, str], int]:
+        """
+        Upsert rows in chunks of INSERT_BATCH_SIZE within one transaction
+
+        Chunking keeps each statement well below PostgreSQL's bind parameter
+        limit and message sizes for large imports.
+
+        Args:
+            values: Row dicts with the keys in UPSERT_COLUMNS
+
+        Returns:
+            Row IDs keyed by (code, section, sub_section)
+        """
+        ids: Dict[Tuple[str, str, str], int] = {}
+
+        for start in range(0, len(values), INSERT_BATCH_SIZE):
+            # Create insert statement with ON CONFLICT clause
+            stmt = insert(LegalTextDB).values(values[start : start + INSERT_BATCH_SIZE])
+
+            # On conflict, update the text, text_vector and text_hash
+            # The constraint name matches what we created in the migration
+            upsert_stmt = stmt.on_conflict_do_update(
+                constraint="uq_legal_texts_code_section_subsection",
+                set_={
+                    "text": stmt.excluded.text,
+                    "text_vector": stmt.excluded.text_vector,
+                    "text_hash": stmt.excluded.text_hash,
+                },
+            ).returning(
+                LegalTextDB.id,
+                LegalTextDB.code,
+                LegalTextDB.section,
+                LegalTextDB.sub_section,
             )
 
-        # Create insert statement with ON CONFLICT clause
-        stmt = insert(LegalTextDB).values(values)
-
-        # On conflict, update the text, text_vector and text_hash
-        # The constraint name matches what we created in the migration
-        upsert_stmt = stmt.on_conflict_do_update(
-            constraint="uq_legal_texts_code_section_subsection",
-            set_={
-                "text": stmt.excluded.text,
-                "text_vector": stmt.excluded.text_vector,
-                "text_hash": stmt.excluded.text_hash,
-            },
-        )
+            result = await self.session.execute(upsert_stmt)
+            for row_id, code, section, sub_section in result:
+                ids[(code, section, sub_section)] = row_id
 
-        await self.session.execute(upsert_stmt)
         await self.session.commit()
+        invalidate_available_codes()
 
-        return legal_texts
+        return ids
 
     async def count_by_code(self, code: str) -> int:
         """Count legal texts by code"""
-        query = select(LegalTextDB).filter(LegalTextDB.code == code)
+        query = (
+            select(func.count())
+            .select_from(LegalTextDB)
+            .where(LegalTextDB.code == code)
+        )
         result = await self.session.execute(query)
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
 
     async def get_available_codes(self) -> List[str]:
-        """Get all unique legal codes available in the database"""
-        query = select(LegalTextDB.code).distinct().order_by(LegalTextDB.code)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        """
+        Get all unique legal codes available in the database
+
+        Uses a loose index scan over the code index (one index probe per
+        distinct code instead of reading every row), and caches the result
+        for AVAILABLE_CODES_TTL_SECONDS since codes change only on import.
+        """
+        global _available_codes_cache
+
+        if _available_codes_cache is not None:
+            cached_at, codes = _available_codes_cache
+            if time.monotonic() - cached_at < AVAILABLE_CODES_TTL_SECONDS:
+                return list(codes)
+
+        result = await self.session.execute(DISTINCT_CODES_QUERY)
+        codes = list(result.scalars().all())
+        _available_codes_cache = (time.monotonic(), codes)
+        return list(codes)
+
+    async def _configure_hnsw_scan(self, ef_search: int):
+        """
+        Tune the HNSW index scan for the current transaction only
+
+        Iterative scans keep searching the index until enough rows match the
+        code filter.
+
+        Args:
+            ef_search: HNSW candidate list size
+        """
+        await self.session.execute(
+            text(
+                "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                "set_config('hnsw.iterative_scan', 'strict_order', true)"
+            ),
+            {"ef_search": str(ef_search)},
+        )
 
     async def semantic_search(
         self,
@@ -178,12 +334,15 @@ class LegalTextRepository:
         code: str,
         limit: int = 10,
         cutoff: Optional[float] = None,
+        ef_search: int = HNSW_EF_SEARCH,
     ) -> List[Tuple[LegalTextDB, float]]:
         """
         Perform semantic similarity search using vector embeddings
 
         Uses cosine distance to find the most similar legal texts to the query.
         Results are filtered by code and ordered by similarity (closest first).
+        Candidates are found through the halfvec HNSW index and then reranked
+        by their exact distance, which is also what cutoff applies to.
 
         Args:
             query_embedding: The embedding vector of the search query
@@ -192,6 +351,8 @@ class LegalTextRepository:
             cutoff: Optional maximum cosine distance threshold (default: None)
                     Only return results with distance <= cutoff
                     Recommended values: 0.5 (very strict) to 1.0 (permissive)
+            ef_search: HNSW candidate list size; higher improves recall at the
+                       cost of speed (default: HNSW_EF_SEARCH, at least limit)
 
         Returns:
             List of tuples containing (LegalTextDB, distance_score)
@@ -203,6 +364,21 @@ class LegalTextRepository:
             - smaller values mean more similar
             - 2 means completely opposite vectors
         """
+        candidates = max(RERANK_CANDIDATES, limit)
+
+        await self._configure_hnsw_scan(max(ef_search, candidates))
+
+        # Stage 1: nearest candidates by halfvec distance, served by the HNSW
+        # index without reading the full-precision vectors
+        nearest = (
+            select(LegalTextDB.id)
+            .filter(LegalTextDB.code == code)
+            .order_by(_cosine_distance(query_embedding))
+            .limit(candidates)
+            .subquery()
+        )
+
+        # Stage 2: rerank the candidates by exact cosine distance.
         # Use pgvector's cosine distance operator (<=>)
         # The operator returns distance, so we order ascending (closest first)
         distance_expr = LegalTextDB.text_vector.cosine_distance(query_embedding)  # type: ignore[attr-defined]
@@ -212,7 +388,8 @@ class LegalTextRepository:
                 LegalTextDB,
                 distance_expr.label("distance"),
             )
-            .filter(LegalTextDB.code == code)
+            .options(WITHOUT_VECTOR)
+            .join(nearest, LegalTextDB.id == nearest.c.id)
             .order_by("distance")
             .limit(limit)
         )
@@ -226,3 +403,85 @@ class LegalTextRepository:
 
         # Return list of (legal_text, distance) tuples
         return [(row[0], float(row[1])) for row in rows]
+
+    async def semantic_search_codes(
+        self,
+        query_embedding: Sequence[float],
+        codes: Optional[Sequence[str]] = None,
+        limit: int = 10,
+        cutoff: Optional[float] = None,
+        ef_search: int = HNSW_EF_SEARCH,
+    ) -> List[Tuple[LegalTextDB, float]]:
+        """
+        Perform semantic similarity search across several legal codes at once
+
+        Runs a single query with one LATERAL subquery per code that does the
+        same as semantic_search(): candidates are found through the halfvec
+        HNSW index and reranked by their exact distance, which is also what
+        cutoff applies to. The result matches calling semantic_search() once
+        per code with the same embedding.
+
+        Args:
+            query_embedding: The embedding vector of the search query
+            codes: Legal codes to search (default: None, meaning all codes)
+            limit: Maximum number of results per code (default: 10)
+            cutoff: Optional maximum cosine distance threshold (default: None)
+            ef_search: HNSW candidate list size (default: HNSW_EF_SEARCH,
+                       at least limit)
+
+        Returns:
+            List of tuples containing (LegalTextDB, distance_score) across all
+            codes, ordered by distance (most similar first)
+        """
+        if codes is None:
+            codes = await self.get_available_codes()
+        if not codes:
+            return []
+
+        candidates = max(RERANK_CANDIDATES, limit)
+        await self._configure_hnsw_scan(max(ef_search, candidates))
+
+        code_values = values(column("code", String), name="codes").data(
+            [(code,) for code in codes]
+        )
+
+        # Stage 1: nearest candidates of each code by halfvec distance, served
+        # by the HNSW index
+        nearest = (
+            select(LegalTextDB.id)
+            .filter(LegalTextDB.code == code_values.c.code)
+            .order_by(_cosine_distance(query_embedding))
+            .limit(candidates)
+            .correlate(code_values)
+            .lateral("nearest")
+        )
+
+        # Stage 2: rerank each code's candidates by exact cosine distance
+        distance_expr = LegalTextDB.text_vector.cosine_distance(query_embedding)  # type: ignore[attr-defined]
+        ranked = (
+            select(LegalTextDB.id, distance_expr.label("distance"))
+            .select_from(nearest)
+            .join(LegalTextDB, LegalTextDB.id == nearest.c.id)
+            .order_by(distance_expr)
+            .limit(limit)
+            .correlate(code_values)
+        )
+
+        # Apply cutoff filter if specified
+        if cutoff is not None:
+            ranked = ranked.filter(distance_expr <= cutoff)
+        ranked = ranked.lateral("ranked")
+
+        query = (
+            select(LegalTextDB, ranked.c.distance)
+            .options(WITHOUT_VECTOR)
+            .select_from(code_values)
+            .join(ranked, true())
+            .join(LegalTextDB, LegalTextDB.id == ranked.c.id)
+            .order_by(ranked.c.distance)
+        )
+
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        return [(row[0], float(row[1])) for row in rows]
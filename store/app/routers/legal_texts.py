@@ -2,21 +2,25 @@
 Legal texts router - Endpoints for importing and querying German legal texts
 """
 
+import asyncio
 import hashlib
 import logging
 import re
-from typing import List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, ValidationError
 
 from app.scrapers import (
     GesetzteImInternetScraper,
-    GesetzteImInternetCatalog,
     CatalogFetchError,
+    get_catalog_service,
 )
 from app.repository import LegalTextRepository, LegalTextFilter
 from app.embedding import EmbeddingService
-from app.models import LegalTextDB, LegalText
+from app.models import LegalText
 from app.dependencies import (
     get_legal_text_repository,
     get_embedding_service_dependency,
@@ -28,6 +32,7 @@ router = APIRouter(
     prefix="/legal-texts",
     tags=["legal-texts"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -35,11 +40,86 @@ def compute_text_hash(text: str) -> str:
     """Compute SHA-256 hash of text for change detection"""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+
+# Changed texts are embedded and saved in chunks of this size during imports
+IMPORT_CHUNK_SIZE = 500
+
+
+async def embed_import_chunk(embedding_service: EmbeddingService, texts: List[LegalText]):
+    """
+    Generate embeddings for a chunk of texts being imported
+
+    Args:
+        embedding_service: Embedding service to use
+        texts: Legal texts to embed
+
+    Returns:
+        One embedding vector per text
+
+    Raises:
+        HTTPException: 500 if the embeddings cannot be generated
+    """
+    try:
+        embeddings = await embedding_service.generate_embeddings([lt.text for lt in texts])
+    except Exception as e:
+        logger.error(f"Error generating embeddings: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating embeddings: {str(e)}. Make sure Ollama is running and the model is available.",
+        )
+
+    logger.info(f"Generated {len(embeddings)} embeddings")
+    return embeddings
+
+
+# Query embeddings keyed by the hash of the model and normalized query; search traffic
+# repeats the same queries a lot, and each miss is an Ollama round trip
+QUERY_EMBEDDING_CACHE_SIZE = 1000
+_query_embeddings: "OrderedDict[bytes, Any]" = OrderedDict()
+
+
+async def embed_query_cached(embedding_service: EmbeddingService, query: str):
+    """
+    Get the embedding of a search query, reusing it for repeated queries
+
+    Queries are matched case-insensitively with whitespace collapsed, per
+    embedding model, so switching models never serves a stale vector.
+
+    Args:
+        embedding_service: Embedding service used on a cache miss
+        query: The search query
+
+    Returns:
+        The query's embedding vector
+
+    Raises:
+        Exception: Whatever the embedding service raises on a miss
+    """
+    normalized = " ".join(query.split())
+    key = hashlib.sha256(
+        f"{embedding_service.model}\0{normalized.casefold()}".encode("utf-8")
+    ).digest()
+
+    embedding = _query_embeddings.get(key)
+    if embedding is not None:
+        _query_embeddings.move_to_end(key)
+        return embedding
+
+    embedding = (await embedding_service.generate_embeddings([normalized]))[0]
+    _query_embeddings[key] = embedding
+    if len(_query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+        _query_embeddings.popitem(last=False)
+    return embedding
+
+
 # Security: Pattern for validating legal code format to prevent SSRF/injection attacks
 CODE_PATTERN = re.compile(r"^[a-z0-9_-]+$", re.IGNORECASE)
 MAX_CODE_LENGTH = 50
 
 
+# Codes are a small, bounded vocabulary; only valid codes are cached since
+# lru_cache doesn't store calls that raise
+@lru_cache(maxsize=1024)
 def validate_legal_code(code: str) -> str:
     """
     Validate legal code format to prevent SSRF and injection attacks
@@ -118,6 +198,32 @@ class LegalTextSearchResponse(BaseModel):
     results: List[LegalTextSearchResult]
 
 
+class LegalTextBatchSearchRequest(BaseModel):
+    """Request model for a semantic search across several legal codes"""
+
+    q: str = Field(description="Search query text", min_length=1)
+    codes: Optional[List[str]] = Field(
+        default=None,
+        description="Legal codes to search (default: all imported codes)",
+    )
+    limit: int = Field(default=10, description="Maximum number of results per code", ge=1, le=100)
+    cutoff: float = Field(
+        default=0.7,
+        description="Maximum cosine distance threshold (0-2, lower is more similar)",
+        ge=0.0,
+        le=2.0,
+    )
+
+
+class LegalTextBatchSearchResponse(BaseModel):
+    """Response model for semantic search results across several legal codes"""
+
+    query: str
+    codes: Optional[List[str]]
+    count: int
+    results: List[LegalTextSearchResult]
+
+
 class LegalTextImportResponse(BaseModel):
     """Response for importing a legal text"""
 
@@ -134,6 +240,13 @@ class AvailableCodesResponse(BaseModel):
     codes: List[str]
 
 
+class LegalTextCountResponse(BaseModel):
+    """Response model for the number of stored texts of a legal code"""
+
+    code: str
+    count: int
+
+
 class LegalCodeCatalogEntryResponse(BaseModel):
     """Response model for a single catalog entry"""
 
@@ -145,12 +258,110 @@ class LegalCodeCatalogEntryResponse(BaseModel):
 class CatalogResponse(BaseModel):
     """Response model for the catalog of importable legal codes"""
 
-    count: int = Field(description="Total number of codes available for import")
+    count: int = Field(
+        description="Total number of codes available for import (matching the search, if given)"
+    )
     entries: List[LegalCodeCatalogEntryResponse] = Field(
         description="List of importable legal codes"
     )
 
 
+# Declared before POST /{book} so "search" is not taken for a code to import
+@router.post("/gesetze-im-internet/search", response_model=LegalTextBatchSearchResponse)
+async def semantic_search_multiple_codes(
+    request: LegalTextBatchSearchRequest,
+    repository: LegalTextRepository = Depends(get_legal_text_repository),
+    embedding_service: EmbeddingService = Depends(get_embedding_service_dependency),
+):
+    """
+    Perform semantic search on several legal codes with a single request
+
+    Equivalent to calling `/{code}/search` for every code, but the query
+    embedding is generated once and all codes are searched in one database
+    query. Up to `limit` results are returned per code, ordered by similarity
+    across all codes (most similar first).
+
+    Examples:
+    - `{"q": "Elektrofahrzeug"}` - Search all imported codes
+    - `{"q": "Diebstahl", "codes": ["stgb", "bgb"], "limit": 5}` - Search two codes
+
+    Args:
+        request: Query text, optional codes, per-code limit and cutoff
+        repository: Database repository (injected)
+        embedding_service: Embedding service (injected)
+
+    Returns:
+        Search results with similarity scores from all searched codes
+
+    Raises:
+        HTTPException:
+            - 400: If a code is invalid
+            - 500: If embedding generation or search fails
+    """
+    try:
+        # Security: Validate code format to prevent SSRF/injection attacks
+        codes = (
+            [validate_legal_code(code) for code in request.codes]
+            if request.codes is not None
+            else None
+        )
+        logger.info(
+            f"Semantic search - codes: {codes or 'all'}, query: '{request.q}', "
+            f"limit: {request.limit}, cutoff: {request.cutoff}"
+        )
+
+        # Step 1: Generate embedding for the search query (once for all codes)
+        try:
+            query_embedding = await embed_query_cached(embedding_service, request.q)
+        except Exception as e:
+            logger.error(f"Error generating query embedding: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error generating query embedding: {str(e)}. Make sure Ollama is running.",
+            )
+
+        # Step 2: Search all requested codes in one query
+        search_results = await repository.semantic_search_codes(
+            query_embedding=query_embedding,
+            codes=codes,
+            limit=request.limit,
+            cutoff=request.cutoff,
+        )
+
+        # Step 3: Convert to response models (rows come from the database and
+        # are converted explicitly, so validation is skipped here; FastAPI
+        # still checks the response against response_model)
+        results = [
+            LegalTextSearchResult.model_construct(
+                text=str(legal_text.text),
+                code=str(legal_text.code),
+                section=str(legal_text.section),
+                sub_section=str(legal_text.sub_section),
+                similarity_score=float(distance),
+            )
+            for legal_text, distance in search_results
+        ]
+
+        logger.info(f"Found {len(results)} results for query '{request.q}'")
+
+        return LegalTextBatchSearchResponse.model_construct(
+            query=request.q,
+            codes=codes,
+            count=len(results),
+            results=results,
+        )
+
+    except HTTPException:
+        # Re-raise HTTP exceptions as-is
+        raise
+
+    except Exception as e:
+        logger.error(f"Error performing semantic search: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Error performing semantic search: {str(e)}"
+        )
+
+
 @router.post("/gesetze-im-internet/{book}", response_model=LegalTextImportResponse)
 async def import_legal_text(
     book: str,
@@ -185,9 +396,9 @@ async def import_legal_text(
         logger.info(f"Starting import for legal code: {book} (force={force})")
 
         # Validation: Check if code exists in catalog
-        catalog_service = GesetzteImInternetCatalog()
+        catalog_service = get_catalog_service()
         try:
-            if not catalog_service.is_valid_code(book):
+            if not await catalog_service.is_valid_code(book):
                 logger.warning(f"Code {book} not found in catalog")
                 raise HTTPException(
                     status_code=400,
@@ -201,7 +412,7 @@ async def import_legal_text(
 
         # Step 1: Scrape the legal texts
         scraper = GesetzteImInternetScraper()
-        legal_texts = scraper.scrape(book)
+        legal_texts = await scraper.scrape(book)
 
         if not legal_texts:
             raise HTTPException(
@@ -211,80 +422,80 @@ async def import_legal_text(
 
         logger.info(f"Scraped {len(legal_texts)} legal text sections")
 
-        # Step 2: Get existing hashes to detect changes
+        # Step 2: Merge texts sharing a section+sub_section, as they are
+        # stored as one row; hashes are compared against the merged text
+        merged_texts: Dict[str, LegalText] = {}
+        for lt in legal_texts:
+            key = f"{lt.section}:{lt.sub_section}"
+            existing = merged_texts.get(key)
+            if existing is not None:
+                merged_texts[key] = existing.model_copy(
+                    update={"text": existing.text + "\n\n" + lt.text}
+                )
+                logger.debug(f"Merged duplicate key: {key}")
+            else:
+                merged_texts[key] = lt
+
+        # Step 3: Get existing hashes and separate new/changed vs unchanged texts
         existing_hashes = await repository.get_existing_hashes(book)
-        
-        # Step 3: Separate texts into new/changed vs unchanged
+
         texts_to_embed: List[LegalText] = []
+        hashes_to_embed: List[str] = []
         unchanged_texts: List[LegalText] = []
-        
-        for lt in legal_texts:
-            key = f"{lt.section}:{lt.sub_section}"
+
+        for key, lt in merged_texts.items():
             new_hash = compute_text_hash(lt.text)
             existing_hash = existing_hashes.get(key)
-            
+
             if force or existing_hash is None or existing_hash != new_hash:
                 texts_to_embed.append(lt)
+                hashes_to_embed.append(new_hash)
             else:
                 unchanged_texts.append(lt)
-        
+
         logger.info(f"Texts to embed: {len(texts_to_embed)}, unchanged: {len(unchanged_texts)}")
-        
-        # Step 4: Generate embeddings only for new/changed texts
+
+        # Step 4: Generate embeddings only for new/changed texts, and
+        # Step 5: save them with their hashes, one chunk at a time. The next
+        # chunk is embedded while the current one is written, and only one
+        # chunk's embeddings and rows are held in memory at once.
         if texts_to_embed:
             logger.info("Generating embeddings for changed texts...")
+            chunks = [
+                list(zip(texts_to_embed[i : i + IMPORT_CHUNK_SIZE], hashes_to_embed[i : i + IMPORT_CHUNK_SIZE]))
+                for i in range(0, len(texts_to_embed), IMPORT_CHUNK_SIZE)
+            ]
+            next_embeddings = asyncio.create_task(
+                embed_import_chunk(embedding_service, [lt for lt, _ in chunks[0]])
+            )
             try:
-                embeddings = await embedding_service.generate_embeddings(
-                    [lt.text for lt in texts_to_embed]
-                )
-            except Exception as e:
-                logger.error(f"Error generating embeddings: {str(e)}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Error generating embeddings: {str(e)}. Make sure Ollama is running and the model is available.",
-                )
+                for index, chunk in enumerate(chunks):
+                    embeddings = await next_embeddings
+                    if index + 1 < len(chunks):
+                        next_embeddings = asyncio.create_task(
+                            embed_import_chunk(embedding_service, [lt for lt, _ in chunks[index + 1]])
+                        )
+
+                    # Create database rows with embeddings and hashes
+                    # (plain dicts, bypassing the ORM for bulk imports)
+                    rows = [
+                        {
+                            "text": legal_text.text,
+                            "text_vector": embedding,
+                            "text_hash": text_hash,
+                            "code": legal_text.code,
+                            "section": legal_text.section,
+                            "sub_section": legal_text.sub_section,
+                        }
+                        for (legal_text, text_hash), embedding in zip(chunk, embeddings)
+                    ]
+
+                    logger.info(f"Saving chunk {index + 1}/{len(chunks)} ({len(rows)} texts) to database...")
+                    await repository.add_legal_texts_batch_dicts(rows)
+            finally:
+                # Don't leave an embedding request running if saving failed
+                next_embeddings.cancel()
 
-            logger.info(f"Generated {len(embeddings)} embeddings")
-
-            # Step 5: Create database records with embeddings and hashes
-            # Deduplicate by merging texts with same section+sub_section
-            seen_keys: dict[str, int] = {}
-            legal_text_dbs: List[LegalTextDB] = []
-            
-            for legal_text, embedding in zip(texts_to_embed, embeddings):
-                key = f"{legal_text.section}:{legal_text.sub_section}"
-                
-                if key in seen_keys:
-                    # Merge text with existing entry
-                    idx = seen_keys[key]
-                    existing = legal_text_dbs[idx]
-                    merged_text = existing.text + "\n\n" + legal_text.text
-                    # Recalculate hash for merged text (embedding stays from first)
-                    legal_text_dbs[idx] = LegalTextDB(
-                        text=merged_text,
-                        text_vector=existing.text_vector,
-                        text_hash=compute_text_hash(merged_text),
-                        code=legal_text.code,
-                        section=legal_text.section,
-                        sub_section=legal_text.sub_section,
-                    )
-                    logger.debug(f"Merged duplicate key: {key}")
-                else:
-                    seen_keys[key] = len(legal_text_dbs)
-                    legal_text_db = LegalTextDB(
-                        text=legal_text.text,
-                        text_vector=embedding,
-                        text_hash=compute_text_hash(legal_text.text),
-                        code=legal_text.code,
-                        section=legal_text.section,
-                        sub_section=legal_text.sub_section,
-                    )
-                    legal_text_dbs.append(legal_text_db)
-
-            # Step 6: Save to database in batch
-            logger.info("Saving to database...")
-            await repository.add_legal_texts_batch(legal_text_dbs)
-        
         # Determine counts
         new_count = len([lt for lt in texts_to_embed if f"{lt.section}:{lt.sub_section}" not in existing_hashes])
         updated_count = len(texts_to_embed) - new_count
@@ -343,7 +554,14 @@ async def get_available_codes(
 
 
 @router.get("/gesetze-im-internet/catalog", response_model=CatalogResponse)
-async def get_importable_catalog():
+async def get_importable_catalog(
+    search: Optional[str] = Query(
+        None, description="Only return codes whose code or title contains this text (case-insensitive)"
+    ),
+    limit: Optional[int] = Query(
+        None, description="Maximum number of entries to return", ge=1
+    ),
+):
     """
     Get the catalog of all legal codes available for import from Gesetze im Internet
 
@@ -356,27 +574,46 @@ async def get_importable_catalog():
 
     The catalog is cached for 24 hours to reduce load on the source website.
 
+    Examples:
+    - `/legal-texts/gesetze-im-internet/catalog` - Get the full catalog
+    - `/legal-texts/gesetze-im-internet/catalog?search=miet&limit=10` - First 10 codes matching 'miet'
+
+    Args:
+        search: Optional case-insensitive filter on code and title
+        limit: Optional maximum number of entries to return
+
     Returns:
-        List of all importable legal codes with their titles and URLs
+        List of importable legal codes with their titles and URLs
 
     Raises:
         HTTPException: If catalog fetch fails
     """
     try:
         logger.info("Fetching importable legal codes catalog")
-        catalog_service = GesetzteImInternetCatalog()
-        catalog_entries = catalog_service.get_catalog()
+        catalog_service = get_catalog_service()
+        catalog_entries = await catalog_service.get_catalog()
+
+        # Filter before building response models so only matches are serialized
+        if search:
+            search_lower = search.lower()
+            catalog_entries = [
+                entry
+                for entry in catalog_entries
+                if search_lower in entry.code.lower()
+                or search_lower in entry.title.lower()
+            ]
+        count = len(catalog_entries)
 
         # Convert to response models
         entries = [
             LegalCodeCatalogEntryResponse(
                 code=entry.code, title=entry.title, url=entry.url
             )
-            for entry in catalog_entries
+            for entry in catalog_entries[:limit]
         ]
 
-        logger.info(f"Found {len(entries)} codes in catalog")
-        return CatalogResponse(count=len(entries), entries=entries)
+        logger.info(f"Found {count} codes in catalog, returning {len(entries)}")
+        return CatalogResponse(count=count, entries=entries)
 
     except Exception as e:
         logger.error(f"Error fetching catalog: {str(e)}", exc_info=True)
@@ -393,6 +630,10 @@ async def get_legal_texts(
         None,
         description="Filter by sub-section number (e.g., '1', '2a'). Requires section parameter.",
     ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of texts to return (default: all)"
+    ),
+    offset: int = Query(0, ge=0, description="Number of texts to skip, for pagination"),
     repository: LegalTextRepository = Depends(get_legal_text_repository),
 ):
     """
@@ -409,11 +650,14 @@ async def get_legal_texts(
     - `/legal-texts/bgb?section=§ 1` - Get all texts for § 1 BGB
     - `/legal-texts/bgb?section=§ 1&sub_section=1` - Get sub-section 1 of § 1 BGB
     - `/legal-texts/bgb?sub_section=1` - ❌ Invalid (requires section)
+    - `/legal-texts/bgb?limit=50&offset=100` - Get texts 101-150 of the BGB
 
     Args:
         code: The legal code identifier (required)
         section: Optional section filter
         sub_section: Optional sub-section filter (requires section to be set)
+        limit: Optional maximum number of texts to return
+        offset: Number of texts to skip (default: 0)
         repository: Database repository (injected)
 
     Returns:
@@ -454,7 +698,7 @@ async def get_legal_texts(
             )
 
         # Query database
-        legal_texts = await repository.get_legal_text(filter)
+        legal_texts = await repository.get_legal_text(filter, limit=limit, offset=offset)
 
         if not legal_texts:
             raise HTTPException(
@@ -464,13 +708,24 @@ async def get_legal_texts(
                 + (f", sub_section: {sub_section}" if sub_section else ""),
             )
 
-        # Convert to response models (excluding embeddings)
-        # Using Pydantic's from_attributes mode to convert SQLAlchemy models
-        results = [LegalTextResponse.model_validate(lt) for lt in legal_texts]
+        # Convert to plain dicts (excluding embeddings). The rows come straight
+        # from the database, so they are returned as a response directly
+        # rather than validated and serialized again via LegalTextResponse,
+        # which is costly for whole codes with thousands of sections.
+        results = [
+            {
+                "id": lt.id,
+                "text": lt.text,
+                "code": lt.code,
+                "section": lt.section,
+                "sub_section": lt.sub_section,
+            }
+            for lt in legal_texts
+        ]
 
         logger.info(f"Found {len(results)} legal texts matching the criteria")
 
-        return LegalTextListResponse(count=len(results), results=results)
+        return ORJSONResponse({"count": len(results), "results": results})
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -483,6 +738,43 @@ async def get_legal_texts(
         )
 
 
+@router.get("/gesetze-im-internet/{code}/count", response_model=LegalTextCountResponse)
+async def count_legal_texts(
+    code: str,
+    repository: LegalTextRepository = Depends(get_legal_text_repository),
+):
+    """
+    Get the number of stored legal text sections for a code
+
+    Returns a count of 0 for codes that have not been imported.
+
+    Args:
+        code: The legal code identifier (e.g., 'bgb', 'stgb')
+        repository: Database repository (injected)
+
+    Returns:
+        The code and its number of stored sections
+
+    Raises:
+        HTTPException: If the code format is invalid or the database query fails
+    """
+    try:
+        # Security: Validate code format to prevent SSRF/injection attacks
+        code = validate_legal_code(code)
+        count = await repository.count_by_code(code)
+        return LegalTextCountResponse(code=code, count=count)
+
+    except HTTPException:
+        # Re-raise HTTP exceptions as-is
+        raise
+
+    except Exception as e:
+        logger.error(f"Error counting legal texts: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Error counting legal texts: {str(e)}"
+        )
+
+
 @router.get(
     "/gesetze-im-internet/{code}/search", response_model=LegalTextSearchResponse
 )
@@ -554,8 +846,7 @@ async def semantic_search_legal_texts(
 
         # Step 1: Generate embedding for the search query
         try:
-            query_embeddings = await embedding_service.generate_embeddings([q])
-            query_embedding = query_embeddings[0]
+            query_embedding = await embed_query_cached(embedding_service, q)
         except Exception as e:
             logger.error(f"Error generating query embedding: {str(e)}")
             raise HTTPException(
@@ -574,20 +865,21 @@ async def semantic_search_legal_texts(
         )
 
         # Step 3: Convert to response models
-        results: List[LegalTextSearchResult] = []
-        for legal_text, distance in search_results:
-            result = LegalTextSearchResult(
+        # (validation is skipped for the trusted, explicitly converted rows)
+        results = [
+            LegalTextSearchResult.model_construct(
                 text=str(legal_text.text),
                 code=str(legal_text.code),
                 section=str(legal_text.section),
                 sub_section=str(legal_text.sub_section),
                 similarity_score=float(distance),
             )
-            results.append(result)
+            for legal_text, distance in search_results
+        ]
 
         logger.info(f"Found {len(results)} results for query '{q}' in code {code}")
 
-        return LegalTextSearchResponse(
+        return LegalTextSearchResponse.model_construct(
             query=q,
             code=code,
             count=len(results),
@@ -4,6 +4,7 @@ from .gesetze_im_internet.catalog import (
     LegalCodeCatalogEntry,
     CatalogFetchError,
     CatalogParseError,
+    get_catalog_service,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "LegalCodeCatalogEntry",
     "CatalogFetchError",
     "CatalogParseError",
+    "get_catalog_service",
 ]
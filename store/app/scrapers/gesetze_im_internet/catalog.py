@@ -1,14 +1,18 @@
 # ABOUTME: Service for fetching and parsing the Gesetze im Internet catalog
 # ABOUTME: Provides catalog of importable legal codes with caching
+import asyncio
 import re
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
 
-import requests
+import httpx
 from lxml import etree
 
+from app.scrapers.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,35 +39,54 @@ class GesetzteImInternetCatalog:
 
     CATALOG_URL = "https://www.gesetze-im-internet.de/gii-toc.xml"
     CACHE_TTL_SECONDS = 86400  # 24 hours
+    URL_CODE_PATTERN = re.compile(r'https?://www\.gesetze-im-internet\.de/([^/]+)/xml\.zip')
 
     def __init__(self):
         self._cache: Optional[List[LegalCodeCatalogEntry]] = None
         self._cache_timestamp: Optional[datetime] = None
+        # Codes of the cached catalog, for O(1) lookups in is_valid_code
+        self._code_index: FrozenSet[str] = frozenset()
+        # Serializes refreshes so concurrent cache misses share one fetch
+        self._lock = asyncio.Lock()
 
-    def get_catalog(self) -> List[LegalCodeCatalogEntry]:
+    async def get_catalog(self) -> List[LegalCodeCatalogEntry]:
         """Fetch catalog, using cache if available and fresh"""
         if self._is_cache_valid():
             logger.debug("Using cached catalog")
             return self._cache
 
-        logger.info("Fetching fresh catalog")
-        self._cache = self._fetch_catalog()
-        self._cache_timestamp = datetime.now()
-        return self._cache
+        async with self._lock:
+            # Another request may have refreshed the cache while we waited
+            if self._is_cache_valid():
+                logger.debug("Using catalog fetched by a concurrent request")
+                return self._cache
+
+            logger.info("Fetching fresh catalog")
+            self._cache = await self._fetch_catalog()
+            self._code_index = frozenset(entry.code for entry in self._cache)
+            self._cache_timestamp = datetime.now()
+            return self._cache
 
-    def is_valid_code(self, code: str) -> bool:
+    async def is_valid_code(self, code: str) -> bool:
         """Check if a code exists in the catalog"""
-        catalog = self.get_catalog()
-        return any(entry.code == code for entry in catalog)
+        await self.get_catalog()
+        return code in self._code_index
 
-    def _fetch_catalog(self) -> List[LegalCodeCatalogEntry]:
-        """Fetch and parse the catalog XML"""
+    async def _fetch_catalog(self) -> List[LegalCodeCatalogEntry]:
+        """Fetch and parse the catalog XML, parsing it as the response arrives"""
         try:
             logger.info(f"Fetching catalog from {self.CATALOG_URL}")
-            response = requests.get(self.CATALOG_URL, timeout=30)
-            response.raise_for_status()
-            return self._parse_catalog_xml(response.content)
-        except requests.RequestException as e:
+            parser = self._new_catalog_parser()
+            entries: List[LegalCodeCatalogEntry] = []
+            async with get_http_client().stream("GET", self.CATALOG_URL, timeout=30) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    entries.extend(self._feed_catalog_parser(parser, chunk))
+            entries.extend(self._feed_catalog_parser(parser, None))
+
+            logger.info(f"Parsed {len(entries)} entries from catalog")
+            return entries
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch catalog: {str(e)}")
             raise CatalogFetchError(f"Failed to fetch catalog: {str(e)}") from e
         except Exception as e:
@@ -72,48 +95,88 @@ class GesetzteImInternetCatalog:
 
     def _parse_catalog_xml(self, xml_content: bytes) -> List[LegalCodeCatalogEntry]:
         """Parse the catalog XML into LegalCodeCatalogEntry objects"""
+        parser = self._new_catalog_parser()
+        entries = self._feed_catalog_parser(parser, xml_content)
+        entries.extend(self._feed_catalog_parser(parser, None))
+
+        logger.info(f"Parsed {len(entries)} entries from catalog")
+        return entries
+
+    def _new_catalog_parser(self) -> etree.XMLPullParser:
+        """Create an incremental parser reporting each completed <item>"""
+        return etree.XMLPullParser(events=("end",), tag="item")
+
+    def _feed_catalog_parser(
+        self, parser: etree.XMLPullParser, chunk: Optional[bytes]
+    ) -> List[LegalCodeCatalogEntry]:
+        """
+        Feed a chunk of catalog XML to the parser and collect completed items
+
+        Items are discarded once their entry has been read, so the whole
+        catalog tree is never held in memory.
+
+        Args:
+            parser: Parser created by _new_catalog_parser
+            chunk: Next chunk of the document, or None once it is complete
+
+        Returns:
+            Entries for the items completed by this chunk
+
+        Raises:
+            CatalogParseError: If the XML is malformed
+        """
         try:
-            tree = etree.fromstring(xml_content)
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
         except etree.XMLSyntaxError as e:
             logger.error(f"Failed to parse catalog XML: {str(e)}")
             raise CatalogParseError(f"Failed to parse catalog XML: {str(e)}") from e
 
         entries = []
-        for item in tree.findall(".//item"):
-            title_elem = item.find("title")
-            link_elem = item.find("link")
-
-            # Skip malformed entries
-            if title_elem is None or link_elem is None:
-                logger.warning("Skipping item with missing title or link")
-                continue
-
-            title = title_elem.text
-            url = link_elem.text
-
-            # Skip if missing data
-            if not title or not url:
-                logger.warning(f"Skipping item with empty title or url: title={title}, url={url}")
-                continue
-
-            code = self._extract_code_from_url(url)
-            if code is None:
-                logger.warning(f"Could not extract code from URL: {url}")
-                continue
-
-            entries.append(LegalCodeCatalogEntry(
-                code=code,
-                title=title,
-                url=url
-            ))
-
-        logger.info(f"Parsed {len(entries)} entries from catalog")
+        for _, item in parser.read_events():
+            entry = self._parse_catalog_item(item)
+            if entry is not None:
+                entries.append(entry)
+
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
         return entries
 
+    def _parse_catalog_item(self, item: etree._Element) -> Optional[LegalCodeCatalogEntry]:
+        """Convert one catalog <item> into an entry, or None if it is malformed"""
+        title_elem = item.find("title")
+        link_elem = item.find("link")
+
+        # Skip malformed entries
+        if title_elem is None or link_elem is None:
+            logger.warning("Skipping item with missing title or link")
+            return None
+
+        title = title_elem.text
+        url = link_elem.text
+
+        # Skip if missing data
+        if not title or not url:
+            logger.warning(f"Skipping item with empty title or url: title={title}, url={url}")
+            return None
+
+        code = self._extract_code_from_url(url)
+        if code is None:
+            logger.warning(f"Could not extract code from URL: {url}")
+            return None
+
+        return LegalCodeCatalogEntry(
+            code=code,
+            title=title,
+            url=url
+        )
+
     def _extract_code_from_url(self, url: str) -> Optional[str]:
         """Extract code from URL like https://www.gesetze-im-internet.de/bgb/xml.zip"""
-        pattern = r'https?://www\.gesetze-im-internet\.de/([^/]+)/xml\.zip'
-        match = re.match(pattern, url)
+        match = self.URL_CODE_PATTERN.match(url)
         if match:
             return match.group(1)
         return None
@@ -125,3 +188,16 @@ class GesetzteImInternetCatalog:
 
         age = datetime.now() - self._cache_timestamp
         return age.total_seconds() < self.CACHE_TTL_SECONDS
+
+
+@lru_cache
+def get_catalog_service() -> GesetzteImInternetCatalog:
+    """
+    Get the shared catalog service instance
+
+    The instance is shared so its cached catalog is reused across requests.
+
+    Returns:
+        The GesetzteImInternetCatalog instance
+    """
+    return GesetzteImInternetCatalog()
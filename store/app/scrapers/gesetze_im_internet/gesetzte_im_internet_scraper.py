@@ -1,49 +1,86 @@
 from app.models import Scraper, LegalText
-from typing import List
-import requests
+from app.scrapers.http_client import get_http_client
+from typing import BinaryIO, List
+import asyncio
+import logging
+import re
+import tempfile
 import zipfile
-import io
 from .xml_parser import GermanLegalXMLParser
 
+logger = logging.getLogger(__name__)
+
+# Zip archives are read from the end (central directory), so downloads are
+# spooled to a file first; archives up to this size stay in memory
+ZIP_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# Sub-section number at the start of a paragraph, e.g. "2a" in "(2a) Text";
+# stops at the next bracket like the previous split("(")/split(")") did
+SUB_SECTION_PATTERN = re.compile(r"\(([^()]*)")
+
+# Shared by all scrapes: streaming parses keep no state on the parser, so
+# concurrent scrapes in worker threads can use the same instance. Table XML
+# is never stored, so tables are not serialized.
+XML_PARSER = GermanLegalXMLParser(capture_table_xml=False)
+
 
 class GesetzteImInternetScraper(Scraper):
     """Scraper for legal texts from Gesetzte im Internet"""
 
-    def scrape(self, code: str) -> List[LegalText]:
+    async def scrape(self, code: str) -> List[LegalText]:
         """Scrape a legal text from a code"""
         url = f"https://www.gesetze-im-internet.de/{code}/xml.zip"
-        response = requests.get(url)
-        response.raise_for_status()
-        xml_data = self._extract_xml_from_zip(response.content)
-        parser = GermanLegalXMLParser()
-        result = parser.parse_bytes(xml_data)
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_BYTES) as zip_file:
+            async with get_http_client().stream("GET", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    zip_file.write(chunk)
+            zip_file.seek(0)
+            # Unzipping and parsing large codes is CPU-bound, keep it off the event loop
+            return await asyncio.to_thread(self._parse_zip, code, zip_file)
+
+    def _parse_zip(self, code: str, zip_file: BinaryIO) -> List[LegalText]:
+        """Extract legal texts from a downloaded xml.zip"""
+        # Parse straight from the decompressing archive member instead of
+        # reading the whole XML document into memory first
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            first_file = zip_ref.namelist()[0]
+            with zip_ref.open(first_file) as xml_file:
+                result = XML_PARSER.parse_fileobj(xml_file)
         extracted_legal_texts: List[LegalText] = []
-        print(len(result.norms))
-        
-        # Track if we found any full text content
-        has_full_text = False
-        
+        logger.debug(f"Parsed {len(result.norms)} norms")
+
+        # Hoisted out of the loop, which runs for thousands of paragraphs
+        extend = extracted_legal_texts.extend
+        extract_sub_section = self._extract_sub_section
+
         for norm in result.norms:
+            section = norm.metadaten.enbez
+            textdaten = norm.textdaten
             if (
-                norm.textdaten
-                and norm.textdaten.text
-                and norm.textdaten.text.formatted_text
+                not section
+                or not textdaten
+                or not textdaten.text
+                or not textdaten.text.formatted_text
             ):
-                for p in norm.textdaten.text.formatted_text.paragraphs:
-                    if norm.metadaten.enbez:
-                        has_full_text = True
-                        extracted_legal_texts.append(
-                            LegalText(
-                                text=p,
-                                # code=norm.metadaten.jurabk[0],
-                                # we use the code from the url (e.g. rag_1) instead of the jurabk (e.g. RAG 1)
-                                # so we know what to query later
-                                code=code,
-                                section=norm.metadaten.enbez,
-                                sub_section=self._extract_sub_section(p),
-                            )
-                        )
-        
+                continue
+
+            extend(
+                LegalText(
+                    text=p,
+                    # code=norm.metadaten.jurabk[0],
+                    # we use the code from the url (e.g. rag_1) instead of the jurabk (e.g. RAG 1)
+                    # so we know what to query later
+                    code=code,
+                    section=section,
+                    sub_section=extract_sub_section(p),
+                )
+                for p in textdaten.text.formatted_text.paragraphs
+            )
+
+        # Track if we found any full text content
+        has_full_text = bool(extracted_legal_texts)
+
         # If no full text found, create a metadata-only entry with PDF link
         if not has_full_text and result.norms:
             first_norm = result.norms[0]
@@ -91,15 +128,10 @@ Volltext verfügbar unter:
         
         return extracted_legal_texts
 
-    def _extract_xml_from_zip(self, zip_file: bytes) -> bytes:
-        with zipfile.ZipFile(io.BytesIO(zip_file), "r") as zip_ref:
-            first_file = zip_ref.namelist()[0]
-            with zip_ref.open(first_file) as file:
-                return file.read()
-
     def _extract_sub_section(self, section: str) -> str:
         # if section number is present, the str begins with (n)
-        if section.startswith("("):
-            return section.split("(")[1].split(")")[0]
+        match = SUB_SECTION_PATTERN.match(section)
+        if match:
+            return match.group(1)
         # If no subsection number found, return empty string instead of full text
         return ""
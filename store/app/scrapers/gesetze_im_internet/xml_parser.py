@@ -7,13 +7,72 @@ gii-norm.dtd structure used by gesetze-im-internet.de.
 The parser uses lxml for XML processing and dataclasses for structured data representation.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Any, Dict
+import sys
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Optional, List, Any, BinaryIO, Dict
+import orjson
 from lxml import etree
-from io import StringIO, BytesIO
+from io import BytesIO
 
+# libxml2 options for every parse: no xml:id table (unused here), no entity
+# expansion, and no size limits for very large codes. Blank text is kept, as
+# whitespace between inline elements of mixed content (<B>a</B> <I>b</I>) is
+# significant.
+PARSER_OPTIONS = {"collect_ids": False, "resolve_entities": False, "huge_tree": True}
 
-@dataclass
+# Descendant text nodes and <BR> elements of an element, in document order
+TEXT_AND_LINE_BREAKS = etree.XPath(".//text() | .//BR", smart_strings=False)
+
+
+def first_child(element: Any, tag: str) -> Any:
+    """
+    Return the first direct child with the given tag, or None
+
+    Equivalent to element.find(tag) for a plain tag name, but iterates the
+    children in C instead of going through lxml's ElementPath machinery,
+    which is noticeably faster for the many lookups per norm.
+    """
+    return next(element.iterchildren(tag), None)
+
+
+def child_text(element: Any, tag: str) -> Optional[str]:
+    """
+    Return the stripped text of the first direct child with the given tag
+
+    None if there is no such child or it has no text.
+    """
+    child = next(element.iterchildren(tag), None)
+    if child is None or not child.text:
+        return None
+    return child.text.strip()
+
+
+def interned_attr(element: Any, name: str) -> Optional[str]:
+    """
+    Get an attribute value, interned
+
+    For attributes from a small vocabulary that repeat on every norm
+    (e.g. typ="amtlich", format="XML"), so each distinct value is stored
+    once instead of once per occurrence.
+    """
+    value = element.get(name)
+    return sys.intern(value) if value else value
+
+
+def children_by_tag(element: Any) -> Dict[Any, List[Any]]:
+    """
+    Group the direct children of an element by tag in a single pass
+
+    Lets elements with many optional children be read with one scan instead
+    of a separate lookup per child tag. Children keep their document order.
+    """
+    children: Dict[Any, List[Any]] = {}
+    for child in element:
+        children.setdefault(child.tag, []).append(child)
+    return children
+
+
+@dataclass(slots=True)
 class Fundstelle:
     """Represents a legal citation source (fundstelle)"""
 
@@ -25,7 +84,7 @@ class Fundstelle:
     abgabedat: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Gliederungseinheit:
     """Represents a structural unit (gliederungseinheit)"""
 
@@ -34,7 +93,7 @@ class Gliederungseinheit:
     gliederungstitel: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Standangabe:
     """Represents version information (standangabe)"""
 
@@ -43,7 +102,7 @@ class Standangabe:
     checked: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadaten:
     """Represents metadata for a legal norm"""
 
@@ -61,7 +120,7 @@ class Metadaten:
     standangabe: List[Standangabe] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a table structure"""
 
@@ -70,7 +129,7 @@ class Table:
     raw_content: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FormattedText:
     """Represents formatted text with structure preserved"""
 
@@ -80,7 +139,7 @@ class FormattedText:
     footnote_refs: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Footnote:
     """Represents a footnote"""
 
@@ -93,7 +152,7 @@ class Footnote:
     group: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     """Represents the text content section"""
 
@@ -102,7 +161,7 @@ class TextContent:
     format: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Textdaten:
     """Represents text data for a legal norm"""
 
@@ -110,7 +169,7 @@ class Textdaten:
     fussnoten: Optional[TextContent] = None  # Additional footnotes section
 
 
-@dataclass
+@dataclass(slots=True)
 class Norm:
     """Represents a complete legal norm"""
 
@@ -120,7 +179,7 @@ class Norm:
     doknr: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Dokumente:
     """Root element containing multiple norms"""
 
@@ -132,16 +191,35 @@ class Dokumente:
 class GermanLegalXMLParser:
     """Parser for German legal XML documents (gii-norm.dtd format)"""
 
-    def __init__(self):
+    def __init__(self, capture_table_xml: bool = True):
+        """
+        Initialize the parser
+
+        Args:
+            capture_table_xml: Store each table's serialized XML in
+                Table.raw_content; disable when only the text is needed
+        """
         self.namespaces = {}
+        self.capture_table_xml = capture_table_xml
+        self._parser = etree.XMLParser(**PARSER_OPTIONS)
 
     def parse_bytes(self, xml_bytes: bytes) -> Dokumente:
         """
         Parse an XML bytes containing German legal texts
         """
-        tree = etree.parse(BytesIO(xml_bytes))
-        root = tree.getroot()
-        return self.parse_dokumente(root)
+        return self.parse_stream(BytesIO(xml_bytes))
+
+    def parse_fileobj(self, xml_file: BinaryIO) -> Dokumente:
+        """
+        Parse XML read incrementally from a binary file object
+
+        Args:
+            xml_file: Readable binary file (e.g. an opened zip archive member)
+
+        Returns:
+            Dokumente object containing parsed norms
+        """
+        return self.parse_stream(xml_file)
 
     def parse_file(self, filepath: str) -> Dokumente:
         """
@@ -153,9 +231,7 @@ class GermanLegalXMLParser:
         Returns:
             Dokumente object containing parsed norms
         """
-        tree = etree.parse(filepath)
-        root = tree.getroot()
-        return self.parse_dokumente(root)
+        return self.parse_stream(filepath)
 
     def parse_string(self, xml_string: str) -> Dokumente:
         """
@@ -167,26 +243,69 @@ class GermanLegalXMLParser:
         Returns:
             Dokumente object containing parsed norms
         """
-        tree = etree.parse(StringIO(xml_string))
-        root = tree.getroot()
+        try:
+            # Parse straight from the string, without a Python file wrapper
+            root = etree.fromstring(xml_string, self._parser)
+        except ValueError:
+            # lxml rejects str input that carries an encoding declaration;
+            # the string is already decoded, so re-encode it and override
+            # whatever encoding the declaration names
+            root = etree.fromstring(
+                xml_string.encode("utf-8"),
+                etree.XMLParser(encoding="utf-8", **PARSER_OPTIONS),
+            )
         return self.parse_dokumente(root)
 
-    def parse_dokumente(self, element: Any) -> Dokumente:
-        """Parse the root dokumente element"""
-        dokumente = Dokumente(
-            builddate=element.get("builddate"), doknr=element.get("doknr")
-        )
+    def parse_stream(self, source: Any) -> Dokumente:
+        """
+        Parse a document norm by norm without building the whole tree
 
-        for norm_elem in element.findall("norm"):
-            norm = self.parse_norm(norm_elem)
-            dokumente.norms.append(norm)
+        Each <norm> is converted as soon as it has been read and then
+        discarded, so memory use is bounded by the largest norm rather than
+        the document size. The result is the same as parse_dokumente().
+
+        Args:
+            source: File path or readable binary file object
+
+        Returns:
+            Dokumente object containing parsed norms
+        """
+        dokumente = Dokumente()
+        for event, elem in etree.iterparse(
+            source, events=("start", "end"), tag=("dokumente", "norm"), **PARSER_OPTIONS
+        ):
+            parent = elem.getparent()
+            if event == "start":
+                # Attributes of the root element are complete at its start tag
+                if parent is None:
+                    dokumente.builddate = elem.get("builddate")
+                    dokumente.doknr = elem.get("doknr")
+                continue
+
+            # Only norms directly below the root, like parse_dokumente()
+            if elem.tag != "norm" or parent is None or parent.getparent() is not None:
+                continue
+
+            dokumente.norms.append(self.parse_norm(elem))
+
+            elem.clear(keep_tail=False)
+            while elem.getprevious() is not None:
+                del parent[0]
 
         return dokumente
 
+    def parse_dokumente(self, element: Any) -> Dokumente:
+        """Parse the root dokumente element"""
+        return Dokumente(
+            norms=[self.parse_norm(norm_elem) for norm_elem in element.iterchildren("norm")],
+            builddate=element.get("builddate"),
+            doknr=element.get("doknr"),
+        )
+
     def parse_norm(self, element: Any) -> Norm:
         """Parse a norm element"""
-        metadaten_elem = element.find("metadaten")
-        textdaten_elem = element.find("textdaten")
+        metadaten_elem = first_child(element, "metadaten")
+        textdaten_elem = first_child(element, "textdaten")
 
         metadaten = (
             self.parse_metadaten(metadaten_elem)
@@ -200,117 +319,117 @@ class GermanLegalXMLParser:
         return Norm(
             metadaten=metadaten,
             textdaten=textdaten,
-            builddate=element.get("builddate"),
+            builddate=interned_attr(element, "builddate"),
             doknr=element.get("doknr"),
         )
 
     def parse_metadaten(self, element: Any) -> Metadaten:
         """Parse metadata section"""
-        metadaten = Metadaten(jurabk=[])
+        # One scan over the children instead of one per optional tag
+        children = children_by_tag(element)
+        # Default for absent tags, so that [0] gives None like find() did
+        no_children: List[Any] = [None]
 
         # Parse jurabk (can have multiple)
-        for jurabk_elem in element.findall("jurabk"):
-            if jurabk_elem.text:
-                metadaten.jurabk.append(jurabk_elem.text.strip())
+        metadaten = Metadaten(
+            jurabk=[
+                sys.intern(jurabk_elem.text.strip())
+                for jurabk_elem in children.get("jurabk", ())
+                if jurabk_elem.text
+            ]
+        )
 
         # Parse amtabk
-        amtabk_elem = element.find("amtabk")
+        amtabk_elem = children.get("amtabk", no_children)[0]
         if amtabk_elem is not None and amtabk_elem.text:
-            metadaten.amtabk = amtabk_elem.text.strip()
+            metadaten.amtabk = sys.intern(amtabk_elem.text.strip())
 
         # Parse ausfertigung-datum
-        datum_elem = element.find("ausfertigung-datum")
+        datum_elem = children.get("ausfertigung-datum", no_children)[0]
         if datum_elem is not None:
             if datum_elem.text:
                 metadaten.ausfertigung_datum = datum_elem.text.strip()
-            metadaten.ausfertigung_datum_manuell = datum_elem.get("manuell")
+            metadaten.ausfertigung_datum_manuell = interned_attr(datum_elem, "manuell")
 
         # Parse fundstelle (can have multiple)
-        for fundstelle_elem in element.findall("fundstelle"):
-            fundstelle = self.parse_fundstelle(fundstelle_elem)
-            if fundstelle:
-                metadaten.fundstelle.append(fundstelle)
+        metadaten.fundstelle = [
+            fundstelle
+            for fundstelle_elem in children.get("fundstelle", ())
+            if (fundstelle := self.parse_fundstelle(fundstelle_elem))
+        ]
 
         # Parse kurzue
-        kurzue_elem = element.find("kurzue")
+        kurzue_elem = children.get("kurzue", no_children)[0]
         if kurzue_elem is not None:
             metadaten.kurzue = self.extract_text_content(kurzue_elem)
 
         # Parse langue
-        langue_elem = element.find("langue")
+        langue_elem = children.get("langue", no_children)[0]
         if langue_elem is not None:
             metadaten.langue = self.extract_text_content(langue_elem)
 
         # Parse gliederungseinheit
-        gliederung_elem = element.find("gliederungseinheit")
+        gliederung_elem = children.get("gliederungseinheit", no_children)[0]
         if gliederung_elem is not None:
             metadaten.gliederungseinheit = self.parse_gliederungseinheit(
                 gliederung_elem
             )
 
         # Parse enbez
-        enbez_elem = element.find("enbez")
+        enbez_elem = children.get("enbez", no_children)[0]
         if enbez_elem is not None and enbez_elem.text:
             metadaten.enbez = enbez_elem.text.strip()
 
         # Parse titel
-        titel_elem = element.find("titel")
+        titel_elem = children.get("titel", no_children)[0]
         if titel_elem is not None:
             metadaten.titel = self.extract_text_content(titel_elem)
-            metadaten.titel_format = titel_elem.get("format")
+            metadaten.titel_format = interned_attr(titel_elem, "format")
 
         # Parse standangabe (can have multiple)
-        for stand_elem in element.findall("standangabe"):
-            standangabe = self.parse_standangabe(stand_elem)
-            if standangabe:
-                metadaten.standangabe.append(standangabe)
+        metadaten.standangabe = [
+            standangabe
+            for stand_elem in children.get("standangabe", ())
+            if (standangabe := self.parse_standangabe(stand_elem))
+        ]
 
         return metadaten
 
     def parse_fundstelle(self, element: Any) -> Optional[Fundstelle]:
         """Parse a fundstelle (citation source) element"""
-        periodikum_elem = element.find("periodikum")
-        zitstelle_elem = element.find("zitstelle")
+        periodikum_elem = first_child(element, "periodikum")
+        zitstelle_elem = first_child(element, "zitstelle")
 
         if periodikum_elem is None or zitstelle_elem is None:
             return None
 
         fundstelle = Fundstelle(
-            periodikum=periodikum_elem.text.strip() if periodikum_elem.text else "",
+            periodikum=sys.intern(periodikum_elem.text.strip()) if periodikum_elem.text else "",
             zitstelle=zitstelle_elem.text.strip() if zitstelle_elem.text else "",
-            typ=element.get("typ"),
+            typ=interned_attr(element, "typ"),
         )
 
         # Parse anlageabgabe if present
-        anlageabgabe_elem = element.find("anlageabgabe")
+        anlageabgabe_elem = first_child(element, "anlageabgabe")
         if anlageabgabe_elem is not None:
-            anlagedat_elem = anlageabgabe_elem.find("anlagedat")
-            dokst_elem = anlageabgabe_elem.find("dokst")
-            abgabedat_elem = anlageabgabe_elem.find("abgabedat")
-
-            if anlagedat_elem is not None and anlagedat_elem.text:
-                fundstelle.anlagedat = anlagedat_elem.text.strip()
-            if dokst_elem is not None and dokst_elem.text:
-                fundstelle.dokst = dokst_elem.text.strip()
-            if abgabedat_elem is not None and abgabedat_elem.text:
-                fundstelle.abgabedat = abgabedat_elem.text.strip()
+            fundstelle.anlagedat = child_text(anlageabgabe_elem, "anlagedat")
+            fundstelle.dokst = child_text(anlageabgabe_elem, "dokst")
+            fundstelle.abgabedat = child_text(anlageabgabe_elem, "abgabedat")
 
         return fundstelle
 
     def parse_gliederungseinheit(self, element: Any) -> Optional[Gliederungseinheit]:
         """Parse a gliederungseinheit (structural unit) element"""
-        kennzahl_elem = element.find("gliederungskennzahl")
-
-        if kennzahl_elem is None or not kennzahl_elem.text:
+        kennzahl = child_text(element, "gliederungskennzahl")
+        if kennzahl is None:
             return None
 
-        gliederung = Gliederungseinheit(gliederungskennzahl=kennzahl_elem.text.strip())
-
-        bez_elem = element.find("gliederungsbez")
-        if bez_elem is not None and bez_elem.text:
-            gliederung.gliederungsbez = bez_elem.text.strip()
+        gliederung = Gliederungseinheit(
+            gliederungskennzahl=kennzahl,
+            gliederungsbez=child_text(element, "gliederungsbez"),
+        )
 
-        titel_elem = element.find("gliederungstitel")
+        titel_elem = first_child(element, "gliederungstitel")
         if titel_elem is not None:
             gliederung.gliederungstitel = self.extract_text_content(titel_elem)
 
@@ -318,27 +437,27 @@ class GermanLegalXMLParser:
 
     def parse_standangabe(self, element: Any) -> Optional[Standangabe]:
         """Parse a standangabe (version information) element"""
-        standtyp_elem = element.find("standtyp")
-        standkommentar_elem = element.find("standkommentar")
+        standtyp_elem = first_child(element, "standtyp")
+        standkommentar_elem = first_child(element, "standkommentar")
 
         if standtyp_elem is None or standkommentar_elem is None:
             return None
 
         return Standangabe(
-            standtyp=standtyp_elem.text.strip() if standtyp_elem.text else "",
+            standtyp=sys.intern(standtyp_elem.text.strip()) if standtyp_elem.text else "",
             standkommentar=self.extract_text_content(standkommentar_elem),
-            checked=element.get("checked"),
+            checked=interned_attr(element, "checked"),
         )
 
     def parse_textdaten(self, element: Any) -> Textdaten:
         """Parse the textdaten section"""
         textdaten = Textdaten()
 
-        text_elem = element.find("text")
+        text_elem = first_child(element, "text")
         if text_elem is not None:
             textdaten.text = self.parse_text_content(text_elem)
 
-        fussnoten_elem = element.find("fussnoten")
+        fussnoten_elem = first_child(element, "fussnoten")
         if fussnoten_elem is not None:
             textdaten.fussnoten = self.parse_text_content(fussnoten_elem)
 
@@ -346,23 +465,24 @@ class GermanLegalXMLParser:
 
     def parse_text_content(self, element: Any) -> TextContent:
         """Parse a text or fussnoten element"""
-        text_content = TextContent(format=element.get("format"))
+        text_content = TextContent(format=interned_attr(element, "format"))
 
         # Parse TOC or Content
-        content_elem = element.find("Content")
-        toc_elem = element.find("TOC")
+        content_elem = first_child(element, "Content")
+        toc_elem = first_child(element, "TOC")
 
         target_elem = content_elem if content_elem is not None else toc_elem
         if target_elem is not None:
             text_content.formatted_text = self.parse_formatted_content(target_elem)
 
         # Parse Footnotes
-        footnotes_elem = element.find("Footnotes")
+        footnotes_elem = first_child(element, "Footnotes")
         if footnotes_elem is not None:
-            for footnote_elem in footnotes_elem.findall("Footnote"):
-                footnote = self.parse_footnote(footnote_elem)
-                if footnote:
-                    text_content.footnotes.append(footnote)
+            text_content.footnotes = [
+                footnote
+                for footnote_elem in footnotes_elem.iterchildren("Footnote")
+                if (footnote := self.parse_footnote(footnote_elem))
+            ]
 
         return text_content
 
@@ -370,26 +490,26 @@ class GermanLegalXMLParser:
         """Parse formatted content (Content or TOC element)"""
         formatted_text = FormattedText(content="")
 
-        # Extract paragraphs
-        for p_elem in element.findall(".//P"):
-            paragraph_text = self.extract_text_content(p_elem)
-            if paragraph_text:
-                formatted_text.paragraphs.append(paragraph_text)
-
-        # Extract tables
-        for table_elem in element.findall(".//table"):
-            table = self.parse_table(table_elem)
-            formatted_text.tables.append(table)
+        # Extract paragraphs, tables and footnote references in a single
+        # walk over the descendants instead of one findall(".//...") each
+        for node in element.iter("P", "table", "FnR"):
+            if node is element:
+                continue
+            tag = node.tag
+            if tag == "P":
+                paragraph_text = self.extract_text_content(node)
+                if paragraph_text:
+                    formatted_text.paragraphs.append(paragraph_text)
+            elif tag == "table":
+                formatted_text.tables.append(self.parse_table(node))
+            else:
+                fn_id = node.get("ID")
+                if fn_id:
+                    formatted_text.footnote_refs.append(fn_id)
 
         # Extract all text content
         formatted_text.content = self.extract_text_content(element)
 
-        # Extract footnote references
-        for fnr_elem in element.findall(".//FnR"):
-            fn_id = fnr_elem.get("ID")
-            if fn_id:
-                formatted_text.footnote_refs.append(fn_id)
-
         return formatted_text
 
     def parse_table(self, element: Any) -> Table:
@@ -397,12 +517,16 @@ class GermanLegalXMLParser:
         table = Table()
 
         # Extract title if present
-        title_elem = element.find("Title")
+        title_elem = first_child(element, "Title")
         if title_elem is not None:
             table.title = self.extract_text_content(title_elem)
 
         # Store raw content for later processing
-        table.raw_content = etree.tostring(element, encoding="unicode", method="xml")
+        if self.capture_table_xml:
+            # Only the table itself, not the text following it in the paragraph
+            table.raw_content = etree.tostring(
+                element, encoding="unicode", method="xml", with_tail=False
+            )
 
         return table
 
@@ -415,113 +539,51 @@ class GermanLegalXMLParser:
         return Footnote(
             id=footnote_id,
             content=self.extract_text_content(element),
-            prefix=element.get("Prefix"),
-            fnz=element.get("FnZ"),
-            postfix=element.get("Postfix"),
-            pos=element.get("Pos"),
-            group=element.get("Group"),
+            prefix=interned_attr(element, "Prefix"),
+            fnz=interned_attr(element, "FnZ"),
+            postfix=interned_attr(element, "Postfix"),
+            pos=interned_attr(element, "Pos"),
+            group=interned_attr(element, "Group"),
         )
 
     def extract_text_content(self, element: Any) -> str:
         """
         Extract text content from an element, handling formatting tags
 
-        This recursively extracts text from the element and its children,
-        handling line breaks and basic formatting.
+        This extracts the text of the element and its descendants in document
+        order, turning <BR> tags into line breaks.
         """
+        if next(element.iter("BR"), None) is None:
+            # Common case: no line breaks, let lxml collect the text in C
+            text = "".join(element.itertext())
+        else:
+            # Text nodes (including tails of comments and processing
+            # instructions, whose own content is skipped like itertext()
+            # does) and <BR> elements, in document order
+            text = "".join(
+                node if isinstance(node, str) else "\n"
+                for node in TEXT_AND_LINE_BREAKS(element)
+            )
 
-        def extract_recursive(elem: Any) -> str:
-            text_parts: List[str] = []
-
-            # Add element's direct text
-            if elem.text:
-                text_parts.append(str(elem.text))
-
-            # Process children
-            for child in elem:
-                # Handle line breaks
-                if child.tag == "BR":
-                    text_parts.append("\n")
-                else:
-                    # Recursively extract from child
-                    child_text = extract_recursive(child)
-                    if child_text:
-                        text_parts.append(child_text)
-
-                # Add tail text (text after the closing tag)
-                if child.tail:
-                    text_parts.append(str(child.tail))
-
-            return "".join(text_parts)
-
-        text = extract_recursive(element)
         # Clean up excessive whitespace while preserving line breaks
-        lines = [line.strip() for line in text.split("\n")]
-        return "\n".join(line for line in lines if line)
+        return "\n".join(filter(None, map(str.strip, text.split("\n"))))
 
     def to_dict(self, obj: Any) -> Dict[str, Any]:
         """
         Convert parsed objects to dictionary representation
 
-        Useful for JSON serialization or further processing
+        Useful for further processing in Python. For JSON output use
+        to_json(), which skips this intermediate dict.
         """
-        if hasattr(obj, "__dataclass_fields__"):
-            result: Dict[str, Any] = {}
-            for field_name in obj.__dataclass_fields__:
-                value: Any = getattr(obj, field_name)
-                if isinstance(value, list):
-                    converted_list: List[Any] = []
-                    item: Any
-                    for item in value:  # type: ignore
-                        if hasattr(item, "__dataclass_fields__"):  # type: ignore
-                            converted_list.append(self.to_dict(item))
-                        else:
-                            converted_list.append(item)
-                    result[field_name] = converted_list
-                elif hasattr(value, "__dataclass_fields__"):
-                    result[field_name] = self.to_dict(value)
-                else:
-                    result[field_name] = value
-            return result
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
         return {"value": obj}
 
+    def to_json(self, obj: Any) -> bytes:
+        """
+        Serialize parsed objects to UTF-8 encoded JSON
 
-# Example usage
-if __name__ == "__main__":
-    parser = GermanLegalXMLParser()
-
-    # Example: Parse a file
-    # dokumente = parser.parse_file('path/to/legal_text.xml')
-
-    # Example: Parse a string
-    xml_example = """<?xml version="1.0" encoding="UTF-8"?>
-    <dokumente builddate="2024-01-01">
-        <norm doknr="123">
-            <metadaten>
-                <jurabk>BGB</jurabk>
-                <amtabk>BGB</amtabk>
-                <ausfertigung-datum manuell="ja">1896-08-18</ausfertigung-datum>
-                <langue>Bürgerliches Gesetzbuch</langue>
-                <enbez>§ 1</enbez>
-                <titel>Beginn der Rechtsfähigkeit</titel>
-            </metadaten>
-            <textdaten>
-                <text>
-                    <Content>
-                        <P>Die Rechtsfähigkeit des Menschen beginnt mit der Vollendung der Geburt.</P>
-                    </Content>
-                </text>
-            </textdaten>
-        </norm>
-    </dokumente>
-    """
-
-    # dokumente = parser.parse_string(xml_example)
-    # print(f"Parsed {len(dokumente.norms)} norm(s)")
-    #
-    # if dokumente.norms:
-    #     norm = dokumente.norms[0]
-    #     print(f"Jurabk: {norm.metadaten.jurabk}")
-    #     print(f"Title: {norm.metadaten.titel}")
-    #     if norm.textdaten and norm.textdaten.text and norm.textdaten.text.formatted_text:
-    #         print(f"Content: {norm.textdaten.text.formatted_text.content}")
+        orjson walks the dataclasses in C, so this is a single pass instead
+        of to_dict() followed by json.dumps().
+        """
+        return orjson.dumps(obj)
@@ -0,0 +1,44 @@
+"""
+Shared async HTTP client for fetching documents from gesetze-im-internet.de
+"""
+
+from typing import Optional
+import httpx
+
+# Downloads of large codes (e.g. the BGB zip) can take a while
+DOWNLOAD_TIMEOUT_SECONDS = 60.0
+
+# Keep-alive connections kept open to gesetze-im-internet.de
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=10)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use
+
+    One client is reused for all downloads so connections to
+    gesetze-im-internet.de are kept alive between requests, and concurrent
+    imports are multiplexed over HTTP/2 where the server supports it.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=DOWNLOAD_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            http2=True,
+            limits=CONNECTION_LIMITS,
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client, if it was created"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -2,3 +2,14 @@
 ABOUTME: Pytest configuration and shared fixtures for all tests
 ABOUTME: Currently minimal as unit tests use mocks only
 """
+import pytest
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
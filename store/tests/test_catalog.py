@@ -1,15 +1,31 @@
 # ABOUTME: Unit tests for the Gesetze im Internet catalog service
 # ABOUTME: Tests catalog fetching, parsing, caching, and validation
+import asyncio
 import pytest
 from unittest.mock import Mock, patch
+import httpx
 from datetime import datetime, timedelta
 from app.scrapers.gesetze_im_internet.catalog import (
     GesetzteImInternetCatalog,
     LegalCodeCatalogEntry,
     CatalogFetchError,
     CatalogParseError,
+    get_catalog_service,
 )
 
+# Catalog with two well-formed entries, shared by the parsing tests
+VALID_CATALOG_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<items>
+  <item>
+    <title>Bürgerliches Gesetzbuch</title>
+    <link>https://www.gesetze-im-internet.de/bgb/xml.zip</link>
+  </item>
+  <item>
+    <title>Strafgesetzbuch</title>
+    <link>https://www.gesetze-im-internet.de/stgb/xml.zip</link>
+  </item>
+</items>""".encode('utf-8')
+
 
 class TestExtractCodeFromUrl:
     """Test URL code extraction"""
@@ -39,19 +55,7 @@ class TestParseCatalogXml:
     def test_parse_catalog_xml_valid(self):
         """Parse valid XML structure"""
         catalog = GesetzteImInternetCatalog()
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<items>
-  <item>
-    <title>Bürgerliches Gesetzbuch</title>
-    <link>https://www.gesetze-im-internet.de/bgb/xml.zip</link>
-  </item>
-  <item>
-    <title>Strafgesetzbuch</title>
-    <link>https://www.gesetze-im-internet.de/stgb/xml.zip</link>
-  </item>
-</items>""".encode('utf-8')
-
-        entries = catalog._parse_catalog_xml(xml_content)
+        entries = catalog._parse_catalog_xml(VALID_CATALOG_XML)
 
         assert len(entries) == 2
         assert entries[0].code == "bgb"
@@ -105,7 +109,7 @@ class TestParseCatalogXml:
 class TestCaching:
     """Test caching behavior"""
 
-    def test_cache_reuse(self):
+    async def test_cache_reuse(self):
         """Verify cache is reused within TTL"""
         catalog = GesetzteImInternetCatalog()
 
@@ -119,17 +123,17 @@ class TestCaching:
 
         with patch.object(catalog, '_fetch_catalog', return_value=mock_entries) as mock_fetch:
             # First call should fetch
-            entries1 = catalog.get_catalog()
+            entries1 = await catalog.get_catalog()
             assert mock_fetch.call_count == 1
 
             # Second call should use cache
-            entries2 = catalog.get_catalog()
+            entries2 = await catalog.get_catalog()
             assert mock_fetch.call_count == 1
 
             # Should return same data
             assert entries1 == entries2
 
-    def test_cache_invalidation(self):
+    async def test_cache_invalidation(self):
         """Verify cache expires after TTL"""
         catalog = GesetzteImInternetCatalog()
 
@@ -148,14 +152,40 @@ class TestCaching:
             catalog._cache_timestamp = old_time
 
             # Call should fetch fresh data
-            catalog.get_catalog()
+            await catalog.get_catalog()
             assert mock_fetch.call_count == 1
 
+    async def test_concurrent_misses_fetch_once(self):
+        """Verify concurrent calls on an empty cache share a single fetch"""
+        catalog = GesetzteImInternetCatalog()
+
+        mock_entries = [
+            LegalCodeCatalogEntry(
+                code="bgb",
+                title="Bürgerliches Gesetzbuch",
+                url="https://www.gesetze-im-internet.de/bgb/xml.zip"
+            )
+        ]
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return mock_entries
+
+        with patch.object(catalog, '_fetch_catalog', side_effect=slow_fetch) as mock_fetch:
+            results = await asyncio.gather(*(catalog.get_catalog() for _ in range(5)))
+
+            assert mock_fetch.call_count == 1
+            assert all(result == mock_entries for result in results)
+
+    def test_catalog_service_is_shared(self):
+        """Verify the catalog service (and its cache) is shared across callers"""
+        assert get_catalog_service() is get_catalog_service()
+
 
 class TestIsValidCode:
     """Test code validation"""
 
-    def test_is_valid_code_exists(self):
+    async def test_is_valid_code_exists(self):
         """Validate existing code returns True"""
         catalog = GesetzteImInternetCatalog()
 
@@ -172,11 +202,11 @@ class TestIsValidCode:
             )
         ]
 
-        with patch.object(catalog, 'get_catalog', return_value=mock_entries):
-            assert catalog.is_valid_code("bgb") is True
-            assert catalog.is_valid_code("stgb") is True
+        with patch.object(catalog, '_fetch_catalog', return_value=mock_entries):
+            assert await catalog.is_valid_code("bgb") is True
+            assert await catalog.is_valid_code("stgb") is True
 
-    def test_is_valid_code_not_exists(self):
+    async def test_is_valid_code_not_exists(self):
         """Validate non-existing code returns False"""
         catalog = GesetzteImInternetCatalog()
 
@@ -188,19 +218,66 @@ class TestIsValidCode:
             )
         ]
 
-        with patch.object(catalog, 'get_catalog', return_value=mock_entries):
-            assert catalog.is_valid_code("nonexistent") is False
+        with patch.object(catalog, '_fetch_catalog', return_value=mock_entries):
+            assert await catalog.is_valid_code("nonexistent") is False
+
 
+    async def test_is_valid_code_after_refresh(self):
+        """Validate the code index follows catalog refreshes"""
+        catalog = GesetzteImInternetCatalog()
+
+        old_entries = [
+            LegalCodeCatalogEntry(
+                code="bgb",
+                title="Bürgerliches Gesetzbuch",
+                url="https://www.gesetze-im-internet.de/bgb/xml.zip"
+            )
+        ]
+        new_entries = [
+            LegalCodeCatalogEntry(
+                code="stgb",
+                title="Strafgesetzbuch",
+                url="https://www.gesetze-im-internet.de/stgb/xml.zip"
+            )
+        ]
+
+        with patch.object(catalog, '_fetch_catalog', side_effect=[old_entries, new_entries]):
+            assert await catalog.is_valid_code("bgb") is True
+
+            # Expire the cache so the next call refreshes it
+            catalog._cache_timestamp = datetime.now() - timedelta(seconds=catalog.CACHE_TTL_SECONDS + 1)
+
+            assert await catalog.is_valid_code("bgb") is False
+            assert await catalog.is_valid_code("stgb") is True
 
 class TestFetchCatalog:
     """Test catalog fetching"""
 
-    def test_fetch_catalog_network_error(self):
+    async def test_fetch_catalog_network_error(self):
         """Handle network failures gracefully"""
         catalog = GesetzteImInternetCatalog()
 
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = Exception("Network error")
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Network error", request=request)
 
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch('app.scrapers.gesetze_im_internet.catalog.get_http_client', return_value=client):
             with pytest.raises(CatalogFetchError):
-                catalog._fetch_catalog()
+                await catalog._fetch_catalog()
+
+    async def test_fetch_catalog_parses_streamed_response(self):
+        """Parse the catalog from a response arriving in small chunks"""
+        catalog = GesetzteImInternetCatalog()
+        async def chunks():
+            for i in range(0, len(VALID_CATALOG_XML), 16):
+                yield VALID_CATALOG_XML[i:i + 16]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=chunks())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch('app.scrapers.gesetze_im_internet.catalog.get_http_client', return_value=client):
+            entries = await catalog._fetch_catalog()
+
+        assert [entry.code for entry in entries] == ["bgb", "stgb"]
+        assert entries[0].title == "Bürgerliches Gesetzbuch"
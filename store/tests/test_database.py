@@ -0,0 +1,13 @@
+"""
+Unit tests for database engine setup
+"""
+import pytest
+from sqlalchemy import event
+from app.database import async_engine, register_vector_codecs
+
+pytestmark = pytest.mark.unit
+
+
+def test_vector_codecs_registered_on_connect():
+    """Test new asyncpg connections get pgvector's binary codecs"""
+    assert event.contains(async_engine.sync_engine, "connect", register_vector_codecs)
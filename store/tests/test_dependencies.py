@@ -0,0 +1,23 @@
+"""
+Unit tests for shared dependencies
+"""
+import pytest
+from fastapi import HTTPException
+from app.dependencies import get_query_token, get_token_header
+
+pytestmark = pytest.mark.unit
+
+
+class TestTokenValidation:
+    """Tests for X-Token header validation"""
+
+    async def test_valid_token(self):
+        """Test the configured token is accepted"""
+        assert await get_token_header("fake-super-secret-token") == "fake-super-secret-token"
+
+    @pytest.mark.parametrize("token", ["wrong", "fake-super-secret-token2", "fäke", None])
+    async def test_invalid_token(self, token):
+        """Test wrong, non-ASCII and missing tokens are rejected"""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_query_token(token)
+        assert exc_info.value.status_code == 400
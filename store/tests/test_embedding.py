@@ -0,0 +1,234 @@
+"""
+Unit tests for EmbeddingService
+"""
+import asyncio
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.config import Settings
+from app.embedding import EmbeddingService, EMBEDDING_DIMENSION
+
+pytestmark = pytest.mark.unit
+
+
+def make_service(**overrides) -> EmbeddingService:
+    """Create an embedding service with a mocked Ollama client"""
+    settings = Settings(dummy_embeddings=False, **overrides)
+    service = EmbeddingService(settings)
+    service.client = MagicMock()
+    service.client.embed = AsyncMock()
+    service.client.embeddings = AsyncMock()
+    return service
+
+
+class TestGenerateEmbeddings:
+    """Tests for EmbeddingService.generate_embeddings"""
+
+    async def test_rejects_empty_input(self):
+        """Test that an empty text list raises ValueError"""
+        service = make_service()
+        with pytest.raises(ValueError, match="cannot be empty"):
+            await service.generate_embeddings([])
+
+    async def test_dummy_embeddings(self):
+        """Test that the bypass returns one zero vector per text without calling Ollama"""
+        service = EmbeddingService(Settings(dummy_embeddings=True))
+        service.client = MagicMock()
+
+        embeddings = await service.generate_embeddings(["a", "b", "c"])
+
+        assert embeddings.shape == (3, EMBEDDING_DIMENSION)
+        assert not embeddings.any()
+        service.client.embed.assert_not_called()
+
+    async def test_embeds_each_batch_in_one_request(self):
+        """Test that texts are sent to /api/embed in batches of ollama_batch_size"""
+        service = make_service(ollama_batch_size=2)
+        service.client.embed.side_effect = [
+            MagicMock(embeddings=[[1.0], [2.0]]),
+            MagicMock(embeddings=[[3.0]]),
+        ]
+
+        embeddings = await service.generate_embeddings(["a", "b", "c"])
+
+        assert embeddings.tolist() == [[1.0], [2.0], [3.0]]
+        assert embeddings.dtype == np.float32
+        assert [call.kwargs["input"] for call in service.client.embed.call_args_list] == [["a", "b"], ["c"]]
+        service.client.embeddings.assert_not_called()
+
+    async def test_embeds_unique_texts_longest_first(self):
+        """Test duplicates are embedded once, longest first, and results keep input order"""
+        service = make_service(embedding_cache_size=0)
+
+        async def embed(model, input):
+            return MagicMock(embeddings=[[float(len(text))] for text in input])
+
+        service.client.embed.side_effect = embed
+
+        embeddings = await service.generate_embeddings(["bb", "a", "dddd", "a", "ccc"])
+
+        assert embeddings.tolist() == [[2.0], [1.0], [4.0], [1.0], [3.0]]
+        service.client.embed.assert_awaited_once()
+        assert service.client.embed.call_args.kwargs["input"] == ["dddd", "ccc", "bb", "a"]
+
+    async def test_falls_back_to_legacy_endpoint(self):
+        """Test that a response without embeddings is retried per text via /api/embeddings"""
+        service = make_service()
+        service.client.embed.return_value = MagicMock(embeddings=[])
+        service.client.embeddings.side_effect = [
+            MagicMock(embedding=[1.0]),
+            MagicMock(embedding=[2.0]),
+        ]
+
+        embeddings = await service.generate_embeddings(["a", "b"])
+
+        assert embeddings.tolist() == [[1.0], [2.0]]
+        assert [call.kwargs["prompt"] for call in service.client.embeddings.call_args_list] == ["a", "b"]
+
+
+class TestAdaptiveBatchSize:
+    """Tests for shrinking and growing the embedding batch size"""
+
+    async def test_splits_batch_on_payload_too_large(self):
+        """Test that a 413 splits the batch in half and lowers the batch size"""
+        from ollama import ResponseError
+
+        service = make_service(ollama_batch_size=4)
+
+        async def embed(model, input):
+            if len(input) > 2:
+                raise ResponseError("request entity too large", 413)
+            return MagicMock(embeddings=[[float(len(text))] for text in input])
+
+        service.client.embed.side_effect = embed
+
+        embeddings = await service.generate_embeddings(["a", "bb", "ccc", "dddd"])
+
+        assert embeddings.tolist() == [[1.0], [2.0], [3.0], [4.0]]
+        assert service._current_batch_size == 2
+
+    async def test_does_not_split_on_other_errors(self):
+        """Test that errors unrelated to batch size are raised unchanged"""
+        from ollama import ResponseError
+
+        service = make_service(ollama_batch_size=4)
+        service.client.embed.side_effect = ResponseError("model not found", 404)
+
+        with pytest.raises(ResponseError):
+            await service.generate_embeddings(["a", "b"])
+        assert service.client.embed.call_count == 1
+
+    async def test_grows_batch_size_after_successes(self):
+        """Test that the batch size doubles after a streak of successful batches, up to the max"""
+        service = make_service(ollama_batch_size=1, ollama_batch_size_max=2)
+
+        async def embed(model, input):
+            return MagicMock(embeddings=[[0.0] for _ in input])
+
+        service.client.embed.side_effect = embed
+
+        await service.generate_embeddings([str(i) for i in range(9)])
+
+        assert [len(call.kwargs["input"]) for call in service.client.embed.call_args_list] == [1, 1, 1, 2, 2, 2]
+        assert service._current_batch_size == 2
+
+
+class TestConcurrentBatches:
+    """Tests for embedding batches concurrently"""
+
+    async def test_batches_run_concurrently_in_order(self):
+        """Test that up to ollama_max_parallel batches are in flight and results keep input order"""
+        service = make_service(ollama_batch_size=1, ollama_max_parallel=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def embed(model, input):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later (shorter) texts finish first
+            await asyncio.sleep(0.001 * len(input[0]))
+            in_flight -= 1
+            return MagicMock(embeddings=[[float(len(text))] for text in input])
+
+        service.client.embed.side_effect = embed
+
+        embeddings = await service.generate_embeddings(["dddd", "ccc", "bb", "a"])
+
+        assert embeddings.tolist() == [[4.0], [3.0], [2.0], [1.0]]
+        assert max_in_flight == 2
+
+    async def test_failure_cancels_other_batches(self):
+        """Test that the first failing batch is raised and the remaining batches are not sent"""
+        from ollama import ResponseError
+
+        service = make_service(ollama_batch_size=1, ollama_max_parallel=2)
+
+        async def embed(model, input):
+            if input == ["bb"]:
+                raise ResponseError("model not found", 404)
+            await asyncio.sleep(0.01)
+            return MagicMock(embeddings=[[0.0]])
+
+        service.client.embed.side_effect = embed
+
+        with pytest.raises(ResponseError):
+            await service.generate_embeddings(["ccc", "bb", "a"])
+        assert [call.kwargs["input"] for call in service.client.embed.call_args_list] == [["ccc"], ["bb"]]
+
+
+class TestEmbeddingCache:
+    """Tests for the in-memory embedding LRU cache"""
+
+    @staticmethod
+    def embed_lengths(service):
+        async def embed(model, input):
+            return MagicMock(embeddings=[[float(len(text))] for text in input])
+
+        service.client.embed.side_effect = embed
+
+    async def test_only_misses_are_embedded(self):
+        """Test that cached texts are not sent to Ollama again and order is kept"""
+        service = make_service()
+        self.embed_lengths(service)
+
+        await service.generate_embeddings(["a", "bb"])
+        embeddings = await service.generate_embeddings(["bb", "ccc", "a", "ccc"])
+
+        assert embeddings.tolist() == [[2.0], [3.0], [1.0], [3.0]]
+        assert service.client.embed.call_args_list[-1].kwargs["input"] == ["ccc"]
+
+    async def test_evicts_least_recently_used(self):
+        """Test that the cache is bounded by embedding_cache_size"""
+        service = make_service(embedding_cache_size=2)
+        self.embed_lengths(service)
+
+        await service.generate_embeddings(["a", "bb"])
+        await service.generate_embeddings(["a"])  # promote "a"
+        await service.generate_embeddings(["ccc"])  # evicts "bb"
+        await service.generate_embeddings(["a", "bb"])
+
+        assert service.client.embed.call_args_list[-1].kwargs["input"] == ["bb"]
+        assert len(service._cache) == 2
+
+    async def test_cache_disabled(self):
+        """Test that a cache size of 0 disables caching"""
+        service = make_service(embedding_cache_size=0)
+        self.embed_lengths(service)
+
+        await service.generate_embeddings(["a"])
+        await service.generate_embeddings(["a"])
+
+        assert service.client.embed.call_count == 2
+
+
+class TestGetEmbeddingService:
+    """Tests for the shared embedding service instance"""
+
+    def test_service_is_reused_for_same_settings(self):
+        """Test that the service (and its Ollama connection pool) is built once per settings"""
+        from app.embedding import get_embedding_service
+
+        settings = Settings(dummy_embeddings=False)
+
+        assert get_embedding_service(settings) is get_embedding_service(settings)
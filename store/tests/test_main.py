@@ -2,7 +2,9 @@
 Tests for main application endpoints
 """
 import pytest
+from unittest.mock import AsyncMock, patch
 from app.main import app
+from app.scrapers import LegalCodeCatalogEntry
 from fastapi.testclient import TestClient
 
 client = TestClient(app)
@@ -14,3 +16,69 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy", "version": "0.2.0"}
+
+
+@pytest.mark.unit
+def test_large_responses_are_gzipped():
+    """Test responses above the size threshold are compressed when accepted"""
+    with patch("app.routers.legal_texts.get_catalog_service") as mock_get_catalog_service:
+        mock_get_catalog_service.return_value = AsyncMock()
+        mock_get_catalog_service.return_value.get_catalog.return_value = [
+            LegalCodeCatalogEntry(
+                code=f"code{i}",
+                title=f"Gesetz Nummer {i}",
+                url=f"https://www.gesetze-im-internet.de/code{i}/xml.zip"
+            )
+            for i in range(50)
+        ]
+
+        response = client.get(
+            "/legal-texts/gesetze-im-internet/catalog",
+            headers={"Accept-Encoding": "gzip"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["count"] == 50
+
+
+@pytest.mark.unit
+def test_small_responses_are_not_gzipped():
+    """Test responses below the size threshold are sent uncompressed"""
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.unit
+def test_request_with_large_content_length_is_rejected():
+    """Test bodies declared larger than the limit are rejected before being read"""
+    from app.main import MAX_REQUEST_SIZE
+
+    response = client.post(
+        "/legal-texts/gesetze-im-internet/search",
+        content=b"x" * (MAX_REQUEST_SIZE + 1),
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 413
+    assert "too large" in response.json()["detail"]
+
+
+@pytest.mark.unit
+def test_streamed_request_over_limit_is_rejected():
+    """Test chunked bodies without Content-Length are cut off once over the limit"""
+    from app.main import MAX_REQUEST_SIZE
+
+    chunk = b"x" * (1024 * 1024)
+
+    def body():
+        for _ in range(MAX_REQUEST_SIZE // len(chunk) + 1):
+            yield chunk
+
+    response = client.post(
+        "/legal-texts/gesetze-im-internet/search",
+        content=body(),
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 413
+    assert "too large" in response.json()["detail"]
@@ -3,11 +3,26 @@ Unit tests for LegalTextRepository
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from app.repository import LegalTextRepository, LegalTextFilter
+from app.repository import LegalTextRepository, LegalTextFilter, invalidate_available_codes
 from app.models import LegalTextDB
 
 pytestmark = pytest.mark.unit
 
+# Embedding shared by the sample rows; tests only read it
+SAMPLE_VECTOR = [0.1] * 2560
+
+# Stored legal text returned by mocked queries; tests only read it
+SAMPLE_LEGAL_TEXT = LegalTextDB(
+    id=1, text="Test text", code="bgb", section="§ 1", sub_section="1", text_vector=SAMPLE_VECTOR
+)
+
+
+def scalar_result(rows):
+    """Create a mock query result whose scalars().all() returns the given rows"""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
 
 @pytest.fixture
 def mock_session():
@@ -16,6 +31,14 @@ def mock_session():
     return session
 
 
+@pytest.fixture(autouse=True)
+def clear_available_codes_cache():
+    """Start every test without cached available codes"""
+    invalidate_available_codes()
+    yield
+    invalidate_available_codes()
+
+
 @pytest.fixture
 def repository(mock_session):
     """Create a repository with mock session"""
@@ -52,70 +75,63 @@ class TestLegalTextFilter:
             LegalTextFilter(code="bgb", sub_section="1")
 
 
-class TestLegalTextRepository:
-    """Tests for LegalTextRepository methods"""
+class TestBinaryVector:
+    """Tests for the asyncpg binary vector column type"""
 
-    @pytest.mark.asyncio
-    async def test_get_legal_text_with_code_only(self, repository, mock_session):
-        """Test getting legal texts filtered by code only"""
-        # Setup mock
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [
-            LegalTextDB(id=1, text="Test", code="bgb", section="§ 1", sub_section="1", text_vector=[0.1] * 2560)
-        ]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+    def test_asyncpg_values_are_passed_through(self):
+        """Test vectors are left to the binary asyncpg codec instead of text formatting"""
+        from sqlalchemy.dialects.postgresql import asyncpg
+        from app.models import BinaryVector
 
-        # Execute
-        filter = LegalTextFilter(code="bgb")
-        result = await repository.get_legal_text(filter)
+        assert BinaryVector(3).bind_processor(asyncpg.dialect()) is None
 
-        # Verify
-        assert len(result) == 1
-        assert result[0].code == "bgb"
-        mock_session.execute.assert_called_once()
+    def test_other_drivers_use_text_format(self):
+        """Test other drivers keep pgvector's text literal"""
+        from sqlalchemy.dialects.postgresql import psycopg2
+        from app.models import BinaryVector
 
-    @pytest.mark.asyncio
-    async def test_get_legal_text_with_code_and_section(self, repository, mock_session):
-        """Test getting legal texts filtered by code and section"""
-        # Setup mock
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [
-            LegalTextDB(id=1, text="Test", code="bgb", section="§ 1", sub_section="1", text_vector=[0.1] * 2560)
-        ]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        process = BinaryVector(3).bind_processor(psycopg2.dialect())
+        assert process([1, 2, 3]) == "[1.0,2.0,3.0]"
 
-        # Execute
-        filter = LegalTextFilter(code="bgb", section="§ 1")
-        result = await repository.get_legal_text(filter)
 
-        # Verify
-        assert len(result) == 1
-        assert result[0].section == "§ 1"
+class TestLegalTextRepository:
+    """Tests for LegalTextRepository methods"""
+
+    @pytest.mark.parametrize(
+        "filter_kwargs, rows",
+        [
+            ({"code": "bgb"}, [SAMPLE_LEGAL_TEXT]),
+            ({"code": "bgb", "section": "§ 1"}, [SAMPLE_LEGAL_TEXT]),
+            ({"code": "nonexistent"}, []),
+        ],
+        ids=["code_only", "code_and_section", "no_match"],
+    )
+    async def test_get_legal_text(self, repository, mock_session, filter_kwargs, rows):
+        """Test getting legal texts filtered by the given fields"""
+        mock_session.execute.return_value = scalar_result(rows)
+
+        result = await repository.get_legal_text(LegalTextFilter(**filter_kwargs))
+
+        assert result == rows
         mock_session.execute.assert_called_once()
+        query = str(mock_session.execute.call_args.args[0])
+        for field in filter_kwargs:
+            assert f"legal_texts.{field} =" in query
+        assert "text_vector" not in query
 
-    @pytest.mark.asyncio
-    async def test_get_legal_text_returns_empty_list(self, repository, mock_session):
-        """Test getting legal texts when none match"""
-        # Setup mock
+    async def test_get_legal_text_with_pagination(self, repository, mock_session):
+        """Test limit and offset are applied to the query"""
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.scalars.return_value.all.return_value = []
         mock_session.execute.return_value = mock_result
 
-        # Execute
-        filter = LegalTextFilter(code="nonexistent")
-        result = await repository.get_legal_text(filter)
+        await repository.get_legal_text(LegalTextFilter(code="bgb"), limit=50, offset=100)
 
-        # Verify
-        assert result == []
-        mock_session.execute.assert_called_once()
+        query = mock_session.execute.call_args.args[0]
+        compiled = query.compile()
+        assert "LIMIT" in str(compiled) and "OFFSET" in str(compiled)
+        assert 50 in compiled.params.values() and 100 in compiled.params.values()
 
-    @pytest.mark.asyncio
     async def test_add_legal_text(self, repository, mock_session):
         """Test adding a single legal text"""
         # Setup
@@ -124,7 +140,7 @@ class TestLegalTextRepository:
             code="bgb",
             section="§ 1",
             sub_section="1",
-            text_vector=[0.1] * 2560
+            text_vector=SAMPLE_VECTOR
         )
 
         # Execute
@@ -136,7 +152,6 @@ class TestLegalTextRepository:
         mock_session.refresh.assert_called_once_with(legal_text)
         assert result == legal_text
 
-    @pytest.mark.asyncio
     async def test_add_legal_texts_batch_empty_list(self, repository, mock_session):
         """Test adding empty batch returns empty list"""
         # Execute
@@ -147,7 +162,6 @@ class TestLegalTextRepository:
         mock_session.execute.assert_not_called()
         mock_session.commit.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_add_legal_texts_batch(self, repository, mock_session):
         """Test adding multiple legal texts in batch"""
         # Setup
@@ -157,7 +171,7 @@ class TestLegalTextRepository:
                 code="bgb",
                 section="§ 1",
                 sub_section="1",
-                text_vector=[0.1] * 2560
+                text_vector=SAMPLE_VECTOR
             ),
             LegalTextDB(
                 text="Text 2",
@@ -176,14 +190,65 @@ class TestLegalTextRepository:
         mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_add_legal_texts_batch_dicts(self, repository, mock_session):
+        """Test upserting plain dict rows without ORM instances"""
+        rows = [
+            {
+                "text": "Text 1",
+                "text_vector": SAMPLE_VECTOR,
+                "text_hash": "abc",
+                "code": "bgb",
+                "section": "§ 1",
+                "sub_section": "1",
+            }
+        ]
+
+        count = await repository.add_legal_texts_batch_dicts(rows)
+
+        assert count == 1
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "ON CONFLICT ON CONSTRAINT uq_legal_texts_code_section_subsection" in sql
+
+    async def test_add_legal_texts_batch_dicts_is_chunked(self, repository, mock_session):
+        """Test large batches are upserted in chunks within one transaction"""
+        from app.repository import INSERT_BATCH_SIZE
+
+        rows = [
+            {"text": f"Text {i}", "text_vector": SAMPLE_VECTOR, "text_hash": str(i),
+             "code": "bgb", "section": f"§ {i}", "sub_section": "1"}
+            for i in range(2 * INSERT_BATCH_SIZE + 1)
+        ]
+
+        count = await repository.add_legal_texts_batch_dicts(rows)
+
+        assert count == len(rows)
+        assert mock_session.execute.call_count == 3
+        mock_session.commit.assert_called_once()
+
+    async def test_add_legal_texts_batch_sets_ids(self, repository, mock_session):
+        """Test IDs returned by the upsert are set on the ORM objects"""
+        legal_text = LegalTextDB(
+            text="Text 1", code="bgb", section="§ 1", sub_section="1", text_vector=SAMPLE_VECTOR
+        )
+        mock_session.execute.return_value = [(7, "bgb", "§ 1", "1")]
+
+        result = await repository.add_legal_texts_batch([legal_text])
+
+        assert result[0].id == 7
+        assert "RETURNING legal_texts.id" in str(mock_session.execute.call_args.args[0])
+
+    async def test_add_legal_texts_batch_dicts_empty_list(self, repository, mock_session):
+        """Test an empty dict batch does not hit the database"""
+        assert await repository.add_legal_texts_batch_dicts([]) == 0
+        mock_session.execute.assert_not_called()
+
     async def test_count_by_code(self, repository, mock_session):
         """Test counting legal texts by code"""
         # Setup mock
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [MagicMock(), MagicMock(), MagicMock()]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.scalar_one.return_value = 3
         mock_session.execute.return_value = mock_result
 
         # Execute
@@ -192,16 +257,14 @@ class TestLegalTextRepository:
         # Verify
         assert count == 3
         mock_session.execute.assert_called_once()
+        query = str(mock_session.execute.call_args.args[0])
+        assert "count(*)" in query
+        assert "text_vector" not in query
 
-    @pytest.mark.asyncio
     async def test_get_available_codes_returns_empty_list_when_no_data(self, repository, mock_session):
         """Test getting available codes when database is empty"""
         # Setup mock
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result([])
 
         # Execute
         codes = await repository.get_available_codes()
@@ -210,15 +273,10 @@ class TestLegalTextRepository:
         assert codes == []
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_available_codes_returns_sorted_codes(self, repository, mock_session):
         """Test getting available codes returns sorted list"""
         # Setup mock
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = ["bgb", "gg", "stgb"]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(["bgb", "gg", "stgb"])
 
         # Execute
         codes = await repository.get_available_codes()
@@ -227,83 +285,104 @@ class TestLegalTextRepository:
         assert codes == ["bgb", "gg", "stgb"]
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_semantic_search_with_cutoff(self, repository, mock_session):
-        """Test semantic search with cutoff threshold"""
-        # Setup mock
-        mock_legal_text = LegalTextDB(
-            id=1,
-            text="Test text",
-            code="bgb",
-            section="§ 1",
-            sub_section="1",
-            text_vector=[0.1] * 2560
-        )
+    async def test_get_available_codes_is_cached_until_write(self, repository, mock_session):
+        """Test available codes are served from cache until texts are written"""
         mock_result = MagicMock()
-        mock_result.all.return_value = [(mock_legal_text, 0.5)]
+        mock_result.scalars.return_value.all.return_value = ["bgb"]
         mock_session.execute.return_value = mock_result
 
-        # Execute
-        query_embedding = [0.2] * 2560
-        results = await repository.semantic_search(
-            query_embedding=query_embedding,
-            code="bgb",
-            limit=10,
-            cutoff=0.7
-        )
-
-        # Verify
-        assert len(results) == 1
-        assert results[0][0] == mock_legal_text
-        assert results[0][1] == 0.5
+        assert await repository.get_available_codes() == ["bgb"]
+        assert await repository.get_available_codes() == ["bgb"]
         mock_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_semantic_search_without_cutoff(self, repository, mock_session):
-        """Test semantic search without cutoff threshold"""
-        # Setup mock
-        mock_legal_text = LegalTextDB(
-            id=1,
-            text="Test text",
-            code="bgb",
-            section="§ 1",
-            sub_section="1",
-            text_vector=[0.1] * 2560
-        )
+        assert "WITH RECURSIVE" in str(mock_session.execute.call_args.args[0])
+
+        await repository.add_legal_texts_batch_dicts([
+            {"text": "t", "text_vector": SAMPLE_VECTOR, "text_hash": "h",
+             "code": "gg", "section": "§ 1", "sub_section": "1"}
+        ])
+        mock_result.scalars.return_value.all.return_value = ["bgb", "gg"]
+
+        assert await repository.get_available_codes() == ["bgb", "gg"]
+
+    @pytest.mark.parametrize(
+        "cutoff, rows",
+        [
+            (0.7, [(SAMPLE_LEGAL_TEXT, 0.5)]),
+            (None, [(SAMPLE_LEGAL_TEXT, 0.3)]),
+            (None, []),
+        ],
+        ids=["with_cutoff", "without_cutoff", "no_results"],
+    )
+    async def test_semantic_search(self, repository, mock_session, cutoff, rows):
+        """Test semantic search returns (text, distance) rows from a reranked HNSW query"""
         mock_result = MagicMock()
-        mock_result.all.return_value = [(mock_legal_text, 0.3)]
+        mock_result.all.return_value = rows
         mock_session.execute.return_value = mock_result
 
-        # Execute
-        query_embedding = [0.2] * 2560
         results = await repository.semantic_search(
-            query_embedding=query_embedding,
+            query_embedding=[0.2] * 2560,
             code="bgb",
-            limit=5
+            limit=10,
+            cutoff=cutoff
         )
 
-        # Verify
-        assert len(results) == 1
-        assert results[0][0] == mock_legal_text
-        assert results[0][1] == 0.3
-        mock_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_semantic_search_returns_empty_list(self, repository, mock_session):
-        """Test semantic search with no results"""
+        assert results == rows
+        assert mock_session.execute.call_count == 2
+
+        # HNSW scan settings are applied before the search query
+        settings_call, search_call = mock_session.execute.call_args_list
+        assert "hnsw.ef_search" in str(settings_call.args[0])
+        assert settings_call.args[1] == {"ef_search": "64"}
+        sql = str(search_call.args[0])
+        # Candidates come from the halfvec index, then are reranked exactly
+        assert "ORDER BY CAST(legal_texts.text_vector AS HALFVEC(2560)) <=>" in sql
+        assert "legal_texts.text_vector <=>" in sql
+        # The embedding column itself is not loaded
+        assert "legal_texts.text_vector," not in sql
+
+    async def test_semantic_search_codes(self, repository, mock_session):
+        """Test multi-code semantic search runs a single query with a subquery per code"""
         # Setup mock
+        bgb_text = LegalTextDB(
+            id=1, text="BGB text", code="bgb", section="§ 1", sub_section="1",
+            text_vector=SAMPLE_VECTOR
+        )
+        stgb_text = LegalTextDB(
+            id=2, text="StGB text", code="stgb", section="§ 2", sub_section="",
+            text_vector=SAMPLE_VECTOR
+        )
         mock_result = MagicMock()
-        mock_result.all.return_value = []
+        mock_result.all.return_value = [(stgb_text, 0.2), (bgb_text, 0.4)]
         mock_session.execute.return_value = mock_result
 
         # Execute
-        query_embedding = [0.2] * 2560
-        results = await repository.semantic_search(
-            query_embedding=query_embedding,
-            code="bgb",
-            limit=10
+        results = await repository.semantic_search_codes(
+            query_embedding=[0.2] * 2560,
+            codes=["bgb", "stgb"],
+            limit=5,
+            cutoff=0.7
         )
 
         # Verify
+        assert results == [(stgb_text, 0.2), (bgb_text, 0.4)]
+        settings_call, search_call = mock_session.execute.call_args_list
+        assert settings_call.args[1] == {"ef_search": "64"}
+        sql = str(search_call.args[0])
+        # One index-served nearest-neighbour subquery per code
+        assert "JOIN LATERAL" in sql
+        assert "WHERE legal_texts.code = codes.code" in sql
+        assert "ORDER BY CAST(legal_texts.text_vector AS HALFVEC(2560)) <=>" in sql
+        # Each code's candidates are reranked and cut off by exact distance
+        assert "WHERE (legal_texts.text_vector <=>" in sql
+        assert "ORDER BY legal_texts.text_vector <=>" in sql
+
+    async def test_semantic_search_codes_defaults_to_available_codes(self, repository, mock_session):
+        """Test multi-code search without codes searches every imported code"""
+        mock_session.execute.return_value = scalar_result([])
+
+        results = await repository.semantic_search_codes(query_embedding=[0.2] * 2560)
+
+        # No codes imported: only the distinct-codes lookup runs
         assert results == []
         mock_session.execute.assert_called_once()
+        assert "WITH RECURSIVE" in str(mock_session.execute.call_args.args[0])
@@ -13,6 +13,24 @@ from app.dependencies import get_legal_text_repository, get_embedding_service_de
 
 pytestmark = pytest.mark.unit
 
+# Embedding shared by the sample rows; tests only read it
+SAMPLE_VECTOR = [0.1] * 2560
+
+# Stored legal text returned by mocked queries; tests only read it
+SAMPLE_LEGAL_TEXT = LegalTextDB(
+    id=1, text="Test text", code="bgb", section="§ 1", sub_section="1", text_vector=SAMPLE_VECTOR
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_query_embedding_cache():
+    """Start every test without cached query embeddings"""
+    from app.routers.legal_texts import _query_embeddings
+
+    _query_embeddings.clear()
+    yield
+    _query_embeddings.clear()
+
 
 @pytest.fixture
 def mock_repository():
@@ -28,12 +46,17 @@ def mock_embedding_service():
     return service
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create one test client for the module"""
+    return TestClient(app)
+
+
 @pytest.fixture
-def client_with_mocks(mock_repository, mock_embedding_service):
-    """Create a test client with mocked dependencies"""
+def client_with_mocks(client, mock_repository, mock_embedding_service):
+    """Point the shared test client at this test's mocked dependencies"""
     app.dependency_overrides[get_legal_text_repository] = lambda: mock_repository
     app.dependency_overrides[get_embedding_service_dependency] = lambda: mock_embedding_service
-    client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
 
@@ -57,13 +80,25 @@ class TestGetAvailableCodes:
         assert response.status_code == 200
         assert response.json() == {"codes": ["bgb", "gg", "stgb"]}
 
-    def test_get_available_codes_handles_repository_error(self, client_with_mocks, mock_repository):
-        """Test endpoint handles repository errors gracefully"""
-        mock_repository.get_available_codes.side_effect = Exception("Database error")
-        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/codes")
 
-        assert response.status_code == 500
-        assert "Error fetching available codes" in response.json()["detail"]
+class TestCountLegalTexts:
+    """Tests for GET /legal-texts/gesetze-im-internet/{code}/count endpoint"""
+
+    def test_count_legal_texts(self, client_with_mocks, mock_repository):
+        """Test endpoint returns the number of stored sections"""
+        mock_repository.count_by_code.return_value = 42
+        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/BGB/count")
+
+        assert response.status_code == 200
+        assert response.json() == {"code": "bgb", "count": 42}
+        mock_repository.count_by_code.assert_called_once_with("bgb")
+
+    def test_count_legal_texts_invalid_code(self, client_with_mocks, mock_repository):
+        """Test endpoint rejects malformed codes"""
+        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/b.gb/count")
+
+        assert response.status_code == 400
+        mock_repository.count_by_code.assert_not_called()
 
 
 class TestGetLegalTexts:
@@ -71,15 +106,7 @@ class TestGetLegalTexts:
 
     def test_get_legal_texts_by_code(self, client_with_mocks, mock_repository):
         """Test getting legal texts by code only"""
-        mock_legal_text = LegalTextDB(
-            id=1,
-            text="Test text",
-            code="bgb",
-            section="§ 1",
-            sub_section="1",
-            text_vector=[0.1] * 2560
-        )
-        mock_repository.get_legal_text.return_value = [mock_legal_text]
+        mock_repository.get_legal_text.return_value = [SAMPLE_LEGAL_TEXT]
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb")
 
         assert response.status_code == 200
@@ -91,15 +118,7 @@ class TestGetLegalTexts:
 
     def test_get_legal_texts_by_code_and_section(self, client_with_mocks, mock_repository):
         """Test getting legal texts filtered by code and section"""
-        mock_legal_text = LegalTextDB(
-            id=1,
-            text="Test text",
-            code="bgb",
-            section="§ 1",
-            sub_section="1",
-            text_vector=[0.1] * 2560
-        )
-        mock_repository.get_legal_text.return_value = [mock_legal_text]
+        mock_repository.get_legal_text.return_value = [SAMPLE_LEGAL_TEXT]
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb?section=§ 1")
 
         assert response.status_code == 200
@@ -107,6 +126,16 @@ class TestGetLegalTexts:
         assert data["count"] == 1
         assert data["results"][0]["section"] == "§ 1"
 
+    def test_get_legal_texts_with_pagination(self, client_with_mocks, mock_repository):
+        """Test limit and offset are passed to the repository"""
+        mock_repository.get_legal_text.return_value = [
+            LegalTextDB(id=1, text="Test text", code="bgb", section="§ 1", sub_section="1")
+        ]
+        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb?limit=1&offset=10")
+
+        assert response.status_code == 200
+        assert mock_repository.get_legal_text.call_args.kwargs == {"limit": 1, "offset": 10}
+
     def test_get_legal_texts_with_sub_section_without_section_returns_400(self, client_with_mocks, mock_repository):
         """Test that providing sub_section without section returns 400 error"""
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb?sub_section=1")
@@ -122,14 +151,6 @@ class TestGetLegalTexts:
         assert response.status_code == 404
         assert "No legal texts found" in response.json()["detail"]
 
-    def test_get_legal_texts_handles_repository_error(self, client_with_mocks, mock_repository):
-        """Test endpoint handles repository errors"""
-        mock_repository.get_legal_text.side_effect = Exception("Database error")
-        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb")
-
-        assert response.status_code == 500
-        assert "Error querying legal texts" in response.json()["detail"]
-
 
 class TestSemanticSearchLegalTexts:
     """Tests for GET /legal-texts/gesetze-im-internet/{code}/search endpoint"""
@@ -137,17 +158,8 @@ class TestSemanticSearchLegalTexts:
     def test_semantic_search_returns_results(self, client_with_mocks, mock_repository, mock_embedding_service):
         """Test semantic search returns matching results"""
         # Setup mocks
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
-
-        mock_legal_text = LegalTextDB(
-            id=1,
-            text="Contract law text",
-            code="bgb",
-            section="§ 1",
-            sub_section="1",
-            text_vector=[0.1] * 2560
-        )
-        mock_repository.semantic_search.return_value = [(mock_legal_text, 0.3)]
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.semantic_search.return_value = [(SAMPLE_LEGAL_TEXT, 0.3)]
 
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=Vertragsrecht")
 
@@ -157,13 +169,37 @@ class TestSemanticSearchLegalTexts:
         assert data["code"] == "bgb"
         assert data["count"] == 1
         assert len(data["results"]) == 1
-        assert data["results"][0]["text"] == "Contract law text"
+        assert data["results"][0]["text"] == "Test text"
         assert data["results"][0]["similarity_score"] == 0.3
 
+    def test_semantic_search_reuses_query_embedding(self, client_with_mocks, mock_repository, mock_embedding_service):
+        """Test repeated queries (ignoring case and extra whitespace) are embedded once"""
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.semantic_search.return_value = []
+
+        for q in ["Vertragsrecht", "  vertragsrecht ", "VERTRAGSRECHT"]:
+            response = client_with_mocks.get(f"/legal-texts/gesetze-im-internet/bgb/search?q={q}")
+            assert response.status_code == 200
+
+        mock_embedding_service.generate_embeddings.assert_awaited_once_with(["Vertragsrecht"])
+        assert mock_repository.semantic_search.await_count == 3
+
+    def test_semantic_search_query_cache_is_per_model(self, client_with_mocks, mock_repository, mock_embedding_service):
+        """Test a cached query embedding is not reused after the embedding model changes"""
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.semantic_search.return_value = []
+
+        for model in ["model-a", "model-b"]:
+            mock_embedding_service.model = model
+            response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=Diebstahl")
+            assert response.status_code == 200
+
+        assert mock_embedding_service.generate_embeddings.await_count == 2
+
     def test_semantic_search_with_custom_limit(self, client_with_mocks, mock_repository, mock_embedding_service):
         """Test semantic search respects limit parameter"""
         # Setup mocks
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
         mock_repository.semantic_search.return_value = []
 
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=test&limit=5")
@@ -177,7 +213,7 @@ class TestSemanticSearchLegalTexts:
     def test_semantic_search_with_custom_cutoff(self, client_with_mocks, mock_repository, mock_embedding_service):
         """Test semantic search respects cutoff parameter"""
         # Setup mocks
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
         mock_repository.semantic_search.return_value = []
 
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=test&cutoff=0.5")
@@ -190,7 +226,7 @@ class TestSemanticSearchLegalTexts:
     def test_semantic_search_returns_empty_results(self, client_with_mocks, mock_repository, mock_embedding_service):
         """Test semantic search returns empty array when no matches"""
         # Setup mocks
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
         mock_repository.semantic_search.return_value = []
 
         response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=nonexistent")
@@ -200,167 +236,223 @@ class TestSemanticSearchLegalTexts:
         assert data["count"] == 0
         assert data["results"] == []
 
-    def test_semantic_search_handles_embedding_error(self, client_with_mocks, mock_repository, mock_embedding_service):
-        """Test semantic search handles embedding generation errors"""
-        mock_embedding_service.generate_embeddings.side_effect = Exception("Ollama connection error")
 
-        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=test")
+class TestServerErrors:
+    """Tests for endpoints turning repository and embedding failures into 500 responses"""
+
+    @pytest.mark.parametrize(
+        "url, failing_mock, method, detail",
+        [
+            ("/legal-texts/gesetze-im-internet/codes", "repository", "get_available_codes", "Error fetching available codes"),
+            ("/legal-texts/gesetze-im-internet/bgb", "repository", "get_legal_text", "Error querying legal texts"),
+            ("/legal-texts/gesetze-im-internet/bgb/search?q=test", "embedding_service", "generate_embeddings", "Error generating query embedding"),
+            ("/legal-texts/gesetze-im-internet/bgb/search?q=test", "repository", "semantic_search", "Error performing semantic search"),
+        ],
+        ids=["available_codes", "get_legal_texts", "search_embedding", "search_repository"],
+    )
+    def test_dependency_error_returns_500(self, client_with_mocks, mock_repository, mock_embedding_service, url, failing_mock, method, detail):
+        """Test an exception raised by a dependency is reported as a 500 with a descriptive detail"""
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mocks = {"repository": mock_repository, "embedding_service": mock_embedding_service}
+        getattr(mocks[failing_mock], method).side_effect = Exception("boom")
+
+        response = client_with_mocks.get(url)
 
         assert response.status_code == 500
-        assert "Error generating query embedding" in response.json()["detail"]
+        assert detail in response.json()["detail"]
 
-    def test_semantic_search_handles_repository_error(self, client_with_mocks, mock_repository, mock_embedding_service):
-        """Test semantic search handles repository errors"""
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
-        mock_repository.semantic_search.side_effect = Exception("Database error")
 
-        response = client_with_mocks.get("/legal-texts/gesetze-im-internet/bgb/search?q=test")
+class TestSemanticSearchMultipleCodes:
+    """Tests for POST /legal-texts/gesetze-im-internet/search endpoint"""
 
-        assert response.status_code == 500
-        assert "Error performing semantic search" in response.json()["detail"]
+    def test_search_multiple_codes_embeds_query_once(self, client_with_mocks, mock_repository, mock_embedding_service):
+        """Test multi-code search generates one embedding and returns merged results"""
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.semantic_search_codes.return_value = [
+            (LegalTextDB(id=2, text="Theft", code="stgb", section="§ 242", sub_section="1", text_vector=SAMPLE_VECTOR), 0.2),
+            (LegalTextDB(id=1, text="Property", code="bgb", section="§ 903", sub_section="", text_vector=SAMPLE_VECTOR), 0.4),
+        ]
+
+        response = client_with_mocks.post(
+            "/legal-texts/gesetze-im-internet/search",
+            json={"q": "Diebstahl", "codes": ["STGB", "bgb"], "limit": 5, "cutoff": 0.6}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "Diebstahl"
+        assert data["codes"] == ["stgb", "bgb"]
+        assert data["count"] == 2
+        assert [r["code"] for r in data["results"]] == ["stgb", "bgb"]
+        mock_embedding_service.generate_embeddings.assert_called_once_with(["Diebstahl"])
+        call_args = mock_repository.semantic_search_codes.call_args
+        assert call_args.kwargs["codes"] == ["stgb", "bgb"]
+        assert call_args.kwargs["limit"] == 5
+        assert call_args.kwargs["cutoff"] == 0.6
+
+    def test_search_multiple_codes_defaults_to_all_codes(self, client_with_mocks, mock_repository, mock_embedding_service):
+        """Test omitting codes searches every imported code"""
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.semantic_search_codes.return_value = []
+
+        response = client_with_mocks.post(
+            "/legal-texts/gesetze-im-internet/search",
+            json={"q": "Mietrecht"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["codes"] is None
+        assert mock_repository.semantic_search_codes.call_args.kwargs["codes"] is None
+
+    def test_search_multiple_codes_rejects_invalid_code(self, client_with_mocks, mock_repository, mock_embedding_service):
+        """Test multi-code search validates every code"""
+        response = client_with_mocks.post(
+            "/legal-texts/gesetze-im-internet/search",
+            json={"q": "test", "codes": ["bgb", "../etc"]}
+        )
+
+        assert response.status_code == 400
+        mock_repository.semantic_search_codes.assert_not_called()
 
 
 class TestImportLegalText:
     """Tests for POST /legal-texts/gesetze-im-internet/{book} endpoint"""
 
-    def test_import_legal_text_success(self, client_with_mocks, mock_repository, mock_embedding_service):
+    @pytest.fixture
+    def mock_catalog(self, monkeypatch):
+        """Replace the catalog service with a mock accepting every code"""
+        catalog = AsyncMock()
+        catalog.is_valid_code.return_value = True
+        monkeypatch.setattr("app.routers.legal_texts.get_catalog_service", lambda: catalog)
+        return catalog
+
+    @pytest.fixture
+    def mock_scraper(self, monkeypatch):
+        """Replace the scraper with a mock finding no texts"""
+        scraper = AsyncMock()
+        scraper.scrape.return_value = []
+        monkeypatch.setattr("app.routers.legal_texts.GesetzteImInternetScraper", lambda: scraper)
+        return scraper
+
+    def test_import_legal_text_success(self, client_with_mocks, mock_repository, mock_embedding_service, mock_catalog, mock_scraper):
         """Test successful legal text import"""
-        # Setup mocks
-        legal_texts = [
+        mock_scraper.scrape.return_value = [
             LegalText(text="Text 1", code="bgb", section="§ 1", sub_section="1"),
             LegalText(text="Text 2", code="bgb", section="§ 2", sub_section="1"),
         ]
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560, [0.2] * 2560]
-        mock_repository.add_legal_texts_batch.return_value = []
-
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class, \
-             patch('app.routers.legal_texts.GesetzteImInternetScraper') as mock_scraper_class:
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR, [0.2] * 2560]
+        mock_repository.add_legal_texts_batch_dicts.return_value = 0
 
-            # Mock catalog validation to pass
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.return_value = True
-            mock_catalog_class.return_value = mock_catalog
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
 
-            # Mock scraper
-            mock_scraper = MagicMock()
-            mock_scraper.scrape.return_value = legal_texts
-            mock_scraper_class.return_value = mock_scraper
+        assert response.status_code == 200
+        data = response.json()
+        assert data["code"] == "bgb"
+        assert data["texts_imported"] == 2
+        assert data["message"] == "Successfully processed legal texts for bgb"
+
+    def test_import_legal_text_in_chunks(self, client_with_mocks, mock_repository, mock_embedding_service, mock_catalog, mock_scraper, monkeypatch):
+        """Test changed texts are embedded and saved chunk by chunk, in order"""
+        monkeypatch.setattr("app.routers.legal_texts.IMPORT_CHUNK_SIZE", 2)
+        mock_scraper.scrape.return_value = [
+            LegalText(text=f"Text {i}", code="bgb", section=f"§ {i}", sub_section="1")
+            for i in range(3)
+        ]
+        mock_repository.get_existing_hashes.return_value = {}
 
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
+        async def embed(texts):
+            return [[float(text[-1])] * 2560 for text in texts]
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["code"] == "bgb"
-            assert data["texts_imported"] == 2
-            assert "Successfully imported" in data["message"]
+        mock_embedding_service.generate_embeddings.side_effect = embed
 
-    def test_import_legal_text_handles_scraping_error(self, client_with_mocks, mock_repository, mock_embedding_service):
-        """Test import handles scraping errors"""
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class, \
-             patch('app.routers.legal_texts.GesetzteImInternetScraper') as mock_scraper_class:
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
 
-            # Mock catalog validation to pass
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.return_value = True
-            mock_catalog_class.return_value = mock_catalog
+        assert response.status_code == 200
+        assert response.json()["texts_imported"] == 3
+        saved_chunks = [call.args[0] for call in mock_repository.add_legal_texts_batch_dicts.await_args_list]
+        assert [[row["section"] for row in rows] for rows in saved_chunks] == [["§ 0", "§ 1"], ["§ 2"]]
+        assert [rows[0]["text_vector"][0] for rows in saved_chunks] == [0.0, 2.0]
 
-            # Mock scraper to fail
-            mock_scraper = MagicMock()
-            mock_scraper.scrape.side_effect = Exception("Network error")
-            mock_scraper_class.return_value = mock_scraper
+    def test_import_legal_text_handles_scraping_error(self, client_with_mocks, mock_catalog, mock_scraper):
+        """Test import handles scraping errors"""
+        mock_scraper.scrape.side_effect = Exception("Network error")
 
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
 
-            assert response.status_code == 500
-            assert "Error importing document" in response.json()["detail"]
+        assert response.status_code == 500
+        assert "Error importing document" in response.json()["detail"]
 
-    def test_import_legal_text_returns_404_when_no_texts_found(self, client_with_mocks, mock_repository, mock_embedding_service):
+    def test_import_legal_text_returns_404_when_no_texts_found(self, client_with_mocks, mock_catalog, mock_scraper):
         """Test import returns 404 when scraper finds no texts"""
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class, \
-             patch('app.routers.legal_texts.GesetzteImInternetScraper') as mock_scraper_class:
-
-            # Mock catalog validation to pass
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.return_value = True
-            mock_catalog_class.return_value = mock_catalog
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/nonexistent")
 
-            # Mock scraper to return empty list
-            mock_scraper = MagicMock()
-            mock_scraper.scrape.return_value = []
-            mock_scraper_class.return_value = mock_scraper
-
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/nonexistent")
-
-            assert response.status_code == 404
-            assert "No legal texts found" in response.json()["detail"]
+        assert response.status_code == 404
+        assert "No legal texts found" in response.json()["detail"]
 
-    def test_import_legal_text_handles_embedding_error(self, client_with_mocks, mock_repository, mock_embedding_service):
+    def test_import_legal_text_handles_embedding_error(self, client_with_mocks, mock_embedding_service, mock_catalog, mock_scraper):
         """Test import handles embedding generation errors"""
-        legal_texts = [
+        mock_scraper.scrape.return_value = [
             LegalText(text="Text 1", code="bgb", section="§ 1", sub_section="1")
         ]
         mock_embedding_service.generate_embeddings.side_effect = Exception("Ollama not available")
 
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class, \
-             patch('app.routers.legal_texts.GesetzteImInternetScraper') as mock_scraper_class:
-
-            # Mock catalog validation to pass
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.return_value = True
-            mock_catalog_class.return_value = mock_catalog
-
-            # Mock scraper
-            mock_scraper = MagicMock()
-            mock_scraper.scrape.return_value = legal_texts
-            mock_scraper_class.return_value = mock_scraper
-
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
 
-            assert response.status_code == 500
-            assert "Error generating embeddings" in response.json()["detail"]
-            assert "Make sure Ollama is running" in response.json()["detail"]
+        assert response.status_code == 500
+        assert "Error generating embeddings" in response.json()["detail"]
+        assert "Make sure Ollama is running" in response.json()["detail"]
 
-    def test_import_invalid_code(self, client_with_mocks, mock_repository, mock_embedding_service):
+    def test_import_invalid_code(self, client_with_mocks, mock_catalog, mock_scraper):
         """Test import rejects invalid code from catalog"""
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class:
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.return_value = False
-            mock_catalog_class.return_value = mock_catalog
+        mock_catalog.is_valid_code.return_value = False
 
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/invalid_code")
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/invalid_code")
 
-            assert response.status_code == 400
-            assert "Invalid legal code" in response.json()["detail"]
-            assert "/catalog endpoint" in response.json()["detail"]
+        assert response.status_code == 400
+        assert "Invalid legal code" in response.json()["detail"]
+        assert "/catalog endpoint" in response.json()["detail"]
+        mock_scraper.scrape.assert_not_called()
 
-    def test_import_catalog_validation_fails_gracefully(self, client_with_mocks, mock_repository, mock_embedding_service):
+    def test_import_catalog_validation_fails_gracefully(self, client_with_mocks, mock_repository, mock_embedding_service, mock_catalog, mock_scraper):
         """Test import proceeds if catalog validation fails"""
         from app.scrapers import CatalogFetchError
 
-        legal_texts = [
+        # Catalog validation fails, but the scraper succeeds
+        mock_catalog.is_valid_code.side_effect = CatalogFetchError("Network error")
+        mock_scraper.scrape.return_value = [
             LegalText(text="Text 1", code="bgb", section="§ 1", sub_section="1"),
         ]
-        mock_embedding_service.generate_embeddings.return_value = [[0.1] * 2560]
-        mock_repository.add_legal_texts_batch.return_value = []
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
+        mock_repository.add_legal_texts_batch_dicts.return_value = 0
 
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class, \
-             patch('app.routers.legal_texts.GesetzteImInternetScraper') as mock_scraper_class:
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
 
-            # Catalog validation fails
-            mock_catalog = MagicMock()
-            mock_catalog.is_valid_code.side_effect = CatalogFetchError("Network error")
-            mock_catalog_class.return_value = mock_catalog
+        # Should succeed despite catalog validation failure
+        assert response.status_code == 200
+        assert response.json()["texts_imported"] == 1
 
-            # But scraper succeeds
-            mock_scraper = MagicMock()
-            mock_scraper.scrape.return_value = legal_texts
-            mock_scraper_class.return_value = mock_scraper
+    def test_import_skips_unchanged_merged_texts(self, client_with_mocks, mock_repository, mock_embedding_service, mock_catalog, mock_scraper):
+        """Test duplicate sections are merged before hashing, so unchanged rows are not re-embedded"""
+        from app.routers.legal_texts import compute_text_hash
 
-            response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
+        mock_scraper.scrape.return_value = [
+            LegalText(text="Part 1", code="bgb", section="§ 1", sub_section="1"),
+            LegalText(text="Part 2", code="bgb", section="§ 1", sub_section="1"),
+            LegalText(text="New", code="bgb", section="§ 2", sub_section="1"),
+        ]
+        mock_repository.get_existing_hashes.return_value = {
+            "§ 1:1": compute_text_hash("Part 1\n\nPart 2"),
+        }
+        mock_embedding_service.generate_embeddings.return_value = [SAMPLE_VECTOR]
 
-            # Should succeed despite catalog validation failure
-            assert response.status_code == 200
-            assert response.json()["texts_imported"] == 1
+        response = client_with_mocks.post("/legal-texts/gesetze-im-internet/bgb")
+
+        assert response.status_code == 200
+        assert response.json()["texts_imported"] == 1
+        assert response.json()["texts_unchanged"] == 1
+        mock_embedding_service.generate_embeddings.assert_awaited_once_with(["New"])
+        saved = mock_repository.add_legal_texts_batch_dicts.call_args.args[0]
+        assert [row["text_hash"] for row in saved] == [compute_text_hash("New")]
 
 
 class TestGetImportableCatalog:
@@ -383,10 +475,10 @@ class TestGetImportableCatalog:
             ),
         ]
 
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class:
-            mock_catalog = MagicMock()
+        with patch('app.routers.legal_texts.get_catalog_service') as mock_get_catalog_service:
+            mock_catalog = AsyncMock()
             mock_catalog.get_catalog.return_value = mock_entries
-            mock_catalog_class.return_value = mock_catalog
+            mock_get_catalog_service.return_value = mock_catalog
 
             response = client_with_mocks.get("/legal-texts/gesetze-im-internet/catalog")
 
@@ -398,12 +490,57 @@ class TestGetImportableCatalog:
             assert data["entries"][0]["title"] == "Bürgerliches Gesetzbuch"
             assert data["entries"][0]["url"] == "https://www.gesetze-im-internet.de/bgb/xml.zip"
 
+    def test_get_catalog_search_and_limit(self, client_with_mocks):
+        """Test catalog endpoint filters by search term and truncates to limit"""
+        from app.scrapers import LegalCodeCatalogEntry
+
+        mock_entries = [
+            LegalCodeCatalogEntry(
+                code="bgb",
+                title="Bürgerliches Gesetzbuch",
+                url="https://www.gesetze-im-internet.de/bgb/xml.zip"
+            ),
+            LegalCodeCatalogEntry(
+                code="stgb",
+                title="Strafgesetzbuch",
+                url="https://www.gesetze-im-internet.de/stgb/xml.zip"
+            ),
+            LegalCodeCatalogEntry(
+                code="hgb",
+                title="Handelsgesetzbuch",
+                url="https://www.gesetze-im-internet.de/hgb/xml.zip"
+            ),
+        ]
+
+        with patch('app.routers.legal_texts.get_catalog_service') as mock_get_catalog_service:
+            mock_catalog = AsyncMock()
+            mock_catalog.get_catalog.return_value = mock_entries
+            mock_get_catalog_service.return_value = mock_catalog
+
+            response = client_with_mocks.get(
+                "/legal-texts/gesetze-im-internet/catalog",
+                params={"search": "STRAF"}
+            )
+            data = response.json()
+            assert response.status_code == 200
+            assert data["count"] == 1
+            assert [e["code"] for e in data["entries"]] == ["stgb"]
+
+            response = client_with_mocks.get(
+                "/legal-texts/gesetze-im-internet/catalog",
+                params={"search": "gb", "limit": 2}
+            )
+            data = response.json()
+            assert response.status_code == 200
+            assert data["count"] == 3
+            assert [e["code"] for e in data["entries"]] == ["bgb", "stgb"]
+
     def test_get_catalog_error(self, client_with_mocks):
         """Test catalog endpoint handles errors"""
-        with patch('app.routers.legal_texts.GesetzteImInternetCatalog') as mock_catalog_class:
-            mock_catalog = MagicMock()
+        with patch('app.routers.legal_texts.get_catalog_service') as mock_get_catalog_service:
+            mock_catalog = AsyncMock()
             mock_catalog.get_catalog.side_effect = Exception("Network error")
-            mock_catalog_class.return_value = mock_catalog
+            mock_get_catalog_service.return_value = mock_catalog
 
             response = client_with_mocks.get("/legal-texts/gesetze-im-internet/catalog")
 
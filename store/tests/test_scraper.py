@@ -0,0 +1,110 @@
+# ABOUTME: Unit tests for the Gesetze im Internet scraper
+# ABOUTME: Tests downloading and parsing a code's xml.zip
+import io
+import zipfile
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.scrapers import GesetzteImInternetScraper
+from app.scrapers.http_client import close_http_client, get_http_client
+
+SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR001950896">
+  <norm>
+    <metadaten>
+      <jurabk>BGB</jurabk>
+      <enbez>§ 1</enbez>
+    </metadaten>
+    <textdaten>
+      <text format="XML">
+        <Content>
+          <P>(1) Die Rechtsfähigkeit des Menschen beginnt mit der Vollendung der Geburt.</P>
+          <P>(2) Zweiter Absatz.</P>
+        </Content>
+      </text>
+    </textdaten>
+  </norm>
+</dokumente>
+"""
+
+
+def make_zip(xml: str) -> bytes:
+    """Build an xml.zip archive like the ones served by gesetze-im-internet.de"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        zip_ref.writestr("BJNR001950896.xml", xml.encode("utf-8"))
+    return buffer.getvalue()
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    """Create an HTTP client answering requests with the given handler"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestScrape:
+    """Tests for GesetzteImInternetScraper.scrape"""
+
+    async def test_scrape_streams_and_parses_zip(self):
+        """Download the code's xml.zip and extract one legal text per paragraph"""
+        requested_urls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, content=make_zip(SAMPLE_XML))
+
+        with patch(
+            "app.scrapers.gesetze_im_internet.gesetzte_im_internet_scraper.get_http_client",
+            return_value=mock_client(handler),
+        ):
+            legal_texts = await GesetzteImInternetScraper().scrape("bgb")
+
+        assert requested_urls == ["https://www.gesetze-im-internet.de/bgb/xml.zip"]
+        assert [(lt.code, lt.section, lt.sub_section) for lt in legal_texts] == [
+            ("bgb", "§ 1", "1"),
+            ("bgb", "§ 1", "2"),
+        ]
+        assert legal_texts[1].text == "(2) Zweiter Absatz."
+
+    async def test_scrape_raises_on_http_error(self):
+        """Raise instead of parsing an error page"""
+        with patch(
+            "app.scrapers.gesetze_im_internet.gesetzte_im_internet_scraper.get_http_client",
+            return_value=mock_client(lambda request: httpx.Response(404)),
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                await GesetzteImInternetScraper().scrape("unknown")
+
+
+class TestExtractSubSection:
+    """Tests for GesetzteImInternetScraper._extract_sub_section"""
+
+    @pytest.mark.parametrize(
+        "paragraph, expected",
+        [
+            ("(1) Erster Absatz.", "1"),
+            ("(2a) Eingefügter Absatz.", "2a"),
+            ("Text ohne Absatznummer (1).", ""),
+            ("(3 ohne schließende Klammer", "3 ohne schließende Klammer"),
+            ("", ""),
+        ],
+    )
+    def test_extract_sub_section(self, paragraph, expected):
+        """Extract the leading (n) sub-section number, or an empty string"""
+        assert GesetzteImInternetScraper()._extract_sub_section(paragraph) == expected
+
+
+class TestHttpClient:
+    """Tests for the shared download client"""
+
+    async def test_client_is_shared_until_closed(self):
+        """Reuse one client (and its connections) until it is closed on shutdown"""
+        client = get_http_client()
+        assert get_http_client() is client
+
+        await close_http_client()
+
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
@@ -0,0 +1,203 @@
+# ABOUTME: Unit tests for the gii-norm XML parser
+# ABOUTME: Tests text extraction and formatted content parsing
+import json
+
+from lxml import etree
+
+from app.scrapers.gesetze_im_internet.xml_parser import GermanLegalXMLParser
+
+
+class TestExtractTextContent:
+    """Tests for GermanLegalXMLParser.extract_text_content"""
+
+    def test_nested_formatting_keeps_document_order(self):
+        """Text of nested tags and their tails is joined in document order"""
+        element = etree.fromstring("<P>(1) Der <B>Schuldner <I>hat</I> zu</B> leisten.</P>")
+
+        assert GermanLegalXMLParser().extract_text_content(element) == "(1) Der Schuldner hat zu leisten."
+
+    def test_line_breaks_and_whitespace(self):
+        """<BR> starts a new line; lines are stripped and empty lines dropped"""
+        element = etree.fromstring(
+            "<P>  Erste Zeile <B>fett</B><BR/>\n  <BR/> zweite <I>Zeile</I>  </P>"
+        )
+
+        assert GermanLegalXMLParser().extract_text_content(element) == "Erste Zeile fett\nzweite Zeile"
+
+    def test_line_breaks_keep_comment_and_pi_tails(self):
+        """Text after a comment or processing instruction is kept, their content is not"""
+        element = etree.fromstring("<P>a<BR/>b<!--zz-->c<?pi q?>d</P>")
+        assert GermanLegalXMLParser().extract_text_content(element) == "a\nbcd"
+
+        element = etree.fromstring("<P><BR/><!--c-->after</P>")
+        assert GermanLegalXMLParser().extract_text_content(element) == "after"
+
+    def test_comment_tails_match_without_line_breaks(self):
+        """The <BR> and no-<BR> paths extract comment tails the same way"""
+        element = etree.fromstring("<P>b<!--zz-->c</P>")
+
+        assert GermanLegalXMLParser().extract_text_content(element) == "bc"
+
+
+class TestParseFormattedContent:
+    """Tests for GermanLegalXMLParser.parse_formatted_content"""
+
+    def test_collects_paragraphs_tables_and_footnote_refs(self):
+        """Paragraphs, tables and footnote references are collected in document order"""
+        element = etree.fromstring(
+            "<Content>"
+            "<P>(1) Erster<FnR ID='F1'/> Absatz.</P>"
+            "<table><Title>Tabelle</Title></table>"
+            "<DL><DD><P>(2) Zweiter Absatz.<FnR ID='F2'/></P></DD></DL>"
+            "<P/>"
+            "</Content>"
+        )
+
+        formatted = GermanLegalXMLParser().parse_formatted_content(element)
+
+        assert formatted.paragraphs == ["(1) Erster Absatz.", "(2) Zweiter Absatz."]
+        assert [table.title for table in formatted.tables] == ["Tabelle"]
+        assert formatted.footnote_refs == ["F1", "F2"]
+        assert formatted.content == "(1) Erster Absatz.Tabelle(2) Zweiter Absatz."
+
+
+class TestParseStream:
+    """Tests for streaming document parsing"""
+
+    XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR001950896">
+  <norm doknr="N1">
+    <metadaten><jurabk>BGB</jurabk><enbez>\xc2\xa7 1</enbez></metadaten>
+    <textdaten><text format="XML"><Content><P>(1) Erster Absatz.</P></Content></text></textdaten>
+  </norm>
+  <norm doknr="N2">
+    <metadaten><jurabk>BGB</jurabk><enbez>\xc2\xa7 2</enbez></metadaten>
+  </norm>
+</dokumente>
+"""
+
+    def test_matches_tree_parsing(self):
+        """Streaming yields the same result as parsing the full tree"""
+        parser = GermanLegalXMLParser()
+
+        streamed = parser.parse_bytes(self.XML)
+        from_tree = parser.parse_dokumente(etree.fromstring(self.XML))
+
+        assert streamed == from_tree
+        assert streamed.builddate == "20240101"
+        assert [norm.metadaten.enbez for norm in streamed.norms] == ["§ 1", "§ 2"]
+
+    def test_keeps_whitespace_between_inline_elements(self):
+        """Blank text between inline elements of a paragraph is not dropped"""
+        xml = (
+            b"<dokumente><norm><metadaten><jurabk>BGB</jurabk></metadaten>"
+            b"<textdaten><text format='XML'><Content><P><B>fett</B> <I>kursiv</I></P>"
+            b"</Content></text></textdaten></norm></dokumente>"
+        )
+
+        norm = GermanLegalXMLParser().parse_bytes(xml).norms[0]
+
+        assert norm.textdaten.text.formatted_text.paragraphs == ["fett kursiv"]
+
+
+class TestToDict:
+    """Tests for GermanLegalXMLParser.to_dict"""
+
+    def test_converts_nested_dataclasses(self):
+        """Nested dataclasses and lists of dataclasses become plain dicts"""
+        parser = GermanLegalXMLParser()
+        dokumente = parser.parse_bytes(TestParseStream.XML)
+
+        result = parser.to_dict(dokumente)
+
+        assert result["builddate"] == "20240101"
+        assert result["norms"][0]["metadaten"]["jurabk"] == ["BGB"]
+        assert result["norms"][0]["textdaten"]["text"]["formatted_text"]["paragraphs"] == ["(1) Erster Absatz."]
+        assert result["norms"][1]["textdaten"] is None
+
+    def test_wraps_other_values(self):
+        """Values that are not dataclasses are wrapped in a dict"""
+        assert GermanLegalXMLParser().to_dict("text") == {"value": "text"}
+
+
+class TestToJson:
+    """Tests for GermanLegalXMLParser.to_json"""
+
+    def test_matches_to_dict(self):
+        """The JSON output decodes to the same structure as to_dict()"""
+        parser = GermanLegalXMLParser()
+        dokumente = parser.parse_bytes(TestParseStream.XML)
+
+        assert json.loads(parser.to_json(dokumente)) == parser.to_dict(dokumente)
+
+
+class TestParseTable:
+    """Tests for GermanLegalXMLParser.parse_table"""
+
+    TABLE = "<table><Title>Gebühren</Title><tgroup><row><entry>1</entry></row></tgroup></table>"
+
+    def test_captures_table_xml_by_default(self):
+        """The table's XML is kept in raw_content"""
+        table = GermanLegalXMLParser().parse_table(etree.fromstring(self.TABLE))
+
+        assert table.title == "Gebühren"
+        assert table.raw_content == self.TABLE
+
+    def test_table_xml_excludes_tail(self):
+        """Text after the table is not part of its XML"""
+        content = etree.fromstring(f"<Content>{self.TABLE} nach der Tabelle</Content>")
+
+        table = GermanLegalXMLParser().parse_table(content[0])
+
+        assert table.raw_content == self.TABLE
+
+    def test_skips_table_xml_when_disabled(self):
+        """No XML is serialized when capture_table_xml is off"""
+        table = GermanLegalXMLParser(capture_table_xml=False).parse_table(etree.fromstring(self.TABLE))
+
+        assert table.title == "Gebühren"
+        assert table.raw_content is None
+
+
+class TestParseString:
+    """Tests for GermanLegalXMLParser.parse_string"""
+
+    def test_with_and_without_xml_declaration(self):
+        """Strings parse the same with or without an encoding declaration"""
+        parser = GermanLegalXMLParser()
+        xml = TestParseStream.XML.decode("utf-8")
+        without_declaration = xml.split("?>", 1)[1]
+
+        assert parser.parse_string(xml) == parser.parse_string(without_declaration)
+        assert len(parser.parse_string(without_declaration).norms) == 2
+
+
+class TestParseFundstelle:
+    """Tests for GermanLegalXMLParser.parse_fundstelle"""
+
+    def test_optional_anlageabgabe_fields(self):
+        """Present fields are stripped; missing or empty ones stay None"""
+        element = etree.fromstring(
+            "<fundstelle typ='amtlich'><periodikum>BGBl I</periodikum><zitstelle>2002, 42</zitstelle>"
+            "<anlageabgabe><anlagedat> 2002-01-02 </anlagedat><dokst/></anlageabgabe></fundstelle>"
+        )
+
+        fundstelle = GermanLegalXMLParser().parse_fundstelle(element)
+
+        assert (fundstelle.periodikum, fundstelle.zitstelle, fundstelle.typ) == ("BGBl I", "2002, 42", "amtlich")
+        assert (fundstelle.anlagedat, fundstelle.dokst, fundstelle.abgabedat) == ("2002-01-02", None, None)
+
+
+class TestParseGliederungseinheit:
+    """Tests for GermanLegalXMLParser.parse_gliederungseinheit"""
+
+    def test_requires_kennzahl(self):
+        """A unit without gliederungskennzahl text is skipped"""
+        parser = GermanLegalXMLParser()
+
+        assert parser.parse_gliederungseinheit(etree.fromstring("<g><gliederungskennzahl/></g>")) is None
+
+        gliederung = parser.parse_gliederungseinheit(
+            etree.fromstring("<g><gliederungskennzahl>010</gliederungskennzahl><gliederungsbez>Buch 1</gliederungsbez></g>")
+        )
+        assert (gliederung.gliederungskennzahl, gliederung.gliederungsbez) == ("010", "Buch 1")
@@ -0,0 +1,47 @@
+# ABOUTME: Shared fixtures for CLI tests
+# ABOUTME: Keeps tests off the user's on-disk response cache and cached config
+
+import pytest
+from unittest.mock import MagicMock
+from cli.config import get_api_url
+
+# Command modules that create a LegalMCPClient
+CLIENT_MODULES = (
+    "cli.commands.import_cmd",
+    "cli.commands.list_cmd",
+    "cli.commands.query_cmd",
+    "cli.commands.search_cmd",
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_response_cache(monkeypatch):
+    """Disable the on-disk response cache unless a test opts in"""
+    monkeypatch.setenv("LEGAL_MCP_CACHE_DIR", "")
+
+
+@pytest.fixture(autouse=True)
+def reset_api_url_cache():
+    """Re-read LEGAL_API_BASE_URL in every test"""
+    get_api_url.cache_clear()
+    yield
+    get_api_url.cache_clear()
+
+
+@pytest.fixture
+def mock_client_class(monkeypatch):
+    """Replace LegalMCPClient in all command modules with a mock class"""
+    client_class = MagicMock()
+    # The client is used as a context manager yielding itself
+    client = client_class.return_value
+    client.__enter__.return_value = client
+    client.__exit__.return_value = None
+    for module in CLIENT_MODULES:
+        monkeypatch.setattr(f"{module}.LegalMCPClient", client_class)
+    return client_class
+
+
+@pytest.fixture
+def mock_client(mock_client_class):
+    """Mock client instance the commands get from LegalMCPClient(...)"""
+    return mock_client_class.return_value
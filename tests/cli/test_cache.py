@@ -0,0 +1,111 @@
+# ABOUTME: Tests for CLI response cache
+# ABOUTME: Validates TTL handling, validators and invalidation on disk
+
+import pytest
+from unittest.mock import Mock, patch
+from cli.cache import ResponseCache
+from cli.client import LegalMCPClient
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temporary directory"""
+    return ResponseCache(tmp_path / "cache")
+
+
+def test_make_key_is_stable_across_param_order():
+    """Test that cache keys don't depend on param ordering"""
+    key_a = ResponseCache.make_key("http://api/x", {"a": 1, "b": 2})
+    key_b = ResponseCache.make_key("http://api/x", {"b": 2, "a": 1})
+
+    assert key_a == key_b
+    assert key_a != ResponseCache.make_key("http://api/y", {"a": 1, "b": 2})
+
+
+def test_set_then_get_returns_fresh_entry(cache):
+    """Test that stored entries round-trip and are fresh within the TTL"""
+    cache.set("key", {"codes": ["bgb"]}, etag='"abc"')
+
+    entry = cache.get("key")
+
+    assert entry["data"] == {"codes": ["bgb"]}
+    assert entry["etag"] == '"abc"'
+    assert cache.is_fresh(entry)
+
+
+def test_entry_expires_after_ttl(tmp_path):
+    """Test that entries older than the TTL are stale"""
+    cache = ResponseCache(tmp_path, ttl=0)
+    cache.set("key", {"codes": []})
+
+    assert not cache.is_fresh(cache.get("key"))
+
+
+def test_get_missing_or_corrupt_entry_returns_none(cache):
+    """Test that missing and unreadable entries are treated as misses"""
+    assert cache.get("missing") is None
+
+    cache.cache_dir.mkdir(parents=True)
+    (cache.cache_dir / "corrupt.json").write_text("{not json")
+
+    assert cache.get("corrupt") is None
+
+
+def test_conditional_headers_use_validators():
+    """Test that stale entries are revalidated with their validators"""
+    headers = ResponseCache.conditional_headers(
+        {"etag": '"abc"', "last_modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+
+    assert headers == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert ResponseCache.conditional_headers(None) == {}
+
+
+def test_invalidate_removes_entry(cache):
+    """Test that invalidate deletes the entry"""
+    cache.set("key", {"codes": ["bgb"]})
+    cache.invalidate("key")
+
+    assert cache.get("key") is None
+
+
+def test_client_serves_catalog_from_cache(tmp_path, monkeypatch):
+    """Test that a second list_catalog call is served without a request"""
+    monkeypatch.setenv("LEGAL_MCP_CACHE_DIR", str(tmp_path))
+
+    with patch("httpx.Client") as mock_client_class:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'{"count": 0, "entries": []}'
+        mock_client_class.return_value.get.return_value = mock_response
+
+        client = LegalMCPClient()
+        first = client.list_catalog()
+        second = client.list_catalog()
+
+    assert first == second == {"count": 0, "entries": []}
+    mock_client_class.return_value.get.assert_called_once()
+
+
+def test_client_import_invalidates_codes_cache(tmp_path, monkeypatch):
+    """Test that importing a code drops the cached codes list"""
+    monkeypatch.setenv("LEGAL_MCP_CACHE_DIR", str(tmp_path))
+
+    with patch("httpx.Client") as mock_client_class:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'{"codes": ["bgb"]}'
+        mock_client_class.return_value.get.return_value = mock_response
+        mock_client_class.return_value.post.return_value = mock_response
+
+        client = LegalMCPClient()
+        client.list_codes()
+        client.import_code("stgb")
+        client.list_codes()
+
+    assert mock_client_class.return_value.get.call_count == 2
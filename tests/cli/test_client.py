@@ -4,13 +4,13 @@
 import pytest
 from unittest.mock import Mock, patch
 import httpx
-from cli.client import LegalMCPClient
+from cli.client import AsyncLegalMCPClient, LegalMCPClient, get_client, _client_options
 
 
 @pytest.fixture
 def mock_httpx_client():
     """Create a mock httpx.Client for testing"""
-    with patch("cli.client.httpx.Client") as mock_client_class:
+    with patch("httpx.Client") as mock_client_class:
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         yield mock_client
@@ -18,12 +18,13 @@ def mock_httpx_client():
 
 def test_client_initialization_with_default_url():
     """Test that client initializes with default URL"""
-    with patch("cli.client.httpx.Client") as mock_client_class:
+    with patch("httpx.Client") as mock_client_class:
         client = LegalMCPClient()
 
         mock_client_class.assert_called_once_with(
             base_url="http://localhost:8000",
-            timeout=300.0
+            http2=True,
+            **_client_options()
         )
 
 
@@ -31,12 +32,13 @@ def test_client_initialization_with_custom_url():
     """Test that client initializes with custom URL"""
     custom_url = "http://custom-api:9999"
 
-    with patch("cli.client.httpx.Client") as mock_client_class:
+    with patch("httpx.Client") as mock_client_class:
         client = LegalMCPClient(base_url=custom_url)
 
         mock_client_class.assert_called_once_with(
             base_url=custom_url,
-            timeout=300.0
+            http2=True,
+            **_client_options()
         )
 
 
@@ -78,7 +80,7 @@ def test_health_check_returns_false_on_exception(mock_httpx_client):
 def test_list_codes_returns_codes_list(mock_httpx_client):
     """Test that list_codes returns list of codes from API"""
     mock_response = Mock()
-    mock_response.json.return_value = {"codes": ["bgb", "stgb", "gg"]}
+    mock_response.content = b'{"codes": ["bgb", "stgb", "gg"]}'
     mock_httpx_client.get.return_value = mock_response
 
     client = LegalMCPClient()
@@ -118,3 +120,92 @@ def test_client_close_method(mock_httpx_client):
     client.close()
 
     mock_httpx_client.close.assert_called_once()
+
+
+def test_get_client_reuses_client_per_base_url(mock_httpx_client):
+    """Test that get_client memoizes one client per base URL"""
+    with patch("cli.client._clients", {}), patch("cli.client.atexit.register") as mock_register:
+        first = get_client("http://shared:8000")
+        second = get_client("http://shared:8000")
+        other = get_client("http://other:8000")
+
+    assert first is second
+    assert other is not first
+    assert mock_register.call_count == 2
+
+
+def test_iter_query_results_streams_items():
+    """Test that iter_query_results yields items parsed from the streamed body"""
+    def handler(request):
+        assert request.url.params["section"] == "§ 1"
+        return httpx.Response(200, json={
+            "count": 2,
+            "results": [
+                {"section": "§ 1", "sub_section": "1", "text": "Erster Absatz"},
+                {"section": "§ 1", "sub_section": "2", "text": "Zweiter Absatz"}
+            ]
+        })
+
+    client = LegalMCPClient()
+    client.client = httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler))
+
+    items = list(client.iter_query_results("bgb", section="§ 1"))
+
+    assert [item["sub_section"] for item in items] == ["1", "2"]
+    assert items[0]["text"] == "Erster Absatz"
+
+
+def test_iter_query_results_raises_on_http_error():
+    """Test that iter_query_results raises HTTPStatusError on API error"""
+    client = LegalMCPClient()
+    client.client = httpx.Client(
+        base_url="http://test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(404))
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        list(client.iter_query_results("unknown"))
+
+
+def test_batch_query_returns_results_in_section_order():
+    """Test that batch_query issues one request per section and keeps order"""
+    seen_sections = []
+
+    def handler(request):
+        section = request.url.params["section"]
+        seen_sections.append(section)
+        return httpx.Response(200, json={"count": 1, "results": [{"section": section}]})
+
+    client = LegalMCPClient()
+    client.client = httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler))
+
+    results = client.batch_query("bgb", ["§ 1", "§ 433"])
+
+    assert seen_sections == ["§ 1", "§ 433"]
+    assert [r["results"][0]["section"] for r in results] == ["§ 1", "§ 433"]
+
+
+def test_async_search_batch_returns_results_in_order():
+    """Test that search_batch runs every search and keeps the input order"""
+    import asyncio
+
+    def handler(request):
+        return httpx.Response(200, json={
+            "code": request.url.path.split("/")[-2],
+            "query": request.url.params["q"],
+            "count": 0,
+            "results": []
+        })
+
+    async def run():
+        client = AsyncLegalMCPClient()
+        client.client = httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+        async with client:
+            return await client.search_batch([
+                {"code": "bgb", "query": "Kaufvertrag"},
+                {"code": "stgb", "query": "Diebstahl"}
+            ])
+
+    results = asyncio.run(run())
+
+    assert [(r["code"], r["query"]) for r in results] == [("bgb", "Kaufvertrag"), ("stgb", "Diebstahl")]
@@ -33,3 +33,15 @@ def test_get_api_url_with_empty_env_var_uses_default(monkeypatch):
     url = get_api_url()
 
     assert url == "http://localhost:8000"
+
+
+def test_get_api_url_is_cached_until_cleared(monkeypatch):
+    """Test that get_api_url caches the resolved URL"""
+    monkeypatch.setenv("LEGAL_API_BASE_URL", "http://first:8000")
+    assert get_api_url() == "http://first:8000"
+
+    monkeypatch.setenv("LEGAL_API_BASE_URL", "http://second:8000")
+    assert get_api_url() == "http://first:8000"
+
+    get_api_url.cache_clear()
+    assert get_api_url() == "http://second:8000"
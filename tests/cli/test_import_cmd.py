@@ -1,37 +1,36 @@
 # ABOUTME: Tests for import CLI command
 # ABOUTME: Validates import behavior with mocked client
 
+import threading
+import time
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+import httpx
 import typer
-from typer.testing import CliRunner
+from typer.main import get_command
+from click.testing import CliRunner
 from cli.commands.import_cmd import import_codes
 
 
 runner = CliRunner()
 
-# Create a Typer app for testing that wraps the command function
+# Create a Typer app for testing that wraps the command function, converted
+# to a click command once instead of on every invoke
 _test_app = typer.Typer()
 _test_app.command()(import_codes)
+_test_cmd = get_command(_test_app)
 
+# API responses for successful imports
+BGB_IMPORT_RESPONSE = {"message": "Successfully imported bgb", "texts_imported": 2385, "code": "bgb"}
+STGB_IMPORT_RESPONSE = {"message": "Successfully imported stgb", "texts_imported": 358, "code": "stgb"}
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_single_code_success(mock_client_class):
+
+def test_import_single_code_success(mock_client):
     """Test importing a single code successfully"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.import_code.return_value = {
-        "message": "Successfully imported bgb",
-        "texts_imported": 2385,
-        "code": "bgb"
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+    mock_client.import_code.return_value = BGB_IMPORT_RESPONSE
 
     # Run command
-    result = runner.invoke(_test_app, ["--code", "bgb"])
+    result = runner.invoke(_test_cmd, ["--code", "bgb"])
 
     # Verify success
     assert result.exit_code == 0
@@ -39,22 +38,12 @@ def test_import_single_code_success(mock_client_class):
     mock_client.import_code.assert_called_once_with("bgb")
 
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_multiple_codes_success(mock_client_class):
+def test_import_multiple_codes_success(mock_client):
     """Test importing multiple codes successfully"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.import_code.side_effect = [
-        {"message": "Successfully imported bgb", "texts_imported": 2385, "code": "bgb"},
-        {"message": "Successfully imported stgb", "texts_imported": 358, "code": "stgb"}
-    ]
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+    mock_client.import_code.side_effect = [BGB_IMPORT_RESPONSE, STGB_IMPORT_RESPONSE]
 
     # Run command
-    result = runner.invoke(_test_app, ["--code", "bgb", "--code", "stgb"])
+    result = runner.invoke(_test_cmd, ["--code", "bgb", "--code", "stgb"])
 
     # Verify success
     assert result.exit_code == 0
@@ -63,128 +52,103 @@ def test_import_multiple_codes_success(mock_client_class):
     assert mock_client.import_code.call_count == 2
 
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_api_unreachable(mock_client_class):
+def test_import_api_unreachable(mock_client):
     """Test import command when API is unreachable"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = False
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+    mock_client.import_code.side_effect = httpx.ConnectError("Connection refused")
 
     # Run command
-    result = runner.invoke(_test_app, ["--code", "bgb"])
+    result = runner.invoke(_test_cmd, ["--code", "bgb"])
 
     # Verify failure
     assert result.exit_code == 1
     assert "Error: Store API not reachable" in result.stdout
 
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_with_json_output(mock_client_class):
+def test_import_with_json_output(mock_client):
     """Test import command with JSON output"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.import_code.return_value = {
-        "message": "Successfully imported bgb",
-        "texts_imported": 2385,
-        "code": "bgb"
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+    mock_client.import_code.return_value = BGB_IMPORT_RESPONSE
 
     # Run command with --json flag
-    result = runner.invoke(_test_app, ["--code", "bgb", "--json"])
+    result = runner.invoke(_test_cmd, ["--code", "bgb", "--json"])
 
     # Verify success and JSON output
     assert result.exit_code == 0
     assert "bgb" in result.stdout
 
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_validation_error_404(mock_client_class):
-    """Test import command with 404 validation error"""
-    import httpx
-
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-
-    # Create a mock 404 response
+@pytest.mark.parametrize(
+    "status_code, detail",
+    [(404, "Code not found"), (500, "Internal server error")],
+    ids=["validation_error_404", "server_error_500"],
+)
+def test_import_http_error(mock_client, status_code, detail):
+    """Test import command when the API answers with an error status"""
     mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.json.return_value = {"detail": "Code not found"}
+    mock_response.status_code = status_code
+    mock_response.json.return_value = {"detail": detail}
 
     mock_client.import_code.side_effect = httpx.HTTPStatusError(
-        "404 Not Found",
+        f"{status_code} Error",
         request=MagicMock(),
         response=mock_response
     )
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
 
     # Run command
-    result = runner.invoke(_test_app, ["--code", "invalid"])
+    result = runner.invoke(_test_cmd, ["--code", "bgb"])
 
     # Verify failure
     assert result.exit_code == 1
     assert "Error" in result.stdout or "error" in result.stdout.lower()
 
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_server_error_500(mock_client_class):
-    """Test import command with 500 server error"""
-    import httpx
+def test_import_with_custom_api_url(mock_client_class, mock_client):
+    """Test import command with custom API URL"""
+    mock_client.import_code.return_value = BGB_IMPORT_RESPONSE
 
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
+    # Run command with custom API URL
+    custom_url = "http://custom:9999"
+    result = runner.invoke(_test_cmd, ["--code", "bgb", "--api-url", custom_url])
 
-    # Create a mock 500 response
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_response.json.return_value = {"detail": "Internal server error"}
+    # Verify client was initialized with custom URL
+    mock_client_class.assert_called_with(custom_url)
+    assert result.exit_code == 0
 
-    mock_client.import_code.side_effect = httpx.HTTPStatusError(
-        "500 Internal Server Error",
-        request=MagicMock(),
-        response=mock_response
-    )
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
 
-    # Run command
-    result = runner.invoke(_test_app, ["--code", "bgb"])
+def test_import_multiple_codes_json_preserves_requested_order(mock_client):
+    """Test that concurrent imports are reported in the order they were requested"""
+    import json
 
-    # Verify failure
-    assert result.exit_code == 1
-    assert "Error" in result.stdout or "error" in result.stdout.lower()
+    mock_client.import_code.side_effect = lambda code: {"code": code, "texts_imported": 1}
 
+    # Run command with --json flag
+    result = runner.invoke(_test_cmd, ["--code", "stgb", "--code", "bgb", "--code", "gg", "--json"])
 
-@patch("cli.commands.import_cmd.LegalMCPClient")
-def test_import_with_custom_api_url(mock_client_class):
-    """Test import command with custom API URL"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.import_code.return_value = {
-        "message": "Successfully imported bgb",
-        "texts_imported": 2385,
-        "code": "bgb"
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+    # Verify results are ordered by request, not completion
+    assert result.exit_code == 0
+    assert [entry["code"] for entry in json.loads(result.stdout)] == ["stgb", "bgb", "gg"]
 
-    # Run command with custom API URL
-    custom_url = "http://custom:9999"
-    result = runner.invoke(_test_app, ["--code", "bgb", "--api-url", custom_url])
 
-    # Verify client was initialized with custom URL
-    mock_client_class.assert_called_with(custom_url)
-    assert result.exit_code == 0
+def test_import_failure_waits_for_running_imports(mock_client):
+    """Test that after a failure, running imports finish before the client is closed"""
+    events = []
+    stgb_started = threading.Event()
+
+    def import_code(code):
+        if code == "bgb":
+            # Fail while the stgb import is still running
+            stgb_started.wait(timeout=1)
+            raise Exception("Import failed")
+        stgb_started.set()
+        time.sleep(0.05)
+        events.append(f"{code} finished")
+        return {"code": code, "texts_imported": 1}
+
+    mock_client.import_code.side_effect = import_code
+    mock_client.__exit__.side_effect = lambda *args: events.append("client closed")
+
+    # Run command
+    result = runner.invoke(_test_cmd, ["--code", "bgb", "--code", "stgb"])
+
+    # Verify failure, and that the client outlived the running import
+    assert result.exit_code == 1
+    assert events == ["stgb finished", "client closed"]
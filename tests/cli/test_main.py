@@ -26,3 +26,19 @@ def test_app_has_list_command():
     # Note: There's a known typer/rich compatibility issue that causes exit code 1
     # but the help message still displays correctly
     assert "list" in result.stdout.lower() or "Usage:" in result.stdout
+
+
+@pytest.mark.parametrize("command", ["import", "query", "search"])
+def test_app_resolves_lazy_commands(command):
+    """Test that lazily loaded commands are resolved and show their help"""
+    result = runner.invoke(app, [command, "--help"])
+
+    assert "Usage:" in result.stdout
+    assert "--api-url" in result.stdout
+
+
+def test_app_rejects_unknown_command():
+    """Test that unknown commands are reported as errors"""
+    result = runner.invoke(app, ["bogus"])
+
+    assert result.exit_code != 0
@@ -5,7 +5,8 @@ import json
 import pytest
 from io import StringIO
 from unittest.mock import patch
-from cli.output import print_json, print_codes_list
+from rich.console import Console
+from cli.output import print_json, print_codes_list, print_query_results, print_search_results
 
 
 def test_print_json_outputs_formatted_json(capsys):
@@ -59,3 +60,57 @@ def test_print_codes_list_handles_single_code(capsys):
     captured = capsys.readouterr()
     assert "bgb" in captured.out
     assert "1" in captured.out
+
+
+def test_print_query_results_writes_tsv_when_piped(capsys):
+    """Test that query results are written as tab-separated lines when not a terminal"""
+    results = {
+        "count": 1,
+        "results": [{"section": "§ 1", "sub_section": "1", "text": "Die Rechtsfähigkeit\ndes Menschen"}]
+    }
+
+    print_query_results(results)
+
+    captured = capsys.readouterr()
+    assert captured.out == "§ 1\t1\tDie Rechtsfähigkeit des Menschen\n"
+
+
+def test_print_search_results_renders_table_on_terminal():
+    """Test that search results render as a titled table on a terminal"""
+    buffer = StringIO()
+    results = {
+        "query": "Kaufvertrag",
+        "code": "bgb",
+        "count": 1,
+        "results": [{"section": "§ 433", "sub_section": "1", "similarity_score": 0.9512, "text": "[Kauf]"}]
+    }
+
+    with patch("cli.output.console", Console(file=buffer, force_terminal=True, width=120)):
+        print_search_results(results)
+
+    output = buffer.getvalue()
+    assert "Search Results for 'Kaufvertrag'" in output
+    assert "§ 433" in output
+    assert "0.951" in output
+    # Cell text is not interpreted as Rich markup
+    assert "[Kauf]" in output
+
+
+def test_print_query_results_empty_skips_table():
+    """Test that empty query results print a one-line notice instead of a table"""
+    buffer = StringIO()
+
+    with patch("cli.output.console", Console(file=buffer, force_terminal=True, color_system=None)):
+        print_query_results({"results": iter([])})
+
+    assert "No query results (Count: 0)" in buffer.getvalue()
+
+
+def test_print_json_writes_plain_json_when_piped(capsys):
+    """Test that print_json writes indented, uncolored JSON when not a terminal"""
+    print_json({"code": "bgb", "title": "Bürgerliches Gesetzbuch"})
+
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {"code": "bgb", "title": "Bürgerliches Gesetzbuch"}
+    assert "\x1b[" not in captured.out
+    assert '  "code": "bgb"' in captured.out
@@ -2,185 +2,123 @@
 # ABOUTME: Validates search behavior with mocked client
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
+import httpx
 import typer
-from typer.testing import CliRunner
+from typer.main import get_command
+from click.testing import CliRunner
 from cli.commands.search_cmd import search_texts
+from cli.config import DEFAULT_API_URL
 
 
 runner = CliRunner()
 
-# Create a Typer app for testing that wraps the command function
+# Create a Typer app for testing that wraps the command function, converted
+# to a click command once instead of on every invoke
 _test_app = typer.Typer()
 _test_app.command()(search_texts)
-
-
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_success(mock_client_class):
-    """Test searching texts successfully"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.return_value = {
-        "code": "bgb",
-        "query": "Kaufvertrag",
-        "count": 2,
-        "results": [
-            {"section": "§ 433", "sub_section": "1", "text": "Sample text about contract", "similarity_score": 0.95},
-            {"section": "§ 434", "sub_section": "", "text": "Another text", "similarity_score": 0.85}
-        ]
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+_test_cmd = get_command(_test_app)
+
+# API response for a search for "Kaufvertrag" in bgb
+SEARCH_RESPONSE = {
+    "code": "bgb",
+    "query": "Kaufvertrag",
+    "count": 2,
+    "results": [
+        {"section": "§ 433", "sub_section": "1", "text": "Sample text about contract", "similarity_score": 0.95},
+        {"section": "§ 434", "sub_section": "", "text": "Another text", "similarity_score": 0.85}
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "args, expected_call, expected_url",
+    [
+        (["bgb", "Kaufvertrag"], ("bgb", "Kaufvertrag", 10, 0.7), DEFAULT_API_URL),
+        (["bgb", "Kaufvertrag", "--limit", "5"], ("bgb", "Kaufvertrag", 5, 0.7), DEFAULT_API_URL),
+        (["bgb", "Kaufvertrag", "--cutoff", "0.5"], ("bgb", "Kaufvertrag", 10, 0.5), DEFAULT_API_URL),
+        (["bgb", "Kaufvertrag", "--json"], ("bgb", "Kaufvertrag", 10, 0.7), DEFAULT_API_URL),
+        (
+            ["bgb", "Kaufvertrag", "--api-url", "http://custom:9999"],
+            ("bgb", "Kaufvertrag", 10, 0.7),
+            "http://custom:9999",
+        ),
+    ],
+    ids=["defaults", "custom_limit", "custom_cutoff", "json_output", "custom_api_url"],
+)
+def test_search_success(monkeypatch, mock_client_class, mock_client, args, expected_call, expected_url):
+    """Test searching texts successfully with default and custom options"""
+    monkeypatch.delenv("LEGAL_API_BASE_URL", raising=False)
+    mock_client.search_texts.return_value = SEARCH_RESPONSE
 
     # Run command
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag"])
+    result = runner.invoke(_test_cmd, args)
 
     # Verify success
     assert result.exit_code == 0
     assert "§ 433" in result.stdout
     assert "§ 434" in result.stdout
-    mock_client.search_texts.assert_called_once_with("bgb", "Kaufvertrag", 10, 0.7)
-
-
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_with_custom_limit(mock_client_class):
-    """Test searching with custom limit"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.return_value = {
-        "code": "bgb",
-        "query": "Kaufvertrag",
-        "count": 1,
-        "results": [
-            {"section": "§ 433", "sub_section": "1", "text": "Sample text", "similarity_score": 0.95}
-        ]
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
-
-    # Run command
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag", "--limit", "5"])
-
-    # Verify success
-    assert result.exit_code == 0
-    mock_client.search_texts.assert_called_once_with("bgb", "Kaufvertrag", 5, 0.7)
+    mock_client_class.assert_called_once_with(expected_url)
+    mock_client.search_texts.assert_called_once_with(*expected_call)
 
 
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_with_custom_cutoff(mock_client_class):
-    """Test searching with custom similarity cutoff"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.return_value = {
-        "code": "bgb",
-        "query": "Kaufvertrag",
-        "count": 1,
-        "results": [
-            {"section": "§ 433", "sub_section": "1", "text": "Sample text", "similarity_score": 0.95}
-        ]
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+def test_search_api_unreachable(mock_client):
+    """Test search command when API is unreachable"""
+    mock_client.search_texts.side_effect = httpx.ConnectError("Connection refused")
 
     # Run command
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag", "--cutoff", "0.5"])
+    result = runner.invoke(_test_cmd, ["bgb", "Kaufvertrag"])
 
-    # Verify success
-    assert result.exit_code == 0
-    mock_client.search_texts.assert_called_once_with("bgb", "Kaufvertrag", 10, 0.5)
+    # Verify failure
+    assert result.exit_code == 1
+    assert "Error: Store API not reachable" in result.stdout
 
 
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_api_unreachable(mock_client_class):
-    """Test search command when API is unreachable"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = False
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+def test_search_handles_exception(mock_client):
+    """Test search command handles exceptions gracefully"""
+    # Setup mock client that raises exception with context manager support
+    mock_client.search_texts.side_effect = Exception("Network error")
 
     # Run command
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag"])
+    result = runner.invoke(_test_cmd, ["bgb", "Kaufvertrag"])
 
     # Verify failure
     assert result.exit_code == 1
-    assert "Error: Store API not reachable" in result.stdout
+    assert "Error:" in result.stdout
 
 
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_with_json_output(mock_client_class):
-    """Test search command with JSON output"""
-    # Setup mock client with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.return_value = {
-        "code": "bgb",
-        "query": "Kaufvertrag",
-        "count": 1,
-        "results": [
-            {"section": "§ 433", "sub_section": "1", "text": "Sample text", "similarity_score": 0.95}
-        ]
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
+def test_search_requires_code_and_query_without_batch_file():
+    """Test search command rejects missing arguments when no batch file is given"""
+    result = runner.invoke(_test_cmd, ["bgb"])
 
-    # Run command with --json flag
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag", "--json"])
+    assert result.exit_code == 1
+    assert "CODE and QUERY are required" in result.stdout
 
-    # Verify success and JSON output
-    assert result.exit_code == 0
-    assert "§ 433" in result.stdout
 
+def test_search_with_batch_file(monkeypatch, tmp_path):
+    """Test search command runs all searches from a batch file"""
+    batch_file = tmp_path / "searches.json"
+    batch_file.write_text(
+        '[{"code": "bgb", "query": "Kaufvertrag"}, {"code": "stgb", "query": "Diebstahl"}]',
+        encoding="utf-8"
+    )
 
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_with_custom_api_url(mock_client_class):
-    """Test search command with custom API URL"""
-    # Setup mock client with context manager support
     mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.return_value = {
-        "code": "bgb",
-        "query": "Kaufvertrag",
-        "count": 1,
-        "results": [
-            {"section": "§ 433", "sub_section": "1", "text": "Sample text", "similarity_score": 0.95}
-        ]
-    }
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
-
-    # Run command with custom API URL
-    custom_url = "http://custom:9999"
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag", "--api-url", custom_url])
-
-    # Verify client was initialized with custom URL
-    mock_client_class.assert_called_with(custom_url)
-    assert result.exit_code == 0
+    mock_client.search_batch = AsyncMock(return_value=[
+        {"code": "bgb", "query": "Kaufvertrag", "count": 0, "results": []},
+        {"code": "stgb", "query": "Diebstahl", "count": 0, "results": []}
+    ])
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr("cli.commands.search_cmd.AsyncLegalMCPClient", MagicMock(return_value=mock_client))
 
+    # Run command with --json flag
+    result = runner.invoke(_test_cmd, ["--batch-file", str(batch_file), "--json"])
 
-@patch("cli.commands.search_cmd.LegalMCPClient")
-def test_search_handles_exception(mock_client_class):
-    """Test search command handles exceptions gracefully"""
-    # Setup mock client that raises exception with context manager support
-    mock_client = MagicMock()
-    mock_client.health_check.return_value = True
-    mock_client.search_texts.side_effect = Exception("Network error")
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    mock_client_class.return_value = mock_client
-
-    # Run command
-    result = runner.invoke(_test_app, ["bgb", "Kaufvertrag"])
-
-    # Verify failure
-    assert result.exit_code == 1
-    assert "Error:" in result.stdout
+    assert result.exit_code == 0
+    assert "Diebstahl" in result.stdout
+    mock_client.search_batch.assert_awaited_once_with(
+        [{"code": "bgb", "query": "Kaufvertrag"}, {"code": "stgb", "query": "Diebstahl"}],
+        10,
+        0.7
+    )